@@ -1,18 +1,29 @@
 """Claude Code agent module for executing prompts programmatically."""
 
+import asyncio
+import fcntl
 import subprocess
 import sys
 import os
 import json
+import random
 import re
 import logging
+import shutil
+import signal
+import textwrap
+import threading
 import time
 import uuid
-from typing import Optional, List, Dict, Any, Tuple, Final, Literal
+from collections import deque
+from typing import Optional, List, Dict, Any, Tuple, Final, Literal, Sequence
 from enum import Enum
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
+from utils import atomic_write_text
+from circuit_breaker import CircuitBreaker
+
 
 # Retry codes for Claude Code execution errors
 class RetryCode(str, Enum):
@@ -21,11 +32,10 @@ class RetryCode(str, Enum):
     TIMEOUT_ERROR = "timeout_error"  # Command timed out
     EXECUTION_ERROR = "execution_error"  # Error during execution
     ERROR_DURING_EXECUTION = "error_during_execution"  # Agent encountered an error
+    RATE_LIMIT_ERROR = "rate_limit_error"  # API rate limit or overload
     NONE = "none"  # No retry needed
 
 
-
-
 class AgentPromptRequest(BaseModel):
     """Claude Code agent prompt configuration."""
     prompt: str
@@ -35,6 +45,19 @@ class AgentPromptRequest(BaseModel):
     dangerously_skip_permissions: bool = False
     output_file: str
     working_dir: Optional[str] = None
+    timeout_seconds: Optional[float] = None  # Per-invocation limit
+    deadline: Optional[float] = None  # Absolute time.time() the run must finish by
+    resume_session_id: Optional[str] = None  # Continue this Claude Code session
+
+
+class AgentAttempt(BaseModel):
+    """Outcome and wall time of one attempt made by the retry loop."""
+    attempt: int
+    resumed_session_id: Optional[str] = None  # Session the attempt continued
+    session_id: Optional[str] = None
+    success: bool
+    retry_code: RetryCode
+    duration_seconds: float
 
 
 class AgentPromptResponse(BaseModel):
@@ -43,6 +66,7 @@ class AgentPromptResponse(BaseModel):
     success: bool
     session_id: Optional[str] = None
     retry_code: RetryCode = RetryCode.NONE
+    attempts: List[AgentAttempt] = []  # Filled in by the retry loops
 
 
 class AgentTemplateRequest(BaseModel):
@@ -53,6 +77,9 @@ class AgentTemplateRequest(BaseModel):
     adw_id: str
     model: Literal["sonnet", "opus"] = "sonnet"
     working_dir: Optional[str] = None
+    timeout_seconds: Optional[float] = None  # Overrides the per-command default
+    deadline: Optional[float] = None  # Overall workflow deadline (time.time())
+    resume_session_id: Optional[str] = None  # Continue a prior phase's session
 
 
 class ClaudeCodeResultMessage(BaseModel):
@@ -118,6 +145,84 @@ OUTPUT_JSONL = "cc_raw_output.jsonl"
 OUTPUT_JSON = "cc_raw_output.json"
 FINAL_OBJECT_JSON = "cc_final_object.json"
 SUMMARY_JSON = "custom_summary_output.json"
+ATTEMPTS_JSON = "cc_attempts.json"
+
+# Rate-limit and overload errors as the CLI reports them on stderr. Only
+# matched against stderr, never against the agent's own output
+RATE_LIMIT_PATTERN = re.compile(
+    r"rate[ _-]?limit(?:ed|_error)?\b|overloaded_error|too many requests|usage limit"
+    r"|\b(?:status|code|API Error)[: ]+(?:429|529)\b",
+    re.IGNORECASE,
+)
+
+# Structured rate-limit signals in stream-json output: the HTTP status of an
+# API error result and the error type of a failed message
+RATE_LIMIT_STATUS_CODES = {429, 529}
+RATE_LIMIT_ERROR_TYPES = {"rate_limit", "rate_limit_error", "overloaded_error"}
+
+# Jittered exponential backoff for rate-limited retries, in seconds
+RATE_LIMIT_BASE_DELAY = 2
+RATE_LIMIT_MAX_DELAY = 60
+
+# Shared by all workflow processes on this host
+CIRCUIT_BREAKER = CircuitBreaker()
+
+# Host-wide caps on concurrent Claude Code processes. Override with
+# ADW_MAX_AGENTS, ADW_MAX_OPUS_AGENTS and ADW_MAX_SONNET_AGENTS.
+DEFAULT_MAX_AGENTS = 8
+DEFAULT_MODEL_AGENT_LIMITS: Dict[str, int] = {"opus": 4, "sonnet": 8}
+AGENT_SLOTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "agents",
+    "agent_slots",
+)
+SLOT_POLL_INTERVAL = 0.5
+
+# How the CLI reports a --resume session id it does not know
+RESUME_REJECTED_PATTERN = re.compile(
+    r"no conversation found|(?:invalid|unknown) session|session\b.{0,60}\bnot found",
+    re.IGNORECASE,
+)
+
+# A retry is not started with less than this left before the deadline
+MIN_RETRY_SECONDS = 60
+
+# Prompt sent when a retry continues the session of a failed attempt
+RESUME_PROMPT = (
+    "The previous attempt was interrupted by an error. Continue the original "
+    "request from where you left off and finish it."
+)
+
+# Maximum size of a single stream-json line read by the async API (tool
+# results can be far larger than asyncio's 64 KiB default)
+ASYNC_STREAM_LIMIT = 64 * 1024 * 1024
+
+# Default number of agents execute_templates_async runs at once
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Default per-invocation timeouts in seconds, by slash command. Override one
+# with ADW_TIMEOUT_<COMMAND> (e.g. ADW_TIMEOUT_IMPLEMENT=5400).
+DEFAULT_TIMEOUT_SECONDS = 1800
+SLASH_COMMAND_TIMEOUTS: Dict[str, float] = {
+    "/plan": 900,
+    "/chore": 900,
+    "/build": 2700,
+    "/implement": 3600,
+    "/e2e_test": 1800,
+}
+
+# Seconds between SIGTERM and SIGKILL when stopping a timed-out process group
+KILL_GRACE_SECONDS = 5
+
+# Seconds to wait for `claude --version` / `--help` before giving up on the probe
+PROBE_TIMEOUT_SECONDS = 10
+
+# CLI probe results shared by all workflow processes, keyed on binary path + mtime
+CAPABILITIES_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "agents",
+    "claude_capabilities.json",
+)
 
 
 def generate_short_id() -> str:
@@ -125,8 +230,6 @@ def generate_short_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
-
-
 def truncate_output(
     output: str, max_length: int = 500, suffix: str = "... (truncated)"
 ) -> str:
@@ -188,102 +291,371 @@ def truncate_output(
     return output[:truncate_at] + suffix
 
 
-def check_claude_installed() -> Optional[str]:
-    """Check if Claude Code CLI is installed. Return error message if not."""
+class ClaudeCapabilities(BaseModel):
+    """Result of probing the Claude Code CLI binary."""
+    binary_path: str
+    mtime_ns: int
+    version: Optional[str] = None
+    flags: List[str] = []
+
+    def supports_flag(self, flag: str) -> bool:
+        """Check if the CLI's --help lists a flag, e.g. "--resume"."""
+        return flag in self.flags
+
+
+# Process-wide probe cache, keyed on (resolved binary path, mtime_ns)
+CAPABILITY_CACHE: Dict[Tuple[str, int], ClaudeCapabilities] = {}
+
+
+def resolve_claude_binary() -> Optional[Tuple[str, int]]:
+    """Resolve CLAUDE_PATH to (real path, mtime_ns), or None if it is missing."""
+    found = shutil.which(CLAUDE_PATH)
+    if not found:
+        return None
+    binary_path = os.path.realpath(found)
     try:
-        result = subprocess.run(
-            [CLAUDE_PATH, "--version"], capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            return (
-                f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
-            )
-    except FileNotFoundError:
-        return f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
-    return None
+        return binary_path, os.stat(binary_path).st_mtime_ns
+    except OSError:
+        return None
 
 
-def parse_jsonl_output(
-    output_file: str,
-) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
-    """Parse JSONL output file and return all messages and the result message.
+def load_cached_capabilities(binary_path: str, mtime_ns: int) -> Optional[ClaudeCapabilities]:
+    """Read a probe result persisted by this or a sibling process."""
+    try:
+        with open(CAPABILITIES_FILE, "r") as f:
+            entries = json.load(f)
+        capabilities = ClaudeCapabilities(**entries[binary_path])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if capabilities.mtime_ns != mtime_ns:
+        # The binary was upgraded or replaced since it was probed
+        return None
+    return capabilities
 
-    Returns:
-        Tuple of (all_messages, result_message) where result_message is None if not found
+
+def save_cached_capabilities(capabilities: ClaudeCapabilities):
+    """Persist a probe result so sibling workflow processes can reuse it."""
+    try:
+        with open(CAPABILITIES_FILE, "r") as f:
+            entries = json.load(f)
+        if not isinstance(entries, dict):
+            entries = {}
+    except (OSError, ValueError):
+        entries = {}
+
+    entries[capabilities.binary_path] = capabilities.model_dump()
+    try:
+        os.makedirs(os.path.dirname(CAPABILITIES_FILE), exist_ok=True)
+        atomic_write_text(CAPABILITIES_FILE, json.dumps(entries, indent=2))
+    except OSError:
+        # The cache is an optimisation; failing to write it is not an error
+        pass
+
+
+def probe_claude_capabilities(binary_path: str, mtime_ns: int) -> Optional[ClaudeCapabilities]:
+    """Run the CLI to detect its version and supported flags.
+
+    Returns None if the binary does not run successfully or hangs.
     """
     try:
-        with open(output_file, "r") as f:
-            # Read all lines and parse each as JSON
-            messages = [json.loads(line) for line in f if line.strip()]
-
-            # Find the result message (should be the last one)
-            result_message = None
-            for message in reversed(messages):
-                if message.get("type") == "result":
-                    result_message = message
-                    break
-
-            return messages, result_message
-    except Exception as e:
-        return [], None
+        result = subprocess.run(
+            [binary_path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
 
+    version_match = re.search(r"\d+\.\d+\.\d+\S*", result.stdout)
+    version = version_match.group(0) if version_match else result.stdout.strip() or None
 
-def convert_jsonl_to_json(jsonl_file: str) -> str:
-    """Convert JSONL file to JSON array file.
+    flags: List[str] = []
+    try:
+        help_result = subprocess.run(
+            [binary_path, "--help"],
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT_SECONDS,
+        )
+        if help_result.returncode == 0:
+            flags = sorted(set(re.findall(r"(?<![\w-])--[a-z][a-z0-9-]*", help_result.stdout)))
+    except (OSError, subprocess.TimeoutExpired):
+        pass
 
-    Creates a cc_raw_output.json file in the same directory as the JSONL file,
-    containing all messages as a JSON array.
+    return ClaudeCapabilities(
+        binary_path=binary_path, mtime_ns=mtime_ns, version=version, flags=flags
+    )
+
+
+def get_claude_capabilities() -> Optional[ClaudeCapabilities]:
+    """Get the capabilities of the configured Claude Code CLI.
+
+    The CLI is only spawned when neither this process nor the shared cache
+    file under agents/ has a result for the current binary path and mtime.
 
     Returns:
-        Path to the created JSON file
+        The capabilities, or None if the CLI is not installed
     """
-    # Create JSON filename in the same directory
-    output_dir = os.path.dirname(jsonl_file)
-    json_file = os.path.join(output_dir, OUTPUT_JSON)
+    resolved = resolve_claude_binary()
+    if resolved is None:
+        return None
 
-    # Parse the JSONL file
-    messages, _ = parse_jsonl_output(jsonl_file)
+    capabilities = CAPABILITY_CACHE.get(resolved)
+    if capabilities is not None:
+        return capabilities
 
-    # Write as JSON array
-    with open(json_file, "w") as f:
-        json.dump(messages, f, indent=2)
+    capabilities = load_cached_capabilities(*resolved)
+    if capabilities is None:
+        capabilities = probe_claude_capabilities(*resolved)
+        if capabilities is None:
+            return None
+        save_cached_capabilities(capabilities)
 
-    return json_file
+    CAPABILITY_CACHE[resolved] = capabilities
+    return capabilities
 
 
-def save_last_entry_as_raw_result(json_file: str) -> Optional[str]:
-    """Save the last entry from a JSON array file as cc_final_object.json.
-    
+def get_agent_limit(pool: str) -> int:
+    """Maximum concurrent Claude Code processes for a slot pool.
+
     Args:
-        json_file: Path to the JSON array file
-        
-    Returns:
-        Path to the created cc_final_object.json file, or None if error
+        pool: "global" or a model name ("opus", "sonnet")
     """
+    if pool == "global":
+        env_name, default = "ADW_MAX_AGENTS", DEFAULT_MAX_AGENTS
+    else:
+        env_name = f"ADW_MAX_{pool.upper()}_AGENTS"
+        default = DEFAULT_MODEL_AGENT_LIMITS.get(pool, DEFAULT_MAX_AGENTS)
     try:
-        # Read the JSON array
-        with open(json_file, "r") as f:
-            messages = json.load(f)
-        
-        if not messages:
-            return None
-            
-        # Get the last entry
-        last_entry = messages[-1]
-        
-        # Create cc_final_object.json in the same directory
-        output_dir = os.path.dirname(json_file)
-        final_object_file = os.path.join(output_dir, FINAL_OBJECT_JSON)
-        
-        # Write the last entry
-        with open(final_object_file, "w") as f:
-            json.dump(last_entry, f, indent=2)
-            
-        return final_object_file
-    except Exception:
-        # Silently fail - this is a nice-to-have feature
+        return max(1, int(os.getenv(env_name, default)))
+    except ValueError:
+        return default
+
+
+class AgentSlot:
+    """Slot locks held while one Claude Code process runs."""
+
+    def __init__(self, fds: List[int]):
+        self.fds = fds
+
+    def release(self):
+        """Give the slots back to waiting launches."""
+        for fd in self.fds:
+            os.close(fd)  # Closing the descriptor drops its flock
+        self.fds = []
+
+
+class AgentSlotLimiter:
+    """Counting semaphore over flock-ed slot files, shared by every process on the host.
+
+    A launch must hold one slot of its model's pool and one of the global
+    pool. Slot files are "<pool>-<n>.lock" in slots_dir and record the
+    holder's PID. The kernel drops a holder's locks when its process dies,
+    so slots held by crashed workflows are reclaimed without any cleanup.
+    """
+
+    def __init__(self, slots_dir: str = AGENT_SLOTS_DIR):
+        self.slots_dir = slots_dir
+
+    def try_lock_slot(self, pool: str) -> Optional[int]:
+        """Lock a free slot in a pool without blocking; return its descriptor."""
+        os.makedirs(self.slots_dir, exist_ok=True)
+        for index in range(get_agent_limit(pool)):
+            path = os.path.join(self.slots_dir, f"{pool}-{index}.lock")
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, f"{os.getpid()}\n".encode(), 0)
+            return fd
         return None
 
+    def try_acquire(self, model: str) -> Optional[AgentSlot]:
+        """Take a model slot and a global slot, or neither."""
+        model_fd = self.try_lock_slot(model)
+        if model_fd is None:
+            return None
+        global_fd = self.try_lock_slot("global")
+        if global_fd is None:
+            os.close(model_fd)
+            return None
+        return AgentSlot([model_fd, global_fd])
+
+    def acquire(self, model: str, deadline: Optional[float] = None) -> Optional[AgentSlot]:
+        """Wait until a slot is free.
+
+        Returns:
+            The slot, or None if the deadline passed while queued
+        """
+        while True:
+            slot = self.try_acquire(model)
+            if slot is not None:
+                return slot
+            if deadline is not None and time.time() + SLOT_POLL_INTERVAL >= deadline:
+                return None
+            time.sleep(SLOT_POLL_INTERVAL)
+
+    async def acquire_async(
+        self, model: str, deadline: Optional[float] = None
+    ) -> Optional[AgentSlot]:
+        """Async variant of acquire."""
+        while True:
+            slot = self.try_acquire(model)
+            if slot is not None:
+                return slot
+            if deadline is not None and time.time() + SLOT_POLL_INTERVAL >= deadline:
+                return None
+            await asyncio.sleep(SLOT_POLL_INTERVAL)
+
+    def count_held(self, pool: str) -> int:
+        """Number of slots currently held in a pool, e.g. for status displays."""
+        held = 0
+        for index in range(get_agent_limit(pool)):
+            path = os.path.join(self.slots_dir, f"{pool}-{index}.lock")
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                held += 1
+            finally:
+                os.close(fd)
+        return held
+
+
+AGENT_SLOTS = AgentSlotLimiter()
+
+
+def claude_supports_flag(flag: str) -> bool:
+    """Check if the installed CLI supports a flag.
+
+    Assumes support when the CLI could not be probed or listed no flags, so
+    feature gating never disables a flag just because --help was unavailable.
+    """
+    capabilities = get_claude_capabilities()
+    if capabilities is None or not capabilities.flags:
+        return True
+    return capabilities.supports_flag(flag)
+
+
+def check_claude_installed() -> Optional[str]:
+    """Check if Claude Code CLI is installed. Return error message if not."""
+    if get_claude_capabilities() is None:
+        return f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
+    return None
+
+
+def extract_assistant_text(message: Dict[str, Any]) -> str:
+    """Return the first text block of an assistant message, or "" if none."""
+    if message.get("type") != "assistant" or not message.get("message"):
+        return ""
+    content = message["message"].get("content", [])
+    if isinstance(content, list) and content and isinstance(content[0], dict):
+        return content[0].get("text", "") or ""
+    return ""
+
+
+class JsonlStreamParser:
+    """Single-pass parser for Claude Code stream-json output.
+
+    Each line from the CLI is written to cc_raw_output.jsonl, parsed once,
+    and appended to cc_raw_output.json as it arrives. Only the result
+    message, the last message and the last few messages are kept in memory,
+    so large transcripts are never re-read from disk or held in full.
+    """
+
+    # Number of trailing messages kept for error extraction
+    RECENT_MESSAGES = 5
+
+    def __init__(self, output_file: str):
+        output_dir = os.path.dirname(output_file)
+        self.output_file = output_file
+        self.json_file = os.path.join(output_dir, OUTPUT_JSON)
+        self.final_object_file = os.path.join(output_dir, FINAL_OBJECT_JSON)
+        self.message_count = 0
+        self.result_message: Optional[Dict[str, Any]] = None
+        self.last_message: Optional[Dict[str, Any]] = None
+        self.last_line = ""
+        self.session_id: Optional[str] = None
+        self.recent_messages = deque(maxlen=self.RECENT_MESSAGES)
+        self.jsonl_f = None
+        self.json_f = None
+
+    def __enter__(self) -> "JsonlStreamParser":
+        self.jsonl_f = open(self.output_file, "w", encoding="utf-8")
+        self.json_f = open(self.json_file, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def feed(self, line: str):
+        """Record one line of CLI output."""
+        self.jsonl_f.write(line)
+
+        stripped = line.strip()
+        if not stripped:
+            return
+        self.last_line = stripped
+
+        try:
+            message = json.loads(stripped)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(message, dict):
+            return
+
+        # Same layout json.dump(messages, f, indent=2) would produce
+        self.json_f.write("[\n" if self.message_count == 0 else ",\n")
+        self.json_f.write(textwrap.indent(json.dumps(message, indent=2), "  "))
+
+        self.message_count += 1
+        self.last_message = message
+        self.recent_messages.append(message)
+        if message.get("session_id"):
+            # Known from the init message on, so partial runs can be resumed
+            self.session_id = message["session_id"]
+        if message.get("type") == "result":
+            self.result_message = message
+
+    def close(self):
+        """Finish the JSON array and write cc_final_object.json."""
+        if self.jsonl_f is None:
+            return
+        self.jsonl_f.close()
+        self.json_f.write("[]" if self.message_count == 0 else "\n]")
+        self.json_f.close()
+        self.jsonl_f = None
+        self.json_f = None
+
+        if self.last_message is not None:
+            with open(self.final_object_file, "w", encoding="utf-8") as f:
+                json.dump(self.last_message, f, indent=2)
+
+    def last_assistant_text(self) -> str:
+        """Text of the most recent assistant message among the last few messages."""
+        for message in reversed(self.recent_messages):
+            text = extract_assistant_text(message)
+            if text:
+                return text
+        return ""
+
+    def last_assistant_error_text(self) -> str:
+        """Most recent assistant text that mentions an error or failure."""
+        for message in reversed(self.recent_messages):
+            text = extract_assistant_text(message)
+            if text and ("error" in text.lower() or "failed" in text.lower()):
+                return text
+        return ""
+
 
 def get_claude_env() -> Dict[str, str]:
     """Get only the required environment variables for Claude Code execution.
@@ -323,6 +695,205 @@ def save_prompt(prompt: str, adw_id: str, agent_name: str = "ops") -> None:
         f.write(prompt)
 
 
+def get_retry_delays(max_retries: int, retry_delays: Optional[List[int]]) -> List[int]:
+    """Return a delay for every retry attempt (default: [1, 3, 5, ...])."""
+    delays = list(retry_delays) if retry_delays else [1, 3, 5]
+
+    # Ensure we have enough delays for max_retries
+    while len(delays) < max_retries:
+        delays.append(delays[-1] + 2)  # Add incrementing delays
+    return delays
+
+
+def is_rate_limit_error(stderr_output: Optional[str]) -> bool:
+    """Check if the CLI's stderr reports an API rate limit or overload."""
+    return bool(stderr_output) and RATE_LIMIT_PATTERN.search(stderr_output) is not None
+
+
+def get_error_type(message: Dict[str, Any]) -> Optional[str]:
+    """Structured error type of a stream-json message, e.g. "rate_limit"."""
+    error = message.get("error")
+    if isinstance(error, dict):
+        error = error.get("type")
+    return error if isinstance(error, str) else None
+
+
+def is_rate_limited_run(stream: "JsonlStreamParser", stderr_output: str) -> bool:
+    """Check if a failed run was stopped by an API rate limit or overload.
+
+    Only structured signals count: the api_error_status of the result
+    message, the error type of the result or a recent message, and the
+    CLI's stderr. The result text and assistant prose are never matched,
+    since an agent that merely talks about rate limits would otherwise open
+    the host-wide circuit and hold every launch on the machine.
+    """
+    result_message = stream.result_message or {}
+    try:
+        status = int(result_message.get("api_error_status") or 0)
+    except (TypeError, ValueError):
+        status = 0
+    if status in RATE_LIMIT_STATUS_CODES:
+        return True
+    if any(
+        get_error_type(message) in RATE_LIMIT_ERROR_TYPES
+        for message in [result_message, *stream.recent_messages]
+    ):
+        return True
+    return is_rate_limit_error(stderr_output)
+
+
+def get_retry_delay(
+    attempt: int, response: AgentPromptResponse, retry_delays: List[int]
+) -> float:
+    """Delay before retry number attempt (1-based).
+
+    Rate-limited runs use full-jitter exponential backoff on top of the
+    circuit breaker's shared cooldown, so parallel workflows spread out
+    instead of retrying in lockstep. Other errors use retry_delays with
+    +/-25% jitter.
+    """
+    if response.retry_code == RetryCode.RATE_LIMIT_ERROR:
+        ceiling = min(RATE_LIMIT_MAX_DELAY, RATE_LIMIT_BASE_DELAY * 2**attempt)
+        return random.uniform(RATE_LIMIT_BASE_DELAY, ceiling)
+    return retry_delays[attempt - 1] * random.uniform(0.75, 1.25)
+
+
+def get_circuit_wait(request: AgentPromptRequest) -> Optional[float]:
+    """Seconds to hold a launch while the rate-limit circuit is open.
+
+    Returns None if the request's deadline passes before the circuit closes.
+    """
+    wait = CIRCUIT_BREAKER.remaining_seconds()
+    if wait > 0 and deadline_reached(request, wait):
+        return None
+    return wait
+
+
+def update_circuit_breaker(response: AgentPromptResponse):
+    """Open the shared circuit on a rate limit, close it after a success."""
+    if response.retry_code == RetryCode.RATE_LIMIT_ERROR:
+        CIRCUIT_BREAKER.record_rate_limit(response.output[:200])
+    elif response.success:
+        CIRCUIT_BREAKER.record_success()
+
+
+def is_retryable(response: AgentPromptResponse) -> bool:
+    """Check if a failed response should be retried based on its retry code."""
+    if response.success or response.retry_code == RetryCode.NONE:
+        # Success or non-retryable error
+        return False
+    return response.retry_code in [
+        RetryCode.CLAUDE_CODE_ERROR,
+        RetryCode.TIMEOUT_ERROR,
+        RetryCode.EXECUTION_ERROR,
+        RetryCode.ERROR_DURING_EXECUTION,
+        RetryCode.RATE_LIMIT_ERROR,
+    ]
+
+
+def deadline_reached(request: AgentPromptRequest, delay: float = 0) -> bool:
+    """Check if the request's deadline passes before a retry after delay seconds."""
+    return request.deadline is not None and time.time() + delay >= request.deadline
+
+
+def resume_was_rejected(request: AgentPromptRequest, response: AgentPromptResponse) -> bool:
+    """Check if the CLI refused to resume the request's session.
+
+    Happens when the session no longer exists (e.g. it was pruned or created
+    on another host); the caller should then start a fresh session. Only a
+    run that never started a session and whose error names an unknown or
+    invalid session counts; every other failure goes through the normal
+    retry backoff.
+    """
+    return (
+        request.resume_session_id is not None
+        and not response.success
+        and response.session_id is None
+        and RESUME_REJECTED_PATTERN.search(response.output) is not None
+    )
+
+
+def clamp_to_deadline(request: AgentPromptRequest) -> AgentPromptRequest:
+    """Limit a retry's timeout to the time left before the request's deadline.
+
+    Without it every retry would get a full per-command timeout of its own.
+    """
+    if request.deadline is None:
+        return request
+    return request.model_copy(
+        update={
+            "timeout_seconds": get_effective_timeout(
+                request.timeout_seconds, request.deadline
+            )
+        }
+    )
+
+
+def build_retry_request(
+    original: AgentPromptRequest, response: AgentPromptResponse
+) -> AgentPromptRequest:
+    """Request for the attempt after a retryable failure.
+
+    Continues the failed attempt's session when it got far enough to start
+    one, so completed turns are not redone; otherwise starts over. Either
+    way the attempt only gets the time left before the deadline.
+    """
+    if response.session_id:
+        original = original.model_copy(
+            update={"prompt": RESUME_PROMPT, "resume_session_id": response.session_id}
+        )
+    return clamp_to_deadline(original)
+
+
+def drop_rejected_resume(
+    original: AgentPromptRequest, rejected: AgentPromptRequest
+) -> AgentPromptRequest:
+    """Original request to rerun after the CLI refused to resume a session.
+
+    Only the rejected session is dropped: when a retry's resume of the failed
+    attempt's session is refused, the caller's own resume_session_id is still
+    worth continuing.
+    """
+    if original.resume_session_id == rejected.resume_session_id:
+        original = original.model_copy(update={"resume_session_id": None})
+    return original
+
+
+def record_attempt(
+    attempts: List[AgentAttempt],
+    request: AgentPromptRequest,
+    response: AgentPromptResponse,
+    started: float,
+):
+    """Append the outcome of an attempt started at time.monotonic() started."""
+    attempts.append(
+        AgentAttempt(
+            attempt=len(attempts) + 1,
+            resumed_session_id=request.resume_session_id,
+            session_id=response.session_id,
+            success=response.success,
+            retry_code=response.retry_code,
+            duration_seconds=round(time.monotonic() - started, 3),
+        )
+    )
+
+
+def finish_attempts(
+    request: AgentPromptRequest,
+    response: AgentPromptResponse,
+    attempts: List[AgentAttempt],
+) -> AgentPromptResponse:
+    """Attach the attempt log to the final response and save it as cc_attempts.json."""
+    response.attempts = attempts
+    attempts_file = os.path.join(os.path.dirname(request.output_file), ATTEMPTS_JSON)
+    try:
+        with open(attempts_file, "w") as f:
+            json.dump([a.model_dump(mode="json") for a in attempts], f, indent=2)
+    except OSError:
+        pass
+    return response
+
+
 def prompt_claude_code_with_retry(
     request: AgentPromptRequest,
     max_retries: int = 3,
@@ -330,80 +901,152 @@ def prompt_claude_code_with_retry(
 ) -> AgentPromptResponse:
     """Execute Claude Code with retry logic for certain error types.
 
+    A retry continues the failed attempt's session when it has one instead of
+    starting over. Each retry only gets the time left before the request's
+    deadline, and none is started within MIN_RETRY_SECONDS of it. If a
+    resumed session is rejected, the prompt is rerun at once in a new
+    session. Per-attempt durations are returned in response.attempts.
+
     Args:
         request: The prompt request configuration
         max_retries: Maximum number of retry attempts (default: 3)
-        retry_delays: List of delays in seconds between retries (default: [1, 3, 5])
+        retry_delays: List of delays in seconds between retries (default: [1, 3, 5]);
+            rate-limited retries use jittered exponential backoff instead
 
     Returns:
         AgentPromptResponse with output and retry code
     """
-    if retry_delays is None:
-        retry_delays = [1, 3, 5]
-
-    # Ensure we have enough delays for max_retries
-    while len(retry_delays) < max_retries:
-        retry_delays.append(retry_delays[-1] + 2)  # Add incrementing delays
-
-    last_response = None
+    retry_delays = get_retry_delays(max_retries, retry_delays)
+    original = request
+    attempts: List[AgentAttempt] = []
+    response = None
 
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if attempt > 0:
             # This is a retry
-            delay = retry_delays[attempt - 1]
+            delay = get_retry_delay(attempt, response, retry_delays)
+            if deadline_reached(request, delay + MIN_RETRY_SECONDS):
+                break
             time.sleep(delay)
+            request = build_retry_request(original, response)
 
+        started = time.monotonic()
         response = prompt_claude_code(request)
-        last_response = response
-
-        # Check if we should retry based on the retry code
-        if response.success or response.retry_code == RetryCode.NONE:
-            # Success or non-retryable error
-            return response
-
-        # Check if this is a retryable error
-        if response.retry_code in [
-            RetryCode.CLAUDE_CODE_ERROR,
-            RetryCode.TIMEOUT_ERROR,
-            RetryCode.EXECUTION_ERROR,
-            RetryCode.ERROR_DURING_EXECUTION,
-        ]:
-            if attempt < max_retries:
-                continue
-            else:
-                return response
+        record_attempt(attempts, request, response, started)
 
-    # Should not reach here, but return last response just in case
-    return last_response
+        while resume_was_rejected(request, response):
+            original = drop_rejected_resume(original, request)
+            request = clamp_to_deadline(original)
+            started = time.monotonic()
+            response = prompt_claude_code(request)
+            record_attempt(attempts, request, response, started)
+        if not is_retryable(response):
+            break
 
+    return finish_attempts(request, response, attempts)
 
-def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
-    """Execute Claude Code with the given prompt configuration."""
 
-    # Check if Claude Code CLI is installed
-    error_msg = check_claude_installed()
-    if error_msg:
-        return AgentPromptResponse(
-            output=error_msg,
-            success=False,
-            session_id=None,
-            retry_code=RetryCode.NONE,  # Installation error is not retryable
-        )
+def get_command_timeout(slash_command: str) -> float:
+    """Default timeout in seconds for a slash command.
 
-    # Save prompt before execution
-    save_prompt(request.prompt, request.adw_id, request.agent_name)
+    ADW_TIMEOUT_<COMMAND> in the environment takes precedence over
+    SLASH_COMMAND_TIMEOUTS, which takes precedence over DEFAULT_TIMEOUT_SECONDS.
+    """
+    env_name = "ADW_TIMEOUT_" + slash_command.lstrip("/").upper()
+    env_value = os.getenv(env_name)
+    if env_value:
+        try:
+            return float(env_value)
+        except ValueError:
+            pass
+    return SLASH_COMMAND_TIMEOUTS.get(slash_command, DEFAULT_TIMEOUT_SECONDS)
 
-    # Create output directory if needed
-    output_dir = os.path.dirname(request.output_file)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
 
+def get_effective_timeout(
+    timeout_seconds: Optional[float], deadline: Optional[float]
+) -> Optional[float]:
+    """Combine a per-invocation timeout with an absolute deadline.
+
+    Returns:
+        Seconds the invocation may run (<= 0 if the deadline has passed),
+        or None for no limit
+    """
+    limits = []
+    if timeout_seconds is not None:
+        limits.append(timeout_seconds)
+    if deadline is not None:
+        limits.append(deadline - time.time())
+    return min(limits) if limits else None
+
+
+def terminate_process_group(pid: int, process_poll, grace_seconds: float = KILL_GRACE_SECONDS):
+    """Stop a process and everything it spawned.
+
+    Sends SIGTERM to the process group, then SIGKILL if it is still alive
+    after grace_seconds.
+
+    Args:
+        pid: Process ID of the group leader
+        process_poll: Callable returning the exit code, or None while running
+        grace_seconds: Seconds to wait between SIGTERM and SIGKILL
+    """
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        return
+
+    deadline = time.monotonic() + grace_seconds
+    while time.monotonic() < deadline:
+        if process_poll() is not None:
+            break
+        time.sleep(0.1)
+
+    try:
+        # Tool subprocesses may outlive the CLI itself, so always sweep the group
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def build_timeout_response(timeout: float, stream: "JsonlStreamParser") -> AgentPromptResponse:
+    """Response for a run that was killed at its timeout, salvaging partial output."""
+    error_msg = f"Error: Claude Code command timed out after {timeout:.0f} seconds"
+    partial_text = stream.last_assistant_text()
+    if partial_text:
+        error_msg += f"\nLast output: {partial_text[:500]}"
+    elif stream.message_count:
+        error_msg += f"\nPartial transcript: {stream.message_count} messages"
+
+    return AgentPromptResponse(
+        output=truncate_output(error_msg, max_length=800),
+        success=False,
+        session_id=stream.session_id,
+        retry_code=RetryCode.TIMEOUT_ERROR,
+    )
+
+
+def build_deadline_response() -> AgentPromptResponse:
+    """Response for a run that was not started because its deadline passed."""
+    return AgentPromptResponse(
+        output="Error: Workflow deadline exceeded before Claude Code could start",
+        success=False,
+        session_id=None,
+        retry_code=RetryCode.TIMEOUT_ERROR,
+    )
+
+
+def build_claude_command(request: AgentPromptRequest) -> List[str]:
+    """Build the Claude Code CLI command line for a prompt request."""
     # Build command - always use stream-json format and verbose
     cmd = [CLAUDE_PATH, "-p", request.prompt]
     cmd.extend(["--model", request.model])
     cmd.extend(["--output-format", "stream-json"])
     cmd.append("--verbose")
 
+    # Continue a previous session so the agent keeps the context it built
+    if request.resume_session_id and claude_supports_flag("--resume"):
+        cmd.extend(["--resume", request.resume_session_id])
+
     # Check for MCP config in working directory
     if request.working_dir:
         mcp_config_path = os.path.join(request.working_dir, ".mcp.json")
@@ -414,169 +1057,218 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
     if request.dangerously_skip_permissions:
         cmd.append("--dangerously-skip-permissions")
 
-    # Set up environment with only required variables
-    env = get_claude_env()
+    return cmd
 
-    try:
-        # Open output file for streaming
-        with open(request.output_file, "w") as output_f:
-            # Execute Claude Code and stream output to file
-            result = subprocess.run(
-                cmd,
-                stdout=output_f,  # Stream directly to file
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env,
-                cwd=request.working_dir,  # Use working_dir if provided
-            )
 
-        if result.returncode == 0:
-
-            # Parse the JSONL file
-            messages, result_message = parse_jsonl_output(request.output_file)
-
-            # Convert JSONL to JSON array file
-            json_file = convert_jsonl_to_json(request.output_file)
-            
-            # Save the last entry as raw_result.json
-            save_last_entry_as_raw_result(json_file)
-
-            if result_message:
-                # Extract session_id from result message
-                session_id = result_message.get("session_id")
-
-                # Check if there was an error in the result
-                is_error = result_message.get("is_error", False)
-                subtype = result_message.get("subtype", "")
-
-                # Handle error_during_execution case where there's no result field
-                if subtype == "error_during_execution":
-                    error_msg = "Error during execution: Agent encountered an error and did not return a result"
-                    return AgentPromptResponse(
-                        output=error_msg,
-                        success=False,
-                        session_id=session_id,
-                        retry_code=RetryCode.ERROR_DURING_EXECUTION,
-                    )
+def prepare_prompt_execution(request: AgentPromptRequest) -> Optional[AgentPromptResponse]:
+    """Run the pre-execution checks and setup shared by the sync and async APIs.
 
-                result_text = result_message.get("result", "")
+    Returns:
+        An error response if execution cannot proceed, otherwise None
+    """
+    # Check if Claude Code CLI is installed
+    error_msg = check_claude_installed()
+    if error_msg:
+        return AgentPromptResponse(
+            output=error_msg,
+            success=False,
+            session_id=None,
+            retry_code=RetryCode.NONE,  # Installation error is not retryable
+        )
+
+    # Save prompt before execution
+    save_prompt(request.prompt, request.adw_id, request.agent_name)
 
-                # For error cases, truncate the output to prevent JSONL blobs
-                if is_error and len(result_text) > 1000:
-                    result_text = truncate_output(result_text, max_length=800)
+    # Create output directory if needed
+    output_dir = os.path.dirname(request.output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    return None
 
-                return AgentPromptResponse(
-                    output=result_text,
-                    success=not is_error,
-                    session_id=session_id,
-                    retry_code=RetryCode.NONE,  # No retry needed for successful or non-retryable errors
-                )
-            else:
-                # No result message found, try to extract meaningful error
-                error_msg = "No result message found in Claude Code output"
-
-                # Try to get the last few lines of output for context
-                try:
-                    with open(request.output_file, "r") as f:
-                        lines = f.readlines()
-                        if lines:
-                            # Get last 5 lines or less
-                            last_lines = lines[-5:] if len(lines) > 5 else lines
-                            # Try to parse each as JSON to find any error messages
-                            for line in reversed(last_lines):
-                                try:
-                                    data = json.loads(line.strip())
-                                    if data.get("type") == "assistant" and data.get(
-                                        "message"
-                                    ):
-                                        # Extract text from assistant message
-                                        content = data["message"].get("content", [])
-                                        if isinstance(content, list) and content:
-                                            text = content[0].get("text", "")
-                                            if text:
-                                                error_msg = f"Claude Code output: {text[:500]}"  # Truncate
-                                                break
-                                except:
-                                    pass
-                except:
-                    pass
 
+def build_prompt_response(
+    returncode: int, stream: JsonlStreamParser, stderr_output: str
+) -> AgentPromptResponse:
+    """Turn a finished Claude Code run into an AgentPromptResponse."""
+    result_message = stream.result_message
+
+    if returncode == 0:
+        if result_message:
+            # Extract session_id from result message
+            session_id = result_message.get("session_id")
+
+            # Check if there was an error in the result
+            is_error = result_message.get("is_error", False)
+            subtype = result_message.get("subtype", "")
+
+            # Handle error_during_execution case where there's no result field
+            if subtype == "error_during_execution":
+                error_msg = "Error during execution: Agent encountered an error and did not return a result"
                 return AgentPromptResponse(
-                    output=truncate_output(error_msg, max_length=800),
+                    output=error_msg,
                     success=False,
-                    session_id=None,
-                    retry_code=RetryCode.NONE,
+                    session_id=session_id,
+                    retry_code=RetryCode.ERROR_DURING_EXECUTION,
                 )
-        else:
-            # Error occurred - stderr is captured, stdout went to file
-            stderr_msg = result.stderr.strip() if result.stderr else ""
 
-            # Try to read the output file to check for errors in stdout
-            stdout_msg = ""
-            error_from_jsonl = None
-            try:
-                if os.path.exists(request.output_file):
-                    # Parse JSONL to find error message
-                    messages, result_message = parse_jsonl_output(request.output_file)
-
-                    if result_message and result_message.get("is_error"):
-                        # Found error in result message
-                        error_from_jsonl = result_message.get("result", "Unknown error")
-                    elif messages:
-                        # Look for error in last few messages
-                        for msg in reversed(messages[-5:]):
-                            if msg.get("type") == "assistant" and msg.get(
-                                "message", {}
-                            ).get("content"):
-                                content = msg["message"]["content"]
-                                if isinstance(content, list) and content:
-                                    text = content[0].get("text", "")
-                                    if text and (
-                                        "error" in text.lower()
-                                        or "failed" in text.lower()
-                                    ):
-                                        error_from_jsonl = text[:500]  # Truncate
-                                        break
-
-                    # If no structured error found, get last line only
-                    if not error_from_jsonl:
-                        with open(request.output_file, "r") as f:
-                            lines = f.readlines()
-                            if lines:
-                                # Just get the last line instead of entire file
-                                stdout_msg = lines[-1].strip()[
-                                    :200
-                                ]  # Truncate to 200 chars
-            except:
-                pass
+            result_text = result_message.get("result", "")
+
+            # For error cases, truncate the output to prevent JSONL blobs
+            if is_error and len(result_text) > 1000:
+                result_text = truncate_output(result_text, max_length=800)
+
+            retry_code = RetryCode.NONE  # No retry needed for successful or non-retryable errors
+            if is_error and is_rate_limited_run(stream, stderr_output):
+                retry_code = RetryCode.RATE_LIMIT_ERROR
+
+            return AgentPromptResponse(
+                output=result_text,
+                success=not is_error,
+                session_id=session_id,
+                retry_code=retry_code,
+            )
+        else:
+            # No result message found, use the last assistant text for context
+            error_msg = "No result message found in Claude Code output"
+            text = stream.last_assistant_text()
+            if text:
+                error_msg = f"Claude Code output: {text[:500]}"  # Truncate
 
-            if error_from_jsonl:
-                error_msg = f"Claude Code error: {error_from_jsonl}"
-            elif stdout_msg and not stderr_msg:
-                error_msg = f"Claude Code error: {stdout_msg}"
-            elif stderr_msg and not stdout_msg:
-                error_msg = f"Claude Code error: {stderr_msg}"
-            elif stdout_msg and stderr_msg:
-                error_msg = f"Claude Code error: {stderr_msg}\nStdout: {stdout_msg}"
-            else:
-                error_msg = f"Claude Code error: Command failed with exit code {result.returncode}"
-
-            # Always truncate error messages to prevent huge outputs
             return AgentPromptResponse(
                 output=truncate_output(error_msg, max_length=800),
                 success=False,
                 session_id=None,
-                retry_code=RetryCode.CLAUDE_CODE_ERROR,
+                retry_code=RetryCode.NONE,
             )
+    else:
+        # Error occurred - stderr is captured, stdout was parsed while streaming
+        stderr_msg = stderr_output.strip()
+
+        stdout_msg = ""
+        if result_message and result_message.get("is_error"):
+            # Found error in result message
+            error_from_jsonl = result_message.get("result", "Unknown error")
+        else:
+            # Look for error in last few messages
+            error_from_jsonl = stream.last_assistant_error_text()[:500]  # Truncate
+
+        # If no structured error found, use the last line only
+        if not error_from_jsonl:
+            stdout_msg = stream.last_line[:200]  # Truncate to 200 chars
+
+        if error_from_jsonl:
+            error_msg = f"Claude Code error: {error_from_jsonl}"
+        elif stdout_msg and not stderr_msg:
+            error_msg = f"Claude Code error: {stdout_msg}"
+        elif stderr_msg and not stdout_msg:
+            error_msg = f"Claude Code error: {stderr_msg}"
+        elif stdout_msg and stderr_msg:
+            error_msg = f"Claude Code error: {stderr_msg}\nStdout: {stdout_msg}"
+        else:
+            error_msg = f"Claude Code error: Command failed with exit code {returncode}"
 
-    except subprocess.TimeoutExpired:
-        error_msg = "Error: Claude Code command timed out after 5 minutes"
+        retry_code = RetryCode.CLAUDE_CODE_ERROR
+        if is_rate_limited_run(stream, stderr_msg):
+            retry_code = RetryCode.RATE_LIMIT_ERROR
+
+        # Always truncate error messages to prevent huge outputs. The session
+        # id from the init message lets a retry continue this session.
         return AgentPromptResponse(
-            output=error_msg,
+            output=truncate_output(error_msg, max_length=800),
             success=False,
-            session_id=None,
-            retry_code=RetryCode.TIMEOUT_ERROR,
+            session_id=stream.session_id,
+            retry_code=retry_code,
         )
+
+
+def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
+    """Execute Claude Code with the given prompt configuration."""
+    error_response = prepare_prompt_execution(request)
+    if error_response:
+        return error_response
+
+    # Hold the launch while another workflow's rate limit has the circuit open
+    circuit_wait = get_circuit_wait(request)
+    if circuit_wait is None:
+        return build_deadline_response()
+    if circuit_wait:
+        time.sleep(circuit_wait)
+
+    # Queue for a host-wide agent slot so parallel workflows can't oversubscribe the box
+    slot = AGENT_SLOTS.acquire(request.model, request.deadline)
+    if slot is None:
+        return build_deadline_response()
+    try:
+        return run_claude_code(request)
+    finally:
+        slot.release()
+
+
+def run_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
+    """Run the Claude Code CLI for a request that holds an agent slot."""
+    timeout = get_effective_timeout(request.timeout_seconds, request.deadline)
+    if timeout is not None and timeout <= 0:
+        return build_deadline_response()
+
+    cmd = build_claude_command(request)
+
+    # Set up environment with only required variables
+    env = get_claude_env()
+
+    try:
+        # Stream stdout through a single-pass parser that writes all output files
+        stderr_chunks: List[str] = []
+        timed_out = threading.Event()
+        with JsonlStreamParser(request.output_file) as stream:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                env=env,
+                cwd=request.working_dir,  # Use working_dir if provided
+                start_new_session=True,  # Own process group so a timeout kills its tools too
+            )
+
+            # Drain stderr concurrently so a chatty CLI can't block on a full pipe
+            stderr_reader = threading.Thread(
+                target=lambda: stderr_chunks.append(process.stderr.read()),
+                daemon=True,
+            )
+            stderr_reader.start()
+
+            # Kill the whole process group when the timeout expires
+            def on_timeout():
+                if process.poll() is not None:
+                    return
+                timed_out.set()
+                terminate_process_group(process.pid, process.poll)
+
+            timer = None
+            if timeout is not None:
+                timer = threading.Timer(timeout, on_timeout)
+                timer.daemon = True
+                timer.start()
+
+            try:
+                for line in process.stdout:
+                    stream.feed(line)
+                returncode = process.wait()
+            finally:
+                if timer:
+                    timer.cancel()
+            stderr_reader.join()
+
+        if timed_out.is_set():
+            return build_timeout_response(timeout, stream)
+
+        response = build_prompt_response(returncode, stream, "".join(stderr_chunks))
+        update_circuit_breaker(response)
+        return response
+
     except Exception as e:
         error_msg = f"Error executing Claude Code: {e}"
         return AgentPromptResponse(
@@ -587,20 +1279,8 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
         )
 
 
-def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
-    """Execute a Claude Code template with slash command and arguments.
-
-    Example:
-        request = AgentTemplateRequest(
-            agent_name="planner",
-            slash_command="/implement",
-            args=["plan.md"],
-            adw_id="abc12345",
-            model="sonnet"  # Explicitly set model
-        )
-        response = execute_template(request)
-    """
-
+def build_template_prompt_request(request: AgentTemplateRequest) -> AgentPromptRequest:
+    """Build the prompt request for a slash command template execution."""
     # Construct prompt from slash command and args
     prompt = f"{request.slash_command} {' '.join(request.args)}"
 
@@ -618,7 +1298,7 @@ def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
     output_file = os.path.join(output_dir, OUTPUT_JSONL)
 
     # Create prompt request with specific parameters
-    prompt_request = AgentPromptRequest(
+    return AgentPromptRequest(
         prompt=prompt,
         adw_id=request.adw_id,
         agent_name=request.agent_name,
@@ -626,7 +1306,188 @@ def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
         dangerously_skip_permissions=True,
         output_file=output_file,
         working_dir=request.working_dir,  # Pass through working_dir
+        timeout_seconds=(
+            request.timeout_seconds
+            if request.timeout_seconds is not None
+            else get_command_timeout(request.slash_command)
+        ),
+        deadline=request.deadline,
+        resume_session_id=request.resume_session_id,
     )
 
+
+def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
+    """Execute a Claude Code template with slash command and arguments.
+
+    Example:
+        request = AgentTemplateRequest(
+            agent_name="planner",
+            slash_command="/implement",
+            args=["plan.md"],
+            adw_id="abc12345",
+            model="sonnet",  # Explicitly set model
+            resume_session_id=plan_response.session_id,  # Optional
+        )
+        response = execute_template(request)
+    """
+    prompt_request = build_template_prompt_request(request)
+
     # Execute with retry logic and return response (prompt_claude_code now handles all parsing)
     return prompt_claude_code_with_retry(prompt_request)
+
+
+async def prompt_claude_code_async(request: AgentPromptRequest) -> AgentPromptResponse:
+    """Async variant of prompt_claude_code built on asyncio subprocesses."""
+    error_response = await asyncio.to_thread(prepare_prompt_execution, request)
+    if error_response:
+        return error_response
+
+    circuit_wait = get_circuit_wait(request)
+    if circuit_wait is None:
+        return build_deadline_response()
+    if circuit_wait:
+        await asyncio.sleep(circuit_wait)
+
+    slot = await AGENT_SLOTS.acquire_async(request.model, request.deadline)
+    if slot is None:
+        return build_deadline_response()
+    try:
+        return await run_claude_code_async(request)
+    finally:
+        slot.release()
+
+
+async def run_claude_code_async(request: AgentPromptRequest) -> AgentPromptResponse:
+    """Async variant of run_claude_code."""
+    timeout = get_effective_timeout(request.timeout_seconds, request.deadline)
+    if timeout is not None and timeout <= 0:
+        return build_deadline_response()
+
+    cmd = build_claude_command(request)
+    env = get_claude_env()
+
+    try:
+        with JsonlStreamParser(request.output_file) as stream:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                cwd=request.working_dir,
+                limit=ASYNC_STREAM_LIMIT,
+                start_new_session=True,
+            )
+
+            async def read_stdout():
+                async for line in process.stdout:
+                    stream.feed(line.decode("utf-8", errors="replace"))
+
+            async def run_to_completion():
+                results = await asyncio.gather(read_stdout(), process.stderr.read())
+                await process.wait()
+                return results[1]
+
+            try:
+                stderr_bytes = await asyncio.wait_for(run_to_completion(), timeout)
+            except asyncio.TimeoutError:
+                await asyncio.to_thread(
+                    terminate_process_group, process.pid, lambda: process.returncode
+                )
+                await process.wait()
+                return build_timeout_response(timeout, stream)
+            except asyncio.CancelledError:
+                # The caller gave up on this run, so don't leave the CLI and its
+                # tools running in their own session. Shielded so a second
+                # cancellation can't interrupt the kill.
+                await asyncio.shield(
+                    asyncio.to_thread(
+                        terminate_process_group, process.pid, lambda: process.returncode
+                    )
+                )
+                raise
+            returncode = process.returncode
+
+        response = build_prompt_response(
+            returncode, stream, stderr_bytes.decode("utf-8", errors="replace")
+        )
+        update_circuit_breaker(response)
+        return response
+
+    except Exception as e:
+        error_msg = f"Error executing Claude Code: {e}"
+        return AgentPromptResponse(
+            output=error_msg,
+            success=False,
+            session_id=None,
+            retry_code=RetryCode.EXECUTION_ERROR,
+        )
+
+
+async def prompt_claude_code_with_retry_async(
+    request: AgentPromptRequest,
+    max_retries: int = 3,
+    retry_delays: List[int] = None,
+) -> AgentPromptResponse:
+    """Async variant of prompt_claude_code_with_retry."""
+    retry_delays = get_retry_delays(max_retries, retry_delays)
+    original = request
+    attempts: List[AgentAttempt] = []
+    response = None
+
+    for attempt in range(max_retries + 1):  # +1 for initial attempt
+        if attempt > 0:
+            delay = get_retry_delay(attempt, response, retry_delays)
+            if deadline_reached(request, delay + MIN_RETRY_SECONDS):
+                break
+            await asyncio.sleep(delay)
+            request = build_retry_request(original, response)
+
+        started = time.monotonic()
+        response = await prompt_claude_code_async(request)
+        record_attempt(attempts, request, response, started)
+
+        while resume_was_rejected(request, response):
+            original = drop_rejected_resume(original, request)
+            request = clamp_to_deadline(original)
+            started = time.monotonic()
+            response = await prompt_claude_code_async(request)
+            record_attempt(attempts, request, response, started)
+        if not is_retryable(response):
+            break
+
+    return finish_attempts(request, response, attempts)
+
+
+async def execute_template_async(request: AgentTemplateRequest) -> AgentPromptResponse:
+    """Async variant of execute_template."""
+    prompt_request = build_template_prompt_request(request)
+    return await prompt_claude_code_with_retry_async(prompt_request)
+
+
+async def execute_templates_async(
+    requests: Sequence[AgentTemplateRequest],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[AgentPromptResponse]:
+    """Execute several templates concurrently, at most max_concurrency at a time.
+
+    Example:
+        responses = asyncio.run(execute_templates_async(requests, max_concurrency=8))
+
+    Returns:
+        Responses in the same order as requests
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(request: AgentTemplateRequest) -> AgentPromptResponse:
+        async with semaphore:
+            return await execute_template_async(request)
+
+    return list(await asyncio.gather(*(run(r) for r in requests)))
+
+
+def execute_templates(
+    requests: Sequence[AgentTemplateRequest],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[AgentPromptResponse]:
+    """Blocking wrapper around execute_templates_async for synchronous callers."""
+    return asyncio.run(execute_templates_async(requests, max_concurrency))
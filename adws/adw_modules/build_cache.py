@@ -0,0 +1,297 @@
+"""Seed cache of incremental build state shared by the worktrees.
+
+Agents run type checks and `next build` in fresh worktrees that differ
+from the base branch by a few files. The build caches of the main
+checkout (.next/cache and *.tsbuildinfo of every Next.js/TypeScript
+project) are snapshotted under trees/.build-cache/<commit>/ whenever a
+build there completes, and each new worktree is seeded with the snapshot
+of its base commit, or of the nearest ancestor that has one, so its first
+build is incremental.
+
+Snapshots are copied, not hardlinked, because builds rewrite their cache
+files in place. Only the newest MAX_SNAPSHOTS are kept. A long-running
+caller such as the cron trigger uses start_refresh, which only compares
+modification times itself and copies in a background thread.
+
+Example:
+    cache = BuildCache()
+    cache.refresh(repo_root)                      # after a build on main
+    cache.seed_worktree("trees/feature-auth")     # when creating a worktree
+"""
+
+import glob
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils import atomic_write_text, file_lock
+
+STORE_DIR_NAME = ".build-cache"
+DEFAULT_CACHE_DIR = os.path.join("trees", STORE_DIR_NAME)
+MANIFEST_JSON = "manifest.json"
+
+# Snapshots kept, newest first
+MAX_SNAPSHOTS = 3
+
+# How far back the base commit's history is searched for a snapshot
+MAX_SEED_DISTANCE = 200
+
+NEXT_CACHE_DIR = os.path.join(".next", "cache")
+
+# Written by `next build` when it finishes
+NEXT_BUILD_ID = os.path.join(".next", "BUILD_ID")
+
+
+def git_output(args: List[str], cwd: str) -> str:
+    """Run a git command and return its stdout."""
+    return subprocess.run(
+        ["git"] + args, cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def find_build_projects(checkout: str) -> List[str]:
+    """Checked-out directories with a Next.js config or tsconfig.json, relative to checkout."""
+    projects = set()
+    for relative_path in git_output(["ls-files"], checkout).splitlines():
+        name = os.path.basename(relative_path)
+        if name == "tsconfig.json" or name.startswith("next.config."):
+            if os.path.isfile(os.path.join(checkout, relative_path)):
+                projects.add(os.path.dirname(relative_path))
+    return sorted(projects)
+
+
+def get_cache_items(project_dir: str) -> List[str]:
+    """Build cache paths present in a project, relative to it."""
+    items = []
+    if os.path.isdir(os.path.join(project_dir, NEXT_CACHE_DIR)):
+        items.append(NEXT_CACHE_DIR)
+    items.extend(
+        os.path.basename(path)
+        for path in sorted(glob.glob(os.path.join(project_dir, "*.tsbuildinfo")))
+    )
+    return items
+
+
+def get_build_stamp(project_dir: str) -> float:
+    """Time of the project's last completed build, 0 if it was never built."""
+    markers = [os.path.join(project_dir, NEXT_BUILD_ID)] + glob.glob(
+        os.path.join(project_dir, "*.tsbuildinfo")
+    )
+    return max(
+        (os.path.getmtime(path) for path in markers if os.path.isfile(path)),
+        default=0.0,
+    )
+
+
+def copy_item(source: str, destination: str):
+    """Copy a cache file or directory, replacing what is at destination."""
+    if os.path.isdir(destination) and not os.path.islink(destination):
+        shutil.rmtree(destination)
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    if os.path.isdir(source):
+        shutil.copytree(source, destination, symlinks=True)
+    else:
+        shutil.copy2(source, destination)
+
+
+class BuildCache:
+    """Snapshots of build caches keyed on the commit they were built from."""
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR):
+        self.root = os.path.abspath(root)
+        self.projects: Dict[str, List[str]] = {}
+        self.publisher: Optional[threading.Thread] = None
+        self.published: List[str] = []
+
+    def get_snapshot_dir(self, commit: str) -> str:
+        return os.path.join(self.root, commit)
+
+    def read_manifest(self, commit: str) -> Optional[dict]:
+        """Manifest of a commit's snapshot, None if there is none."""
+        try:
+            with open(os.path.join(self.get_snapshot_dir(commit), MANIFEST_JSON)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def list_snapshots(self) -> List[str]:
+        """Commits with a complete snapshot, newest first."""
+        if not os.path.isdir(self.root):
+            return []
+        manifests = [
+            (manifest.get("created_at", 0), name)
+            for name in os.listdir(self.root)
+            for manifest in [self.read_manifest(name)]
+            if manifest
+        ]
+        return [name for _, name in sorted(manifests, reverse=True)]
+
+    def get_projects(self, checkout: str, commit: str) -> List[str]:
+        """Build projects of a checkout, cached per commit."""
+        key = f"{os.path.abspath(checkout)}@{commit}"
+        if key not in self.projects:
+            self.projects[key] = find_build_projects(checkout)
+        return self.projects[key]
+
+    def publish(self, checkout: str, commit: Optional[str] = None) -> Optional[str]:
+        """Snapshot the build caches of a checkout under its HEAD commit.
+
+        Returns:
+            The commit snapshotted, or None if the checkout has no build caches
+        """
+        commit = commit or git_output(["rev-parse", "HEAD"], checkout)
+        projects = {}
+        stamp = 0.0
+        for project in self.get_projects(checkout, commit):
+            project_dir = os.path.join(checkout, project)
+            items = get_cache_items(project_dir)
+            if items:
+                projects[project] = items
+                stamp = max(stamp, get_build_stamp(project_dir))
+        if not projects:
+            return None
+
+        with file_lock(os.path.join(self.root, "publish.lock")):
+            staging = self.get_snapshot_dir(commit) + ".tmp"
+            if os.path.isdir(staging):
+                shutil.rmtree(staging)
+            for project, items in projects.items():
+                for item in items:
+                    copy_item(
+                        os.path.join(checkout, project, item),
+                        os.path.join(staging, project, item),
+                    )
+            atomic_write_text(
+                os.path.join(staging, MANIFEST_JSON),
+                json.dumps(
+                    {
+                        "commit": commit,
+                        "build_stamp": stamp,
+                        "created_at": time.time(),
+                        "projects": projects,
+                    },
+                    indent=2,
+                ),
+            )
+
+            snapshot_dir = self.get_snapshot_dir(commit)
+            if os.path.isdir(snapshot_dir):
+                shutil.rmtree(snapshot_dir)
+            os.rename(staging, snapshot_dir)
+            self.prune()
+        return commit
+
+    def get_stale_commit(self, checkout: str) -> Optional[str]:
+        """HEAD commit of a checkout if a build finished there since its last snapshot.
+
+        Cheap enough to call on every trigger cycle: it only compares file
+        modification times with the snapshot's manifest.
+
+        Returns:
+            The commit to snapshot, or None if the snapshot is up to date
+        """
+        commit = git_output(["rev-parse", "HEAD"], checkout)
+        stamp = max(
+            (
+                get_build_stamp(os.path.join(checkout, project))
+                for project in self.get_projects(checkout, commit)
+            ),
+            default=0.0,
+        )
+        if not stamp:
+            return None
+        manifest = self.read_manifest(commit)
+        if manifest and manifest.get("build_stamp", 0) >= stamp:
+            return None
+        return commit
+
+    def refresh(self, checkout: str) -> Optional[str]:
+        """Snapshot a checkout if a build finished there since its last snapshot.
+
+        Returns:
+            The commit snapshotted, or None if nothing changed
+        """
+        commit = self.get_stale_commit(checkout)
+        if commit is None:
+            return None
+        return self.publish(checkout, commit)
+
+    def start_refresh(self, checkout: str) -> bool:
+        """Like refresh, but copy the caches in a background thread.
+
+        Only the modification time check runs in the caller. Does nothing
+        while an earlier snapshot is still being copied. Snapshotted commits
+        are reported through drain_published.
+
+        Returns:
+            True if a snapshot was started
+        """
+        if self.publisher is not None and self.publisher.is_alive():
+            return False
+        commit = self.get_stale_commit(checkout)
+        if commit is None:
+            return False
+        self.publisher = threading.Thread(
+            target=self.publish_in_background, args=(checkout, commit), daemon=True
+        )
+        self.publisher.start()
+        return True
+
+    def publish_in_background(self, checkout: str, commit: str):
+        try:
+            if self.publish(checkout, commit):
+                self.published.append(commit)
+        except (subprocess.CalledProcessError, OSError):
+            # The build is still writing its cache; the next refresh retries
+            pass
+
+    def drain_published(self) -> List[str]:
+        """Return and forget the commits snapshotted in the background since the last call."""
+        published, self.published = self.published, []
+        return published
+
+    def prune(self):
+        """Drop all but the newest MAX_SNAPSHOTS snapshots."""
+        for commit in self.list_snapshots()[MAX_SNAPSHOTS:]:
+            shutil.rmtree(self.get_snapshot_dir(commit), ignore_errors=True)
+
+    def find_seed(self, worktree_path: str) -> Optional[str]:
+        """Snapshot for the worktree's HEAD commit or its nearest ancestor."""
+        snapshots = set(self.list_snapshots())
+        if not snapshots:
+            return None
+        history = git_output(
+            ["rev-list", f"--max-count={MAX_SEED_DISTANCE}", "HEAD"], worktree_path
+        )
+        return next((c for c in history.splitlines() if c in snapshots), None)
+
+    def seed_worktree(self, worktree_path: str) -> Optional[str]:
+        """Copy the nearest snapshot's build caches into a worktree.
+
+        Cache items the worktree already has are left alone. Holds the
+        publish lock, so a snapshot is never replaced while it is copied.
+
+        Returns:
+            The commit of the snapshot used, or None if there was none
+        """
+        with file_lock(os.path.join(self.root, "publish.lock")):
+            commit = self.find_seed(worktree_path)
+            if commit is None:
+                return None
+            manifest = self.read_manifest(commit) or {}
+            snapshot_dir = self.get_snapshot_dir(commit)
+            for project, items in manifest.get("projects", {}).items():
+                project_dir = os.path.join(worktree_path, project)
+                if not os.path.isdir(project_dir):
+                    # Outside this worktree's sparse checkout
+                    continue
+                for item in items:
+                    destination = os.path.join(project_dir, item)
+                    source = os.path.join(snapshot_dir, project, item)
+                    if os.path.exists(source) and not os.path.exists(destination):
+                        copy_item(source, destination)
+            return commit
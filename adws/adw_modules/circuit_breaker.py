@@ -0,0 +1,109 @@
+"""Host-wide circuit breaker for Claude API rate limits.
+
+When any workflow hits a rate-limit or overload error it opens the circuit
+for a cooldown that grows with each consecutive rate limit. The state is a
+small JSON file under agents/, so every workflow process and the cron
+trigger see it and hold off new Claude Code launches until the upstream
+has recovered, instead of all retrying at once.
+"""
+
+import json
+import os
+import random
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+from utils import atomic_write_text, file_lock
+
+# __file__ is in adws/adw_modules/, so the project root is 3 levels up
+CIRCUIT_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "agents",
+    "claude_circuit.json",
+)
+
+# Cooldown after the first rate limit, doubling per consecutive rate limit
+BASE_COOLDOWN_SECONDS = 15
+MAX_COOLDOWN_SECONDS = 300
+
+
+class CircuitState(BaseModel):
+    """Persisted circuit breaker state."""
+
+    open_until: float = 0  # time.time() before which no new runs should start
+    consecutive_rate_limits: int = 0
+    last_reason: Optional[str] = None
+
+
+class CircuitBreaker:
+    """Shares rate-limit cooldowns between workflow processes."""
+
+    def __init__(self, file_path: str = CIRCUIT_FILE):
+        self.file_path = file_path
+        self.lock_path = f"{file_path}.lock"
+
+    def read_state(self) -> CircuitState:
+        """Read the current state; a missing or corrupt file means closed."""
+        try:
+            with open(self.file_path, "r") as f:
+                return CircuitState(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return CircuitState()
+
+    def write_state(self, state: CircuitState):
+        """Replace the state file. Callers hold the lock."""
+        atomic_write_text(self.file_path, state.model_dump_json(indent=2))
+
+    def remaining_seconds(self) -> float:
+        """Seconds until the circuit closes, 0 if it is closed."""
+        return max(0.0, self.read_state().open_until - time.time())
+
+    def is_open(self) -> bool:
+        """Check if new runs should be held back."""
+        return self.remaining_seconds() > 0
+
+    def record_rate_limit(self, reason: Optional[str] = None) -> float:
+        """Open the circuit after a rate-limit or overload error.
+
+        Returns:
+            Seconds until the circuit closes again
+        """
+        try:
+            with file_lock(self.lock_path):
+                state = self.read_state()
+                state.consecutive_rate_limits += 1
+                cooldown = min(
+                    MAX_COOLDOWN_SECONDS,
+                    BASE_COOLDOWN_SECONDS * 2 ** (state.consecutive_rate_limits - 1),
+                )
+                # Jitter so waiting workflows do not all resume in lockstep
+                cooldown *= random.uniform(0.8, 1.2)
+                state.open_until = max(state.open_until, time.time() + cooldown)
+                state.last_reason = reason
+                self.write_state(state)
+                return state.open_until - time.time()
+        except OSError:
+            return 0.0
+
+    def record_success(self):
+        """Reset the cooldown backoff after a run got through.
+
+        A run that started before the circuit opened can finish while it is
+        still open; that says nothing about the upstream having recovered, so
+        an unexpired cooldown is left in place.
+        """
+        if self.read_state().consecutive_rate_limits == 0:
+            # Common case: nothing to reset, avoid taking the lock
+            return
+        try:
+            with file_lock(self.lock_path):
+                state = self.read_state()
+                state.consecutive_rate_limits = 0
+                if state.open_until <= time.time():
+                    state.open_until = 0
+                    state.last_reason = None
+                self.write_state(state)
+        except OSError:
+            pass
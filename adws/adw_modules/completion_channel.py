@@ -0,0 +1,144 @@
+"""Completion events from workflows to the running cron trigger.
+
+Workflows send a small JSON datagram over a Unix socket when they finish a
+task, so the trigger can start the next blocked [⏰] task in that worktree
+immediately instead of waiting for its next poll. Sending never blocks and
+silently does nothing when no trigger is listening.
+"""
+
+import errno
+import hashlib
+import os
+import select
+import socket
+import tempfile
+from typing import List, Optional
+
+from data_models import CompletionEvent
+
+SOCKET_NAME = "cron_trigger.sock"
+
+# sun_path is 108 bytes on Linux (104 on macOS), including the trailing NUL
+MAX_SOCKET_PATH = 100
+
+
+def get_completion_socket_path(task_file_path: str) -> str:
+    """Socket path shared by the trigger and workflows for a task file.
+
+    Lives in agents/ next to the task file. Falls back to the temp directory,
+    keyed on the task file path, when that path is too long for a socket.
+    """
+    task_file = os.path.abspath(task_file_path)
+    path = os.path.join(os.path.dirname(task_file), "agents", SOCKET_NAME)
+    if len(path.encode()) <= MAX_SOCKET_PATH:
+        return path
+
+    digest = hashlib.sha256(task_file.encode()).hexdigest()[:12]
+    return os.path.join(tempfile.gettempdir(), f"adw_{digest}_{SOCKET_NAME}")
+
+
+def send_datagram(socket_path: str, payload: bytes) -> bool:
+    """Send one datagram; True if a listener received it."""
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        sock.setblocking(False)
+        sock.sendto(payload, socket_path)
+        return True
+    except OSError:
+        # No trigger listening, stale socket, or its buffer is full
+        return False
+    finally:
+        sock.close()
+
+
+def publish_completion(event: CompletionEvent, socket_path: str) -> bool:
+    """Notify the cron trigger that a workflow finished.
+
+    Returns:
+        True if the event was delivered to a listening trigger
+    """
+    return send_datagram(socket_path, event.model_dump_json().encode())
+
+
+class CompletionListener:
+    """Receives completion events on the trigger side."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.sock: Optional[socket.socket] = None
+
+    def start(self) -> bool:
+        """Bind the socket.
+
+        Returns:
+            False if Unix sockets are unavailable or another trigger already
+            listens on this path
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        if os.path.exists(self.socket_path):
+            # An empty datagram is ignored by a live listener; a refused send
+            # means the socket was left behind by a trigger that died
+            if send_datagram(self.socket_path, b""):
+                return False
+            os.unlink(self.socket_path)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind(self.socket_path)
+        except OSError:
+            sock.close()
+            return False
+        sock.setblocking(False)
+        self.sock = sock
+        return True
+
+    def fileno(self) -> Optional[int]:
+        """File descriptor to select on, or None if not listening."""
+        return self.sock.fileno() if self.sock else None
+
+    def wait(self, timeout: Optional[float]) -> List[CompletionEvent]:
+        """Wait up to timeout seconds for events and return them."""
+        if self.sock is None:
+            if timeout:
+                select.select([], [], [], timeout)
+            return []
+        ready, _, _ = select.select([self.sock], [], [], timeout)
+        return self.receive() if ready else []
+
+    def receive(self) -> List[CompletionEvent]:
+        """Drain pending events without blocking."""
+        events = []
+        if self.sock is None:
+            return events
+
+        while True:
+            try:
+                payload = self.sock.recv(64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            if not payload:
+                continue
+            try:
+                events.append(CompletionEvent.model_validate_json(payload))
+            except ValueError:
+                # Ignore malformed datagrams
+                continue
+        return events
+
+    def close(self):
+        """Stop listening and remove the socket file."""
+        if self.sock is None:
+            return
+        self.sock.close()
+        self.sock = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
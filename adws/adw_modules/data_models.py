@@ -5,7 +5,7 @@ These models define the structure for tasks, worktrees, and workflow states
 used throughout the ToDone system.
 """
 
-from typing import List, Optional, Literal
+from typing import Callable, List, Optional, Literal
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field, validator
@@ -48,6 +48,74 @@ class SystemTag(str, Enum):
         """Check if full workflow should be used based on tags."""
         return cls.PLAN_IMPLEMENT_UPDATE in tags
 
+    @classmethod
+    def get_workflow_commands(cls, tags: List[str]) -> List[str]:
+        """Slash commands the workflow selected by tags runs, in order."""
+        for tag, commands in WORKFLOW_COMMANDS.items():
+            if tag in tags:
+                return commands
+        return DEFAULT_WORKFLOW_COMMANDS
+
+    @classmethod
+    def get_workflow_budget(
+        cls, tags: List[str], get_command_timeout: Callable[[str], float]
+    ) -> int:
+        """Wall-clock budget in seconds for a task's whole workflow.
+
+        Derived from the per-command timeouts of the workflow's slash
+        commands, so an agent always hits its own timeout (and gets its
+        partial output salvaged) before the watchdog fires. The budget covers
+        one full pass, TIMEOUT_RETRIES_BUDGETED timed-out retries of the
+        longest command and WORKFLOW_OVERHEAD_SECONDS; model tags scale it.
+
+        Args:
+            tags: Task tags
+            get_command_timeout: Per-invocation timeout of a slash command,
+                e.g. agent.get_command_timeout
+        """
+        timeouts = [get_command_timeout(c) for c in cls.get_workflow_commands(tags)]
+        budget = (
+            sum(timeouts)
+            + max(timeouts) * TIMEOUT_RETRIES_BUDGETED
+            + WORKFLOW_OVERHEAD_SECONDS
+        )
+        for tag, multiplier in MODEL_BUDGET_MULTIPLIERS.items():
+            if tag in tags:
+                budget *= multiplier
+        return int(budget)
+
+
+# Slash commands of the default build-update workflow
+DEFAULT_WORKFLOW_COMMANDS = ["/build"]
+
+# Slash commands of workflows selected by tag
+WORKFLOW_COMMANDS = {
+    SystemTag.PLAN_IMPLEMENT_UPDATE: ["/plan", "/implement"],
+}
+
+# Timed-out agent retries a workflow budget leaves room for
+TIMEOUT_RETRIES_BUDGETED = 1
+
+# Worktree setup, task update and process start-up on top of the agent time
+WORKFLOW_OVERHEAD_SECONDS = 10 * 60
+
+# Budget multipliers for model tags
+MODEL_BUDGET_MULTIPLIERS = {
+    SystemTag.OPUS: 1.5,
+}
+
+# Part of a workflow's budget held back from its own deadline
+# (--workflow-timeout), so the workflow stops its agents and fails the task
+# cleanly before the watchdog has to kill it
+WORKFLOW_TIMEOUT_MARGIN = 0.1
+MAX_WORKFLOW_TIMEOUT_MARGIN_SECONDS = 300
+
+
+def get_workflow_timeout(budget_seconds: float) -> int:
+    """Deadline in seconds to give a workflow that has budget_seconds."""
+    margin = min(budget_seconds * WORKFLOW_TIMEOUT_MARGIN, MAX_WORKFLOW_TIMEOUT_MARGIN_SECONDS)
+    return max(1, int(budget_seconds - margin))
+
 
 class Task(BaseModel):
     """Represents a single task in the task list."""
@@ -194,6 +262,54 @@ class WorkflowState(BaseModel):
             self.error = error
 
 
+class CompletionEvent(BaseModel):
+    """Published by a workflow when it has written its final task status."""
+
+    adw_id: str = Field(..., description="ADW ID of the finished task")
+    worktree_name: str = Field(..., description="Worktree the task ran in")
+    status: Literal["[✅]", "[❌]"] = Field(..., description="Final task status")
+    commit_hash: Optional[str] = Field(
+        None, description="Git commit hash if successful"
+    )
+
+
+class WorkflowRun(BaseModel):
+    """A workflow process delegated by the cron trigger."""
+
+    adw_id: str = Field(..., description="ADW ID of the delegated task")
+    worktree_name: str = Field(..., description="Worktree the task runs in")
+    task_description: str = Field(..., description="Task being processed")
+    tags: List[str] = Field(
+        default_factory=list, description="Task tags, used to pick the workflow on resume"
+    )
+    pid: int = Field(..., description="Process ID of the workflow")
+    resume_attempts: int = Field(
+        0, description="How many times this task was resumed after its workflow crashed"
+    )
+    budget_seconds: Optional[float] = Field(
+        None, description="Wall-clock budget after which the watchdog kills the workflow"
+    )
+    timed_out: bool = Field(False, description="Killed by the watchdog for exceeding its budget")
+    started_at: datetime = Field(
+        default_factory=datetime.now, description="Process start time"
+    )
+    finished_at: Optional[datetime] = Field(
+        None, description="Time the process exit was observed"
+    )
+    exit_code: Optional[int] = Field(None, description="Process exit code")
+    duration_seconds: Optional[float] = Field(
+        None, description="Wall-clock run time in seconds"
+    )
+
+    def is_running(self) -> bool:
+        """Check if the process has not been reaped yet."""
+        return self.exit_code is None
+
+    def succeeded(self) -> bool:
+        """Check if the process exited cleanly."""
+        return self.exit_code == 0
+
+
 class CronTriggerConfig(BaseModel):
     """Configuration for the cron trigger."""
 
@@ -212,6 +328,87 @@ class CronTriggerConfig(BaseModel):
     worktree_base_path: str = Field(
         default="trees", description="Base directory for git worktrees"
     )
+    use_agent_parser: bool = Field(
+        default=False,
+        description="Use the /process_tasks agent instead of the native tasks.md parser",
+    )
+    watch: bool = Field(
+        default=False,
+        description="Process tasks when the task file changes instead of polling",
+    )
+    debounce_seconds: float = Field(
+        default=0.25,
+        ge=0,
+        description="Quiet period after a task file change before processing",
+    )
+    admission_control: bool = Field(
+        default=True,
+        description="Defer new tasks while host load or memory is past the limits below",
+    )
+    max_load_per_cpu: float = Field(
+        default=1.0,
+        gt=0,
+        description="Highest 1-minute load average per CPU at which tasks are started",
+    )
+    min_available_memory_mb: int = Field(
+        default=1024,
+        ge=0,
+        description="Available memory (MiB) to keep free after starting tasks",
+    )
+    max_agent_processes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum Claude Code processes on the host before deferring tasks",
+    )
+    task_load: float = Field(
+        default=1.0,
+        ge=0,
+        description="Load average expected per newly started workflow",
+    )
+    worker_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="Idle pre-started workflow workers to keep (0 starts a fresh process per task)",
+    )
+    worktree_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="Pre-warmed worktrees to keep for new worktree sections (0 creates them on demand)",
+    )
+    task_memory_mb: int = Field(
+        default=1024,
+        ge=0,
+        description="Memory (MiB) expected per newly started workflow",
+    )
+    max_resume_attempts: int = Field(
+        default=1,
+        ge=0,
+        description="Times a crashed or orphaned workflow is rerun with --resume before its task is marked failed",
+    )
+    watchdog: bool = Field(
+        default=True,
+        description="Kill workflows that exceed their wall-clock budget and fail their task",
+    )
+    workflow_budget_scale: float = Field(
+        default=1.0,
+        gt=0,
+        description="Multiplier applied to the per-tag workflow budgets in SystemTag",
+    )
+    gc_interval_seconds: int = Field(
+        default=600,
+        ge=0,
+        description="Seconds between worktree garbage collection passes (0 disables them)",
+    )
+    gc_retention_hours: float = Field(
+        default=24,
+        ge=0,
+        description="Hours a finished worktree is kept after its last activity",
+    )
+    heartbeat_timeout_seconds: int = Field(
+        default=90,
+        ge=1,
+        description="Seconds without a workflow heartbeat before an in-progress task counts as orphaned",
+    )
 
 
 class WorktreeConfig(BaseModel):
@@ -224,3 +421,32 @@ class WorktreeConfig(BaseModel):
     copy_env: bool = Field(
         default=True, description="Whether to copy .env file to worktree"
     )
+    target_directory: Optional[str] = Field(
+        default=None,
+        description="Directory to sparse-check out in the worktree, None for the whole tree",
+    )
+    install_dependencies: bool = Field(
+        default=True,
+        description="Install locked dependencies of a new worktree from the shared dependency store",
+    )
+    seed_build_cache: bool = Field(
+        default=True,
+        description="Seed .next/cache and tsbuildinfo of a new worktree from the base commit's build",
+    )
+
+
+class WorktreeGCPolicy(BaseModel):
+    """Retention policy for worktrees whose tasks have all finished."""
+
+    retention_hours: float = Field(
+        default=24,
+        ge=0,
+        description="Hours a finished worktree is kept after its last commit or git activity",
+    )
+    require_merged_or_pushed: bool = Field(
+        default=True,
+        description="Only collect worktrees whose branch is merged into the base branch or pushed",
+    )
+    base_branch: str = Field(
+        default="main", description="Branch a worktree branch must be merged into"
+    )
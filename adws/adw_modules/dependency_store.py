@@ -0,0 +1,329 @@
+"""Content-addressed dependency store shared by the worktrees.
+
+Every worktree is a checkout of the same apps, so most of them install
+identical dependencies. Node projects install once per distinct lockfile:
+the first worktree with a given lockfile and package.json installs
+node_modules and publishes a copy under trees/.deps/node_modules/<hash>/;
+later worktrees with the same files get a linked or cloned copy of that in
+a fraction of a second and without touching the network. A worktree whose
+lockfile diverges gets its own entry, and the shared pnpm/npm/yarn caches
+keep that install incremental. uv projects install into a per-worktree
+.venv from a shared uv cache in hardlink mode.
+
+Where the filesystem and cp support copy-on-write clones (GNU cp on btrfs
+or XFS), entries are cloned, so every worktree gets private copies at no
+extra cost. Elsewhere they are hardlinked and their files made read-only:
+package managers replace files rather than rewrite them, and a tool that
+does write into a package in place fails loudly instead of silently
+changing the store and every other worktree.
+
+Example:
+    store = DependencyStore()
+    store.install_worktree("trees/feature-auth")
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from utils import file_lock
+
+STORE_DIR_NAME = ".deps"
+DEFAULT_STORE_DIR = os.path.join("trees", STORE_DIR_NAME)
+
+# Lockfiles by preference, with the directory each one installs
+NODE_LOCKFILES = ["pnpm-lock.yaml", "yarn.lock", "package-lock.json"]
+UV_LOCKFILE = "uv.lock"
+DEPENDENCY_DIRS = {
+    "pnpm-lock.yaml": "node_modules",
+    "yarn.lock": "node_modules",
+    "package-lock.json": "node_modules",
+    UV_LOCKFILE: ".venv",
+}
+
+# Files whose changes mean a project's dependencies must be reinstalled
+DEPENDENCY_FILES = set(DEPENDENCY_DIRS) | {"package.json", "pyproject.toml"}
+
+
+def link_tree(source: str, destination: str):
+    """Recreate a directory tree with hardlinks to source's files.
+
+    Symlinks are copied as symlinks. Files are copied instead where a
+    hardlink is not possible, e.g. across filesystems.
+    """
+    for dirpath, dirnames, filenames in os.walk(source):
+        relative = os.path.relpath(dirpath, source)
+        target_dir = os.path.normpath(os.path.join(destination, relative))
+        os.makedirs(target_dir, exist_ok=True)
+        shutil.copystat(dirpath, target_dir)
+
+        for name in dirnames + filenames:
+            source_path = os.path.join(dirpath, name)
+            target_path = os.path.join(target_dir, name)
+            if os.path.islink(source_path):
+                os.symlink(os.readlink(source_path), target_path)
+                if name in dirnames:
+                    # os.walk does not descend into symlinked directories
+                    dirnames.remove(name)
+            elif name in filenames:
+                try:
+                    os.link(source_path, target_path)
+                except OSError:
+                    shutil.copy2(source_path, target_path)
+
+
+def clone_tree(source: str, destination: str):
+    """Copy a directory tree with copy-on-write clones of source's files."""
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    subprocess.run(
+        ["cp", "-a", "--reflink=always", source, destination],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def make_read_only(directory: str):
+    """Drop the write permission bits of every file under directory.
+
+    Hardlinks share permissions, so this covers every worktree linked to
+    the same files.
+    """
+    write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                continue
+            mode = os.stat(path).st_mode
+            if mode & write_bits:
+                os.chmod(path, mode & ~write_bits)
+
+
+def hash_files(paths: List[str]) -> str:
+    """Hex digest identifying the contents of a set of files."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b"\0missing")
+    return digest.hexdigest()[:16]
+
+
+def find_projects(worktree_path: str) -> List[Tuple[str, str]]:
+    """Checked-out directories of a worktree that have a lockfile.
+
+    Returns:
+        (project_dir, lockfile) pairs, at most one Node lockfile per directory
+    """
+    output = subprocess.run(
+        ["git", "ls-files"], cwd=worktree_path, capture_output=True, text=True, check=True
+    ).stdout
+    lockfiles: Dict[str, List[str]] = {}
+    for relative_path in output.splitlines():
+        name = os.path.basename(relative_path)
+        if name in DEPENDENCY_DIRS and os.path.isfile(
+            os.path.join(worktree_path, relative_path)
+        ):
+            directory = os.path.join(worktree_path, os.path.dirname(relative_path))
+            lockfiles.setdefault(os.path.normpath(directory), []).append(name)
+
+    projects = []
+    for directory, names in sorted(lockfiles.items()):
+        node_lockfile = next((n for n in NODE_LOCKFILES if n in names), None)
+        if node_lockfile:
+            projects.append((directory, node_lockfile))
+        if UV_LOCKFILE in names:
+            projects.append((directory, UV_LOCKFILE))
+    return projects
+
+
+class DependencyStore:
+    """Installs worktree dependencies through shared, hash-keyed entries."""
+
+    def __init__(self, root: str = DEFAULT_STORE_DIR):
+        self.root = os.path.abspath(root)
+        self.reflink: Optional[bool] = None
+
+    def supports_reflink(self) -> bool:
+        """Check once if the store's filesystem can clone files copy-on-write."""
+        if self.reflink is None:
+            os.makedirs(self.root, exist_ok=True)
+            probe = os.path.join(self.root, f".reflink-probe-{os.getpid()}")
+            try:
+                with open(probe, "w") as f:
+                    f.write("probe")
+                result = subprocess.run(
+                    ["cp", "--reflink=always", probe, f"{probe}.clone"],
+                    capture_output=True,
+                )
+                self.reflink = result.returncode == 0
+            except OSError:
+                self.reflink = False
+            finally:
+                for path in (probe, f"{probe}.clone"):
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+        return self.reflink
+
+    def share_tree(self, source: str, destination: str):
+        """Copy a dependency tree between a worktree and the store.
+
+        Clones copy-on-write where possible; otherwise hardlinks the files
+        and makes them read-only, so an in-place write fails instead of
+        changing them for every worktree.
+        """
+        if self.supports_reflink():
+            clone_tree(source, destination)
+        else:
+            link_tree(source, destination)
+            make_read_only(destination)
+
+    def get_install_command(self, lockfile: str) -> List[str]:
+        """Install command for a lockfile, pointed at the shared caches."""
+        if lockfile == "pnpm-lock.yaml":
+            return [
+                "pnpm",
+                "install",
+                "--frozen-lockfile",
+                "--store-dir",
+                os.path.join(self.root, "pnpm-store"),
+            ]
+        if lockfile == "yarn.lock":
+            return [
+                "yarn",
+                "install",
+                "--frozen-lockfile",
+                "--cache-folder",
+                os.path.join(self.root, "yarn-cache"),
+            ]
+        if lockfile == "package-lock.json":
+            return ["npm", "ci", "--cache", os.path.join(self.root, "npm-cache")]
+        return ["uv", "sync", "--frozen"]
+
+    def get_store_key(self, project_dir: str, lockfile: str) -> str:
+        """Store entry name for a project's lockfile and manifest."""
+        return hash_files(
+            [os.path.join(project_dir, lockfile), os.path.join(project_dir, "package.json")]
+        )
+
+    def run_install(self, project_dir: str, lockfile: str):
+        """Run the package manager in a project with the shared caches."""
+        env = dict(os.environ)
+        if lockfile == UV_LOCKFILE:
+            env["UV_CACHE_DIR"] = os.path.join(self.root, "uv-cache")
+            env["UV_LINK_MODE"] = "hardlink"
+        subprocess.run(
+            self.get_install_command(lockfile),
+            cwd=project_dir,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def install_project(self, project_dir: str, lockfile: str) -> str:
+        """Install one project's dependencies, linking them from the store if possible.
+
+        Holds a lock per store entry, so worktrees provisioned at the same
+        time with the same lockfile run a single install between them.
+
+        Returns:
+            "linked" if the store already had the dependencies, otherwise "installed"
+
+        Raises:
+            subprocess.CalledProcessError: If the package manager fails
+            OSError: If the package manager is not installed
+        """
+        if lockfile == UV_LOCKFILE:
+            self.run_install(project_dir, lockfile)
+            return "installed"
+
+        key = self.get_store_key(project_dir, lockfile)
+        entry = os.path.join(self.root, "node_modules", key)
+        target = os.path.join(project_dir, DEPENDENCY_DIRS[lockfile])
+
+        with file_lock(os.path.join(self.root, "locks", f"{key}.lock")):
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+
+            if os.path.isdir(entry):
+                self.share_tree(entry, target)
+                return "linked"
+
+            self.run_install(project_dir, lockfile)
+            if os.path.isdir(target):
+                staging = f"{entry}.tmp"
+                if os.path.isdir(staging):
+                    shutil.rmtree(staging)
+                self.share_tree(target, staging)
+                os.rename(staging, entry)
+            return "installed"
+
+    def install_worktree(self, worktree_path: str) -> Dict[str, str]:
+        """Install the dependencies of every project checked out in a worktree.
+
+        Returns:
+            Outcome by project, e.g. {"app/package-lock.json": "linked"}
+        """
+        outcomes = {}
+        for project_dir, lockfile in find_projects(worktree_path):
+            relative = os.path.relpath(os.path.join(project_dir, lockfile), worktree_path)
+            outcomes[relative] = self.install_project(project_dir, lockfile)
+        return outcomes
+
+    def get_worktree_keys(self, worktree_path: str) -> List[str]:
+        """Store entries matching the Node lockfiles of a worktree."""
+        return [
+            self.get_store_key(project_dir, lockfile)
+            for project_dir, lockfile in find_projects(worktree_path)
+            if lockfile != UV_LOCKFILE
+        ]
+
+    def prune(self, keep_keys: List[str]) -> List[str]:
+        """Remove entries no remaining worktree uses.
+
+        Worktrees keep their linked or cloned copies, so this only frees the
+        space of dependency sets nobody links to any more.
+
+        Returns:
+            Keys of the removed entries
+        """
+        entries_dir = os.path.join(self.root, "node_modules")
+        if not os.path.isdir(entries_dir):
+            return []
+        removed = []
+        for key in sorted(os.listdir(entries_dir)):
+            if key in keep_keys or key.endswith(".tmp"):
+                continue
+            with file_lock(os.path.join(self.root, "locks", f"{key}.lock")):
+                shutil.rmtree(os.path.join(entries_dir, key), ignore_errors=True)
+            removed.append(key)
+        return removed
+
+    def get_entry_count(self) -> int:
+        """Number of distinct Node dependency sets in the store."""
+        entries_dir = os.path.join(self.root, "node_modules")
+        if not os.path.isdir(entries_dir):
+            return 0
+        return len([n for n in os.listdir(entries_dir) if not n.endswith(".tmp")])
+
+
+def dependencies_changed(worktree_path: str, old_ref: str, new_ref: Optional[str] = None) -> bool:
+    """Check if any lockfile or manifest differs between two commits of a worktree."""
+    output = subprocess.run(
+        ["git", "diff", "--name-only", old_ref, new_ref or "HEAD"],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return any(os.path.basename(path) in DEPENDENCY_FILES for path in output.splitlines())
@@ -0,0 +1,208 @@
+"""Change notification for the task list file.
+
+Uses Linux inotify through ctypes when available and falls back to polling
+the file's mtime/size. In both cases a change is only reported once the
+file has been quiet for the debounce window and its content hash differs
+from the last reported version, so multi-step editor saves and no-op
+writes wake the trigger at most once.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import time
+from typing import Optional, Tuple
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+
+def hash_file(file_path: str) -> Optional[str]:
+    """Return the SHA-256 of a file's content, or None if it does not exist."""
+    try:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def stat_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(file_path)
+        return st.st_mtime_ns, st.st_size
+    except FileNotFoundError:
+        return None
+
+
+class TaskFileWatcher:
+    """Blocks until the watched file's content changes."""
+
+    def __init__(
+        self,
+        file_path: str,
+        debounce_seconds: float = 0.25,
+        poll_interval: float = 0.5,
+    ):
+        self.file_path = os.path.abspath(file_path)
+        self.dir_path = os.path.dirname(self.file_path)
+        self.file_name = os.path.basename(self.file_path)
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        self.last_hash = hash_file(self.file_path)
+        self.last_signature = stat_signature(self.file_path)
+        self.inotify_fd: Optional[int] = None
+        self.setup_inotify()
+
+    @property
+    def backend(self) -> str:
+        """Name of the change detection mechanism in use."""
+        return "inotify" if self.inotify_fd is not None else "polling"
+
+    def setup_inotify(self):
+        """Start an inotify watch on the file's directory, if supported.
+
+        The directory is watched rather than the file so that atomic
+        rename-over saves (editors, TaskListManager) are seen as well.
+        """
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            return
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            # Not Linux, or libc without inotify
+            return
+        if fd < 0:
+            return
+
+        wd = libc.inotify_add_watch(fd, self.dir_path.encode(), WATCH_MASK)
+        if wd < 0:
+            os.close(fd)
+            return
+        self.inotify_fd = fd
+
+    def close(self):
+        """Release the inotify file descriptor."""
+        if self.inotify_fd is not None:
+            os.close(self.inotify_fd)
+            self.inotify_fd = None
+
+    def read_inotify_events(self) -> bool:
+        """Drain pending inotify events; True if any concern the watched file."""
+        relevant = False
+        while True:
+            try:
+                data = os.read(self.inotify_fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset + INOTIFY_EVENT_HEADER.size <= len(data):
+                _, _, _, name_len = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+                offset += INOTIFY_EVENT_HEADER.size
+                name = data[offset : offset + name_len].rstrip(b"\0").decode(
+                    errors="replace"
+                )
+                offset += name_len
+                if name == self.file_name:
+                    relevant = True
+        return relevant
+
+    def wait_for_event(
+        self, timeout: Optional[float], wake_fd: Optional[int] = None
+    ) -> bool:
+        """Wait for a raw change signal, without debouncing.
+
+        Returns:
+            True if the file may have changed, False on timeout or when
+            wake_fd became readable
+        """
+        wake_fds = [wake_fd] if wake_fd is not None else []
+
+        if self.inotify_fd is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                ready, _, _ = select.select([self.inotify_fd] + wake_fds, [], [], remaining)
+                if not ready:
+                    return False
+                if self.inotify_fd in ready and self.read_inotify_events():
+                    return True
+                if wake_fd in ready:
+                    return False
+
+        # Polling fallback
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if stat_signature(self.file_path) != self.last_signature:
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            sleep_for = self.poll_interval
+            if deadline is not None:
+                sleep_for = min(sleep_for, max(0.0, deadline - time.monotonic()))
+            ready, _, _ = select.select(wake_fds, [], [], sleep_for)
+            if ready:
+                return False
+
+    def wait_until_quiet(self):
+        """Wait until no change has been seen for debounce_seconds."""
+        if self.inotify_fd is not None:
+            while self.wait_for_event(self.debounce_seconds):
+                pass
+            return
+
+        signature = stat_signature(self.file_path)
+        while True:
+            time.sleep(self.debounce_seconds)
+            current = stat_signature(self.file_path)
+            if current == signature:
+                return
+            signature = current
+
+    def wait_for_change(
+        self, timeout: Optional[float] = None, wake_fd: Optional[int] = None
+    ) -> bool:
+        """Block until the file content changes or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            wake_fd: Optional file descriptor that ends the wait early when
+                it becomes readable (e.g. a completion socket)
+
+        Returns:
+            True if the content changed, False on timeout or wake-up
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self.wait_for_event(remaining, wake_fd):
+                return False
+
+            self.wait_until_quiet()
+            self.last_signature = stat_signature(self.file_path)
+            current_hash = hash_file(self.file_path)
+            if current_hash != self.last_hash:
+                self.last_hash = current_hash
+                return True
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
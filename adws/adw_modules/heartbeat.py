@@ -0,0 +1,184 @@
+"""Workflow heartbeats and orphaned task detection.
+
+A running workflow rewrites agents/<adw_id>/heartbeat.json every few
+seconds with its pid, host and boot ID. When the cron trigger or the host
+restarts, tasks marked [🟡, adw_id] have no supervised process behind them;
+the trigger reads their heartbeat to tell a workflow that is still running
+(e.g. started by another trigger) from one that died with the old process
+or the old boot, and resumes the dead ones within a per-task retry budget
+recorded in agents/<adw_id>/resume_attempts.json.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+from utils import atomic_write_text
+
+HEARTBEAT_JSON = "heartbeat.json"
+RESUME_ATTEMPTS_JSON = "resume_attempts.json"
+
+# How often a workflow refreshes its heartbeat
+HEARTBEAT_INTERVAL_SECONDS = 15
+
+# A heartbeat older than this marks the workflow as dead
+DEFAULT_STALE_AFTER_SECONDS = 90
+
+
+class Heartbeat(BaseModel):
+    """Liveness record written by a running workflow."""
+
+    adw_id: str
+    pid: int
+    hostname: str
+    boot_id: Optional[str] = None
+    started_at: float
+    updated_at: float
+    finished: bool = False
+
+
+def get_boot_id() -> Optional[str]:
+    """Identifier of the current boot, None where the OS does not expose one."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id", "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def get_heartbeat_path(adw_id: str, agents_dir: str = "./agents") -> str:
+    """Path of a workflow's heartbeat file."""
+    return os.path.join(agents_dir, adw_id, HEARTBEAT_JSON)
+
+
+def read_heartbeat(adw_id: str, agents_dir: str = "./agents") -> Optional[Heartbeat]:
+    """Read a workflow's heartbeat, None if it has not written one."""
+    try:
+        with open(get_heartbeat_path(adw_id, agents_dir), "r") as f:
+            return Heartbeat(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def pid_alive(pid: int) -> bool:
+    """Check if a process with this pid exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def heartbeat_is_stale(
+    heartbeat: Heartbeat, stale_after: float = DEFAULT_STALE_AFTER_SECONDS
+) -> bool:
+    """Check if the workflow behind a heartbeat is no longer running.
+
+    On the same host a reboot or a dead pid is conclusive right away; for
+    workflows on other hosts only the heartbeat age can be judged.
+    """
+    if heartbeat.finished:
+        return True
+    if heartbeat.hostname == socket.gethostname():
+        boot_id = get_boot_id()
+        if heartbeat.boot_id and boot_id and heartbeat.boot_id != boot_id:
+            return True
+        if not pid_alive(heartbeat.pid):
+            return True
+    return time.time() - heartbeat.updated_at > stale_after
+
+
+class HeartbeatWriter:
+    """Refreshes a workflow's heartbeat file from a background thread.
+
+    Example:
+        with HeartbeatWriter(adw_id):
+            run_phases()
+    """
+
+    def __init__(
+        self,
+        adw_id: str,
+        interval: float = HEARTBEAT_INTERVAL_SECONDS,
+        agents_dir: str = "./agents",
+    ):
+        self.path = get_heartbeat_path(adw_id, agents_dir)
+        self.interval = interval
+        self.heartbeat = Heartbeat(
+            adw_id=adw_id,
+            pid=os.getpid(),
+            hostname=socket.gethostname(),
+            boot_id=get_boot_id(),
+            started_at=time.time(),
+            updated_at=time.time(),
+        )
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def beat(self):
+        """Write the heartbeat with the current time."""
+        self.heartbeat.updated_at = time.time()
+        try:
+            atomic_write_text(self.path, self.heartbeat.model_dump_json(indent=2))
+        except OSError:
+            # A missed beat only matters if it lasts longer than the stale timeout
+            pass
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.beat()
+
+    def start(self):
+        """Write the first heartbeat and keep refreshing it."""
+        self.beat()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop refreshing and mark the workflow as finished."""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+        self.heartbeat.finished = True
+        self.beat()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+
+def load_resume_attempts(adw_id: str, agents_dir: str = "./agents") -> int:
+    """Number of times the task with this ADW ID was resumed after a crash."""
+    try:
+        with open(os.path.join(agents_dir, adw_id, RESUME_ATTEMPTS_JSON), "r") as f:
+            return int(json.load(f).get("attempts", 0))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+def record_resume_attempt(adw_id: str, reason: str, agents_dir: str = "./agents") -> int:
+    """Count one more resume of this task; the budget survives trigger restarts.
+
+    Returns:
+        The new attempt count
+    """
+    attempts = load_resume_attempts(adw_id, agents_dir) + 1
+    atomic_write_text(
+        os.path.join(agents_dir, adw_id, RESUME_ATTEMPTS_JSON),
+        json.dumps(
+            {"attempts": attempts, "last_reason": reason, "updated_at": time.time()},
+            indent=2,
+        ),
+    )
+    return attempts
@@ -0,0 +1,132 @@
+"""Load-aware admission control for the cron trigger.
+
+Before each dispatch the trigger checks the load average, available memory
+and the number of running Claude Code processes. The load average and free
+memory lag behind a fresh launch, so every task admitted in the current
+cycle is charged an estimated cost (task_load, task_memory_mb) against the
+sampled headroom. Big hosts therefore ramp up to many tasks per cycle while
+small ones stop before they start thrashing.
+"""
+
+import os
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+
+from agent import AGENT_SLOTS
+from data_models import CronTriggerConfig
+
+
+class HostSnapshot(BaseModel):
+    """Host resource usage sampled at the start of a dispatch cycle."""
+
+    cpu_count: int
+    load_average: Optional[float] = None  # 1-minute load average
+    available_memory_mb: Optional[float] = None
+    agent_processes: int = 0
+
+    @property
+    def load_per_cpu(self) -> Optional[float]:
+        """1-minute load average normalised by CPU count."""
+        if self.load_average is None:
+            return None
+        return self.load_average / self.cpu_count
+
+
+def get_load_average() -> Optional[float]:
+    """1-minute load average, or None where the OS does not report one."""
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+def get_available_memory_mb() -> Optional[float]:
+    """Memory available for new processes in MiB, or None if unknown."""
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    # Non-Linux fallback: free pages only, which underestimates reclaimable cache
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def sample_host() -> HostSnapshot:
+    """Sample current host load, memory and running agent count."""
+    return HostSnapshot(
+        cpu_count=os.cpu_count() or 1,
+        load_average=get_load_average(),
+        available_memory_mb=get_available_memory_mb(),
+        agent_processes=AGENT_SLOTS.count_held("global"),
+    )
+
+
+class AdmissionController:
+    """Decides whether the host has headroom for another workflow."""
+
+    def __init__(self, config: CronTriggerConfig):
+        self.config = config
+        self.snapshot: Optional[HostSnapshot] = None
+        self.admitted = 0
+
+    def begin_cycle(self) -> HostSnapshot:
+        """Sample the host at the start of a dispatch cycle."""
+        self.snapshot = sample_host()
+        self.admitted = 0
+        return self.snapshot
+
+    def admit(self) -> Tuple[bool, Optional[str]]:
+        """Check if one more workflow may start in this cycle.
+
+        Returns:
+            Tuple of (admitted, reason the task was deferred)
+        """
+        if not self.config.admission_control:
+            return True, None
+        if self.snapshot is None:
+            self.begin_cycle()
+
+        snapshot = self.snapshot
+        pending = self.admitted + 1
+
+        if snapshot.load_average is not None:
+            projected_load = (
+                snapshot.load_average + pending * self.config.task_load
+            ) / snapshot.cpu_count
+            # Always allow one task per cycle on an otherwise idle box
+            if projected_load > self.config.max_load_per_cpu and (
+                self.admitted > 0 or snapshot.load_per_cpu >= self.config.max_load_per_cpu
+            ):
+                return False, (
+                    f"projected load {projected_load:.2f} per CPU with {pending} task(s) "
+                    f"this cycle (load {snapshot.load_average:.1f} on {snapshot.cpu_count} "
+                    f"CPUs, max {self.config.max_load_per_cpu:.1f} per CPU)"
+                )
+
+        if snapshot.available_memory_mb is not None:
+            projected_memory = (
+                snapshot.available_memory_mb - pending * self.config.task_memory_mb
+            )
+            if projected_memory < self.config.min_available_memory_mb:
+                return False, (
+                    f"projected {projected_memory:.0f} MiB free with {pending} task(s) "
+                    f"this cycle ({snapshot.available_memory_mb:.0f} MiB available, "
+                    f"keeping {self.config.min_available_memory_mb} MiB free)"
+                )
+
+        if self.config.max_agent_processes is not None:
+            if snapshot.agent_processes + pending > self.config.max_agent_processes:
+                return False, (
+                    f"{snapshot.agent_processes} Claude Code processes running with "
+                    f"{pending} task(s) this cycle (max {self.config.max_agent_processes})"
+                )
+
+        self.admitted += 1
+        return True, None
@@ -0,0 +1,493 @@
+"""Declarative phase engine shared by the ADW workflows.
+
+A workflow declares its agent phases and the phases each one depends on.
+The engine runs every phase as soon as its dependencies have succeeded, so
+independent phases (e.g. a validation or test phase next to the build) run
+concurrently, and skips phases whose dependencies failed. It also owns the
+parts every phase repeated by hand: the inputs and result panels, timing,
+and the custom_summary_output.json written next to the agent's raw output.
+
+Phases exchange data through PhaseContext.outputs: a phase's collect hook
+returns values parsed from its output (such as the plan path), which later
+phases read when building their slash command args.
+
+With PhaseContext.resume set, a phase whose summary from an earlier run of
+the same ADW ID records success is not run again: its outputs and session
+ID are restored from the summary, so a crashed workflow continues from its
+first incomplete phase.
+
+Example:
+    phases = [
+        AgentPhase(name="planning", title="Planning", slash_command="/plan",
+                   agent_name="planner", args=lambda ctx: [ctx.adw_id, task],
+                   collect=collect_plan_path),
+        AgentPhase(name="implementation", title="Implementation",
+                   slash_command="/implement", agent_name="builder",
+                   depends_on=["planning"], resume_from="planning",
+                   args=lambda ctx: [ctx.outputs["plan_path"]]),
+    ]
+    results = PhaseEngine(phases, console).run(context)
+"""
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+from rich.console import Console
+from rich.panel import Panel
+from rich.rule import Rule
+from rich.table import Table
+
+from agent import (
+    AgentPromptResponse,
+    AgentTemplateRequest,
+    OUTPUT_JSON,
+    OUTPUT_JSONL,
+    FINAL_OBJECT_JSON,
+    SUMMARY_JSON,
+    execute_template,
+)
+
+
+class PhaseResult(BaseModel):
+    """Outcome of one workflow phase."""
+
+    name: str = Field(..., description="Phase name, e.g. 'build' or 'update_task'")
+    agent_name: str = Field(..., description="Agent whose output directory holds the phase")
+    slash_command: Optional[str] = Field(
+        None, description="Slash command run by the phase, None for native phases"
+    )
+    success: bool = Field(..., description="Whether the phase succeeded")
+    skipped: bool = Field(False, description="Phase did not run because a dependency failed")
+    restored: bool = Field(False, description="Phase was restored from an earlier run's checkpoint")
+    response: Optional[AgentPromptResponse] = Field(
+        None, description="Claude Code response for agent phases"
+    )
+    output: Optional[str] = Field(None, description="Result or error message")
+    error_message: Optional[str] = Field(None, description="Why the phase failed")
+    outputs: Dict[str, Any] = Field(
+        default_factory=dict, description="Values the phase passed on to later phases"
+    )
+    started_at: datetime = Field(
+        default_factory=datetime.now, description="Phase start time"
+    )
+    duration_seconds: float = Field(0, description="Wall-clock run time in seconds")
+
+
+class PhaseContext(BaseModel):
+    """State shared by the phases of one workflow run."""
+
+    adw_id: str
+    label: str  # Worktree name or other run label shown in the panels
+    model: str
+    working_dir: str
+    deadline: Optional[float] = None
+    verbose: bool = False
+    resume_sessions: bool = True
+    show_output_files: bool = False
+    resume: bool = False  # Restore phases that completed in an earlier run
+    summary_fields: Dict[str, Any] = Field(
+        default_factory=dict, description="Extra fields written to every phase summary"
+    )
+    outputs: Dict[str, Any] = Field(default_factory=dict)
+    results: Dict[str, PhaseResult] = Field(default_factory=dict)
+
+
+class AgentPhase(BaseModel):
+    """A slash command phase and the phases it depends on."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str = Field(..., description="Phase name, used for depends_on and the summaries")
+    title: str = Field(..., description="Display title, e.g. 'Planning'")
+    slash_command: str
+    agent_name: str
+    args: Callable[[PhaseContext], List[str]] = Field(
+        ..., description="Builds the slash command args from the context"
+    )
+    depends_on: List[str] = Field(default_factory=list)
+    resume_from: Optional[str] = Field(
+        None, description="Phase whose Claude Code session this phase continues"
+    )
+    collect: Optional[Callable[[PhaseContext, AgentPromptResponse], Dict[str, Any]]] = Field(
+        None,
+        description="Parses outputs for later phases after success; raise ValueError to fail the phase",
+    )
+    success_message: Optional[str] = Field(
+        None, description="Shown instead of the agent output unless verbose"
+    )
+    verify_checkpoint: Optional[Callable[[PhaseContext, Dict[str, Any]], bool]] = Field(
+        None,
+        description="Checks restored outputs are still usable (e.g. the plan file exists) before skipping the phase",
+    )
+
+
+def print_status_panel(console, action: str, adw_id: str, worktree: str, phase: str = None, status: str = "info"):
+    """Print a status panel with timestamp and context.
+
+    Args:
+        console: Rich console instance
+        action: The action being performed
+        adw_id: ADW ID for tracking
+        worktree: Worktree/branch name
+        phase: Optional phase name (build, plan, etc)
+        status: Status type (info, success, error)
+    """
+    timestamp = datetime.now().strftime("%H:%M:%S")
+
+    # Choose color based on status
+    if status == "success":
+        border_style = "green"
+        icon = "✅"
+    elif status == "error":
+        border_style = "red"
+        icon = "❌"
+    else:
+        border_style = "cyan"
+        icon = "🔄"
+
+    # Build title with context
+    title_parts = [f"[{timestamp}]", adw_id[:6], worktree]
+    if phase:
+        title_parts.append(phase)
+    title = " | ".join(title_parts)
+
+    console.print(
+        Panel(
+            f"{icon} {action}",
+            title=f"[bold {border_style}]{title}[/bold {border_style}]",
+            border_style=border_style,
+            padding=(0, 1),
+        )
+    )
+
+
+def write_summary(output_dir: str, file_name: str, summary: dict) -> str:
+    """Write a phase or workflow summary JSON file and return its path."""
+    os.makedirs(output_dir, exist_ok=True)
+    summary_path = os.path.join(output_dir, file_name)
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary_path
+
+
+def run_template_phase(name: str, request: AgentTemplateRequest) -> PhaseResult:
+    """Execute a slash command and time it."""
+    started_at = datetime.now()
+    started = time.monotonic()
+    response = execute_template(request)
+    return PhaseResult(
+        name=name,
+        agent_name=request.agent_name,
+        slash_command=request.slash_command,
+        success=response.success,
+        response=response,
+        output=response.output,
+        started_at=started_at,
+        duration_seconds=round(time.monotonic() - started, 3),
+    )
+
+
+class PhaseEngine:
+    """Runs a set of agent phases in dependency order, concurrently where possible."""
+
+    def __init__(self, phases: List[AgentPhase], console: Optional[Console] = None):
+        self.phases = phases
+        self.console = console or Console()
+        self.validate()
+
+    def validate(self):
+        """Reject duplicate names, unknown dependencies and dependency cycles."""
+        names = [phase.name for phase in self.phases]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate phase names: {names}")
+
+        by_name = {phase.name: phase for phase in self.phases}
+        for phase in self.phases:
+            for dependency in phase.depends_on + ([phase.resume_from] if phase.resume_from else []):
+                if dependency not in by_name:
+                    raise ValueError(f"Phase '{phase.name}' depends on unknown phase '{dependency}'")
+            if phase.resume_from and phase.resume_from not in phase.depends_on:
+                raise ValueError(
+                    f"Phase '{phase.name}' resumes '{phase.resume_from}' without depending on it"
+                )
+
+        # Kahn's algorithm: every phase must become ready eventually
+        remaining = {phase.name: set(phase.depends_on) for phase in self.phases}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle between phases: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def run(self, context: PhaseContext) -> List[PhaseResult]:
+        """Run all phases and return their results in declaration order."""
+        pending = list(self.phases)
+
+        with ThreadPoolExecutor(max_workers=max(1, len(self.phases))) as executor:
+            running = {}
+            while pending or running:
+                for phase in list(pending):
+                    if not all(dep in context.results for dep in phase.depends_on):
+                        continue
+                    pending.remove(phase)
+                    failed = [dep for dep in phase.depends_on if not context.results[dep].success]
+                    if failed:
+                        context.results[phase.name] = self.skip_phase(phase, failed, context)
+                        continue
+
+                    # A phase whose dependencies ran again must run again too
+                    checkpoint = None
+                    if context.resume and all(context.results[dep].restored for dep in phase.depends_on):
+                        checkpoint = self.load_checkpoint(phase, context)
+                    if checkpoint:
+                        context.outputs.update(checkpoint.outputs)
+                        context.results[phase.name] = checkpoint
+                    else:
+                        running[executor.submit(self.run_phase, phase, context)] = phase
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    phase = running.pop(future)
+                    result = future.result()
+                    context.outputs.update(result.outputs)
+                    context.results[phase.name] = result
+
+        return [context.results[phase.name] for phase in self.phases]
+
+    def phase_number(self, phase: AgentPhase) -> int:
+        """1-based position of the phase in the declaration."""
+        return self.phases.index(phase) + 1
+
+    def load_checkpoint(self, phase: AgentPhase, context: PhaseContext) -> Optional[PhaseResult]:
+        """Restore a phase that succeeded in an earlier run of this ADW ID.
+
+        Returns:
+            The restored result, or None if the phase has to run
+        """
+        summary_path = os.path.join("./agents", context.adw_id, phase.agent_name, SUMMARY_JSON)
+        try:
+            with open(summary_path, "r") as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if summary.get("phase") != phase.name or not summary.get("success"):
+            return None
+
+        outputs = {key: summary.get(key) for key in summary.get("output_keys", [])}
+        if phase.verify_checkpoint and not phase.verify_checkpoint(context, outputs):
+            return None
+
+        self.console.print()
+        self.console.print(
+            Panel(
+                f"[green]⏩ {phase.title} ({phase.slash_command}) already completed, "
+                f"restored from {summary_path}[/green]",
+                title=f"[bold green]{phase.title} Restored | {context.adw_id} | {context.label}[/bold green]",
+                border_style="green",
+            )
+        )
+        return PhaseResult(
+            name=phase.name,
+            agent_name=phase.agent_name,
+            slash_command=phase.slash_command,
+            success=True,
+            restored=True,
+            response=AgentPromptResponse(
+                output="Restored from checkpoint",
+                success=True,
+                session_id=summary.get("session_id"),
+            ),
+            output="Restored from checkpoint",
+            outputs=outputs,
+        )
+
+    def skip_phase(self, phase: AgentPhase, failed: List[str], context: PhaseContext) -> PhaseResult:
+        """Record a phase that cannot run because a dependency failed."""
+        reason = ", ".join(failed)
+        self.console.print()
+        self.console.print(
+            Panel(
+                f"[yellow]⏭️  Skipping {phase.name} phase due to {reason} errors[/yellow]",
+                title=f"[bold yellow]{phase.title} Skipped[/bold yellow]",
+                border_style="yellow",
+            )
+        )
+        return PhaseResult(
+            name=phase.name,
+            agent_name=phase.agent_name,
+            slash_command=phase.slash_command,
+            success=False,
+            skipped=True,
+            output=f"Skipped ({reason} failed)",
+            error_message=f"Skipped because {reason} failed",
+        )
+
+    def run_phase(self, phase: AgentPhase, context: PhaseContext) -> PhaseResult:
+        """Run one agent phase: panels, execution, outputs and summary."""
+        console = self.console
+        adw_id = context.adw_id
+        label = context.label
+        args = phase.args(context)
+
+        resume_session_id = None
+        if phase.resume_from and context.resume_sessions:
+            resume_session_id = context.results[phase.resume_from].response.session_id
+
+        request = AgentTemplateRequest(
+            agent_name=phase.agent_name,
+            slash_command=phase.slash_command,
+            args=args,
+            adw_id=adw_id,
+            model=context.model,
+            working_dir=context.working_dir,
+            deadline=context.deadline,
+            resume_session_id=resume_session_id,
+        )
+
+        console.print()
+        console.print(Rule(
+            f"[bold yellow]Phase {self.phase_number(phase)}: "
+            f"{phase.title} ({phase.slash_command})[/bold yellow]"
+        ))
+        console.print()
+
+        # Display execution info
+        info_table = Table(show_header=False, box=None, padding=(0, 1))
+        info_table.add_column(style="bold cyan")
+        info_table.add_column()
+
+        info_table.add_row("ADW ID", adw_id)
+        info_table.add_row("Phase", phase.title)
+        info_table.add_row("Command", phase.slash_command)
+        info_table.add_row("Args", " ".join(f'"{a}"' if " " in a else a for a in args))
+        info_table.add_row("Model", context.model)
+        info_table.add_row("Agent", phase.agent_name)
+        if resume_session_id:
+            info_table.add_row("Resumes", resume_session_id)
+
+        console.print(
+            Panel(
+                info_table,
+                title=f"[bold blue]🚀 {phase.title} Inputs | {adw_id} | {label}[/bold blue]",
+                border_style="blue",
+            )
+        )
+        console.print()
+
+        print_status_panel(console, f"Starting {phase.title.lower()}", adw_id, label, phase.name)
+        result = run_template_phase(phase.name, request)
+        response = result.response
+        print_status_panel(console, f"Completed {phase.title.lower()}", adw_id, label, phase.name, "success")
+
+        if response.success:
+            console.print(
+                Panel(
+                    response.output if context.verbose or not phase.success_message else phase.success_message,
+                    title=f"[bold green]✅ {phase.title} Success | {adw_id} | {label}[/bold green]",
+                    border_style="green",
+                    padding=(1, 2),
+                )
+            )
+            if phase.collect:
+                try:
+                    result.outputs = phase.collect(context, response)
+                except ValueError as e:
+                    result.success = False
+                    result.error_message = str(e)
+                    console.print(
+                        Panel(
+                            f"[bold red]{result.error_message}[/bold red]\n\n"
+                            f"The {phase.slash_command} command succeeded but its output could not be used.\n"
+                            "Stopping dependent phases.",
+                            title=f"[bold red]❌ Critical Error - {phase.title} Output[/bold red]",
+                            border_style="red",
+                        )
+                    )
+        else:
+            result.error_message = f"{phase.title} phase failed"
+            console.print(
+                Panel(
+                    response.output,
+                    title=f"[bold red]❌ {phase.title} Failed | {adw_id} | {label}[/bold red]",
+                    border_style="red",
+                    padding=(1, 2),
+                )
+            )
+
+        # Save phase summary next to the agent's raw output
+        output_dir = f"./agents/{adw_id}/{phase.agent_name}"
+        summary_path = write_summary(
+            output_dir,
+            SUMMARY_JSON,
+            {
+                "phase": phase.name,
+                "adw_id": adw_id,
+                **context.summary_fields,
+                "slash_command": phase.slash_command,
+                "args": args,
+                "path_to_slash_command_prompt": f".claude/commands/{phase.slash_command.lstrip('/')}.md",
+                "model": context.model,
+                "working_dir": context.working_dir,
+                "success": result.success,
+                "session_id": response.session_id,
+                "resumed_session_id": resume_session_id,
+                "retry_code": response.retry_code,
+                "duration_seconds": result.duration_seconds,
+                **result.outputs,
+                "output_keys": list(result.outputs),
+            },
+        )
+
+        if context.show_output_files:
+            self.print_output_files(phase, output_dir, summary_path)
+
+        return result
+
+    def print_output_files(self, phase: AgentPhase, output_dir: str, summary_path: str):
+        """Show where the phase's raw output and summary were written."""
+        files_table = Table(show_header=True, box=None)
+        files_table.add_column("File Type", style="bold cyan")
+        files_table.add_column("Path", style="dim")
+        files_table.add_column("Description", style="italic")
+
+        files_table.add_row(
+            "JSONL Stream",
+            f"{output_dir}/{OUTPUT_JSONL}",
+            "Raw streaming output from Claude Code",
+        )
+        files_table.add_row(
+            "JSON Array",
+            f"{output_dir}/{OUTPUT_JSON}",
+            "All messages as a JSON array",
+        )
+        files_table.add_row(
+            "Final Object",
+            f"{output_dir}/{FINAL_OBJECT_JSON}",
+            "Last message entry (final result)",
+        )
+        files_table.add_row(
+            "Summary",
+            summary_path,
+            "High-level execution summary with metadata",
+        )
+
+        self.console.print()
+        self.console.print(
+            Panel(
+                files_table,
+                title=f"[bold blue]📄 {phase.title} Output Files[/bold blue]",
+                border_style="blue",
+            )
+        )
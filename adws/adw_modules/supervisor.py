@@ -0,0 +1,242 @@
+"""Child process supervision for the cron trigger.
+
+Keeps the Popen handle of every delegated workflow so the trigger can
+admit new tasks based on how many are actually running, and records the
+exit code and wall time of each finished run. Runs launched with a
+wall-clock budget are killed, together with every process they spawned,
+once they overrun it.
+"""
+
+import os
+import signal
+import subprocess
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from data_models import WorkflowRun
+
+# Seconds a process tree gets to exit after SIGTERM before it is SIGKILLed
+KILL_GRACE_SECONDS = 10
+
+
+def get_child_pids() -> Dict[int, List[int]]:
+    """Map each parent pid to the pids of its children."""
+    children: Dict[int, List[int]] = defaultdict(list)
+    if os.path.isdir("/proc"):
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "r") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # The command name may contain spaces, the fields after it do not
+            ppid = int(stat.rsplit(")", 1)[1].split()[1])
+            children[ppid].append(int(entry))
+        return children
+
+    try:
+        output = subprocess.run(
+            ["ps", "-A", "-o", "pid=,ppid="], capture_output=True, text=True
+        ).stdout
+    except OSError:
+        return children
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) == 2:
+            children[int(fields[1])].append(int(fields[0]))
+    return children
+
+
+def get_process_tree(pid: int) -> List[int]:
+    """The pid and all of its descendants, parents before children."""
+    children = get_child_pids()
+    tree = [pid]
+    for parent in tree:
+        tree.extend(children.get(parent, []))
+    return tree
+
+
+def signal_pids(pids: List[int], sig: int) -> List[int]:
+    """Send a signal to each pid, returning the ones that still existed."""
+    alive = []
+    for pid in pids:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            continue
+        except PermissionError:
+            pass
+        alive.append(pid)
+    return alive
+
+
+def terminate_process_tree(process: subprocess.Popen) -> List[int]:
+    """Send SIGTERM to a process and everything it spawned, without waiting.
+
+    Agents run the Claude Code CLI in their own process groups, so killing
+    the workflow's group is not enough; the tree is collected before the
+    signal, while children can still be found through their parent.
+
+    Returns:
+        The pids that were signalled, for kill_survivors after the grace period
+    """
+    return signal_pids(get_process_tree(process.pid), signal.SIGTERM)
+
+
+def kill_survivors(process: subprocess.Popen, tree: List[int]) -> List[int]:
+    """SIGKILL the processes of a terminated tree that are still running.
+
+    The workflow process itself is skipped once it has exited, since its pid
+    is free for reuse after it has been waited for.
+
+    Returns:
+        The pids that were killed
+    """
+    remaining = tree[1:] if process.poll() is not None else tree
+    return signal_pids(remaining, signal.SIGKILL)
+
+
+class WorkflowSupervisor:
+    """Tracks delegated workflow processes by ADW ID."""
+
+    def __init__(self, max_history: int = 1000):
+        self.max_history = max_history
+        self.processes: Dict[str, subprocess.Popen] = {}
+        self.runs: "OrderedDict[str, WorkflowRun]" = OrderedDict()
+        self.start_times: Dict[str, float] = {}
+        # Terminated runs awaiting SIGKILL: (process, tree, time.monotonic() deadline)
+        self.terminating: Dict[str, Tuple[subprocess.Popen, List[int], float]] = {}
+
+    def launch(
+        self,
+        adw_id: str,
+        cmd: List[str],
+        worktree_name: str,
+        task_description: str,
+        budget_seconds: Optional[float] = None,
+        **popen_kwargs,
+    ) -> WorkflowRun:
+        """Start a workflow process and begin tracking it.
+
+        Args:
+            adw_id: ADW ID of the task
+            cmd: Command line to execute
+            worktree_name: Worktree the task runs in
+            task_description: Task being processed
+            budget_seconds: Wall-clock budget enforced by kill_expired, None for no limit
+            **popen_kwargs: Extra arguments passed to subprocess.Popen
+
+        Returns:
+            The WorkflowRun record for the new process
+        """
+        process = subprocess.Popen(cmd, **popen_kwargs)
+        return self.adopt(
+            adw_id, process, worktree_name, task_description, budget_seconds
+        )
+
+    def adopt(
+        self,
+        adw_id: str,
+        process: subprocess.Popen,
+        worktree_name: str,
+        task_description: str,
+        budget_seconds: Optional[float] = None,
+    ) -> WorkflowRun:
+        """Begin tracking a workflow process started elsewhere, e.g. a pool worker."""
+        run = WorkflowRun(
+            adw_id=adw_id,
+            worktree_name=worktree_name,
+            task_description=task_description,
+            pid=process.pid,
+            budget_seconds=budget_seconds,
+        )
+        self.processes[adw_id] = process
+        self.start_times[adw_id] = time.monotonic()
+        self.record_run(run)
+        return run
+
+    def reap(self) -> List[WorkflowRun]:
+        """Collect exited processes without blocking.
+
+        Returns:
+            Runs that finished since the last call
+        """
+        finished = []
+        for adw_id, process in list(self.processes.items()):
+            exit_code = process.poll()
+            if exit_code is None:
+                continue
+
+            run = self.runs[adw_id]
+            run.exit_code = exit_code
+            run.finished_at = datetime.now()
+            run.duration_seconds = round(
+                time.monotonic() - self.start_times.pop(adw_id), 3
+            )
+            del self.processes[adw_id]
+            finished.append(run)
+
+        return finished
+
+    def kill_expired(self) -> List[WorkflowRun]:
+        """Stop running workflows that have overrun their wall-clock budget.
+
+        Never blocks: an overrunning tree is sent SIGTERM, and whatever is
+        left of it KILL_GRACE_SECONDS later is SIGKILLed by a later call. The
+        killed runs stay tracked until reap() sees their exit, which records
+        the exit code and frees their slot.
+
+        Returns:
+            Runs that were newly terminated
+        """
+        now = time.monotonic()
+        for adw_id, (process, tree, kill_at) in list(self.terminating.items()):
+            if now >= kill_at:
+                kill_survivors(process, tree)
+                del self.terminating[adw_id]
+
+        killed = []
+        for adw_id, process in list(self.processes.items()):
+            run = self.runs[adw_id]
+            if run.budget_seconds is None or run.timed_out:
+                continue
+            if now - self.start_times[adw_id] < run.budget_seconds:
+                continue
+
+            tree = terminate_process_tree(process)
+            self.terminating[adw_id] = (process, tree, now + KILL_GRACE_SECONDS)
+            run.timed_out = True
+            killed.append(run)
+
+        return killed
+
+    def running_count(self) -> int:
+        """Number of workflow processes still running."""
+        return len(self.processes)
+
+    def has_capacity(self, max_concurrent: int) -> bool:
+        """Check if another workflow can be started."""
+        return self.running_count() < max_concurrent
+
+    def get_running(self) -> List[WorkflowRun]:
+        """Runs whose process has not exited yet."""
+        return [self.runs[adw_id] for adw_id in self.processes]
+
+    def get_run(self, adw_id: str) -> Optional[WorkflowRun]:
+        """Look up a run, running or finished, by ADW ID."""
+        return self.runs.get(adw_id)
+
+    def record_run(self, run: WorkflowRun):
+        """Add a run to the history, dropping the oldest finished runs."""
+        self.runs[run.adw_id] = run
+        while len(self.runs) > self.max_history:
+            oldest = next(
+                (a for a, r in self.runs.items() if not r.is_running()), None
+            )
+            if oldest is None:
+                break
+            del self.runs[oldest]
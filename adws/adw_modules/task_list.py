@@ -0,0 +1,364 @@
+"""Native tasks.md parsing for the multi-agent task list.
+
+Turns the markdown task list into the Worktree/Task models and rewrites task
+status tokens in place, without going through a Claude Code session. The
+format is:
+
+    ## Git Worktree <name>
+    [] Pending task {tag1, tag2}
+    [⏰] Blocked task
+    [🟡, <adw_id>] Task in progress
+    [✅ <commit_hash>, <adw_id>] Completed task
+    [❌, <adw_id>] Failed task // Failed: <reason>
+"""
+
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from data_models import Task, Worktree, WorktreeTaskGroup, TaskToStart, TaskUpdate
+from utils import atomic_write_text, file_lock
+
+# "## Git Worktree <name>" section header
+WORKTREE_HEADER_PATTERN = re.compile(r"^##\s+Git\s+Worktree\s+(?P<name>\S+)\s*$")
+
+# "[<status token>] <rest of line>"
+TASK_LINE_PATTERN = re.compile(r"^\s*\[(?P<token>[^\]]*)\]\s*(?P<rest>.*?)\s*$")
+
+# "{tag1, tag2}" tag block inside the description
+TAG_BLOCK_PATTERN = re.compile(r"\{(?P<tags>[^{}]*)\}")
+
+# Separator between a failed task description and its error reason
+ERROR_SEPARATOR = " // "
+
+STATUS_EMOJIS = {
+    "⏰": "[⏰]",
+    "🟡": "[🟡]",
+    "✅": "[✅]",
+    "❌": "[❌]",
+}
+
+
+def parse_status_token(token: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    """Parse the contents of a status bracket.
+
+    Args:
+        token: Text between the square brackets, e.g. "✅ abc123, 17b93f48"
+
+    Returns:
+        Tuple of (status, commit_hash, adw_id), or None if the token is not a
+        recognised task status
+    """
+    # Drop emoji variation selectors so "✅️" and "✅" compare equal
+    token = token.replace("\ufe0f", "").strip()
+    if not token:
+        return "[]", None, None
+
+    emoji = token[0]
+    status = STATUS_EMOJIS.get(emoji)
+    if status is None:
+        return None
+
+    parts = [p for p in re.split(r"[,\s]+", token[1:]) if p]
+    commit_hash = None
+    adw_id = None
+
+    if status == "[✅]":
+        # [✅ <commit_hash>, <adw_id>]
+        if parts:
+            commit_hash = parts[0]
+        if len(parts) > 1:
+            adw_id = parts[1]
+    elif parts:
+        # [🟡, <adw_id>] / [❌, <adw_id>]
+        adw_id = parts[0]
+
+    return status, commit_hash, adw_id
+
+
+def split_tags(text: str) -> Tuple[str, List[str]]:
+    """Split a "{tag1, tag2}" block out of a task description.
+
+    Returns:
+        Tuple of (description_without_tags, tags)
+    """
+    matches = list(TAG_BLOCK_PATTERN.finditer(text))
+    if not matches:
+        return text.strip(), []
+
+    # The tag block is conventionally the last {...} on the line
+    match = matches[-1]
+    tags = [t.strip() for t in match.group("tags").split(",") if t.strip()]
+    description = text[: match.start()] + text[match.end() :]
+    description = re.sub(r"\s+", " ", description).strip()
+    return description, tags
+
+
+def parse_task_line(line: str, worktree_name: Optional[str] = None) -> Optional[Task]:
+    """Parse a single task line into a Task, or None if it is not a task."""
+    match = TASK_LINE_PATTERN.match(line)
+    if not match:
+        return None
+
+    parsed = parse_status_token(match.group("token"))
+    if parsed is None:
+        return None
+    status, commit_hash, adw_id = parsed
+
+    rest = match.group("rest")
+    if status == "[❌]" and ERROR_SEPARATOR in rest:
+        rest = rest.split(ERROR_SEPARATOR, 1)[0]
+
+    description, tags = split_tags(rest)
+    if not description:
+        return None
+
+    return Task(
+        description=description,
+        status=status,
+        adw_id=adw_id,
+        commit_hash=commit_hash,
+        tags=tags,
+        worktree_name=worktree_name,
+    )
+
+
+def parse_task_list(content: str) -> List[Worktree]:
+    """Parse the full tasks.md content into worktrees, in file order.
+
+    Lines outside a "## Git Worktree" section and lines that are not tasks
+    are ignored.
+    """
+    worktrees: List[Worktree] = []
+    current: Optional[Worktree] = None
+
+    for line in content.splitlines():
+        header = WORKTREE_HEADER_PATTERN.match(line.strip())
+        if header:
+            current = Worktree(name=header.group("name"))
+            worktrees.append(current)
+            continue
+
+        if line.lstrip().startswith("#"):
+            # Any other heading closes the current worktree section
+            current = None
+            continue
+
+        if current is None:
+            continue
+
+        task = parse_task_line(line, current.name)
+        if task:
+            current.tasks.append(task)
+
+    return worktrees
+
+
+def get_eligible_task_groups(worktrees: List[Worktree]) -> List[WorktreeTaskGroup]:
+    """Build the task groups to start, applying the blocking rules.
+
+    Produces the same structure the /process_tasks command returns.
+    """
+    groups = []
+    for worktree in worktrees:
+        eligible = worktree.get_eligible_tasks()
+        if eligible:
+            groups.append(
+                WorktreeTaskGroup(
+                    worktree_name=worktree.name,
+                    tasks_to_start=[
+                        TaskToStart(description=t.description, tags=t.tags)
+                        for t in eligible
+                    ],
+                )
+            )
+    return groups
+
+
+def format_status_token(
+    status: str, commit_hash: Optional[str] = None, adw_id: Optional[str] = None
+) -> str:
+    """Format a status bracket, e.g. "[✅ abc123, 17b93f48]"."""
+    if status in ("[]", "[⏰]"):
+        return status
+    emoji = status[1:-1]
+    if status == "[✅]":
+        return f"[{emoji} {commit_hash or ''}, {adw_id or ''}]"
+    return f"[{emoji}, {adw_id or ''}]"
+
+
+def rewrite_task_line(
+    line: str, token: str, error_message: Optional[str] = None
+) -> str:
+    """Replace the status bracket of a task line, keeping its description and tags.
+
+    Args:
+        line: Original task line, including its line ending
+        token: New status bracket from format_status_token()
+        error_message: Failure reason appended as " // Failed: <reason>"
+
+    Returns:
+        Rewritten line with the original indentation and line ending
+    """
+    body = line.rstrip("\r\n")
+    ending = line[len(body) :]
+    indent = body[: len(body) - len(body.lstrip())]
+
+    match = TASK_LINE_PATTERN.match(body)
+    rest = match.group("rest") if match else body.strip()
+    # Drop any previous failure reason before writing the new status
+    if ERROR_SEPARATOR in rest:
+        rest = rest.split(ERROR_SEPARATOR, 1)[0].rstrip()
+
+    new_line = f"{indent}{token} {rest}"
+    if error_message:
+        reason = " ".join(error_message.split())
+        new_line += f"{ERROR_SEPARATOR}Failed: {reason}"
+    return new_line + ending
+
+
+class TaskListManager:
+    """Manages reading and updating the task list file.
+
+    Status updates hold an exclusive lock on "<task file>.lock" and replace
+    the file atomically, so concurrent workflows never lose each other's
+    updates.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = Path(file_path)
+        self.lock_path = self.file_path.with_name(f"{self.file_path.name}.lock")
+
+    def read_task_list(self) -> str:
+        """Read the current task list file."""
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"Task file not found: {self.file_path}")
+        return self.file_path.read_text()
+
+    def write_task_list(self, content: str):
+        """Write updated content back to the task list file."""
+        with file_lock(str(self.lock_path)):
+            atomic_write_text(str(self.file_path), content)
+
+    def get_worktrees(self) -> List[Worktree]:
+        """Parse the task list file into worktrees and their tasks."""
+        return parse_task_list(self.read_task_list())
+
+    def find_task(self, adw_id: str) -> Optional[Task]:
+        """Find a task by the ADW ID recorded in its status token."""
+        for worktree in self.get_worktrees():
+            for task in worktree.tasks:
+                if task.adw_id == adw_id:
+                    return task
+        return None
+
+    def find_task_line(
+        self,
+        lines: List[str],
+        worktree_name: str,
+        task_desc: Optional[str] = None,
+        adw_id: Optional[str] = None,
+        allowed_statuses: Optional[List[str]] = None,
+    ) -> Optional[int]:
+        """Find the index of a task line by adw_id or by worktree + description.
+
+        An adw_id match wins over a description match. Only tasks inside the
+        given worktree section whose status is in allowed_statuses (any status
+        if None) are considered.
+        """
+        current_worktree = None
+        description_match = None
+
+        for index, line in enumerate(lines):
+            header = WORKTREE_HEADER_PATTERN.match(line.strip())
+            if header:
+                current_worktree = header.group("name")
+                continue
+            if line.lstrip().startswith("#"):
+                current_worktree = None
+                continue
+            if current_worktree != worktree_name:
+                continue
+
+            task = parse_task_line(line, current_worktree)
+            if task is None:
+                continue
+            if allowed_statuses is not None and task.status not in allowed_statuses:
+                continue
+
+            if adw_id and task.adw_id == adw_id:
+                return index
+            if (
+                description_match is None
+                and task_desc is not None
+                and task.description == split_tags(task_desc)[0]
+            ):
+                description_match = index
+
+        return description_match
+
+    def update_task_status(
+        self,
+        worktree_name: str,
+        task_desc: Optional[str],
+        status: str,
+        adw_id: Optional[str] = None,
+        commit_hash: Optional[str] = None,
+        error_message: Optional[str] = None,
+        allowed_statuses: Optional[List[str]] = None,
+    ) -> bool:
+        """Rewrite the status token of one task in place.
+
+        Args:
+            worktree_name: Worktree section containing the task
+            task_desc: Task description (tags are ignored when matching)
+            status: New status, e.g. "[🟡]" or "[✅]"
+            adw_id: ADW ID to record, also used to locate the task
+            commit_hash: Commit hash for successful tasks
+            error_message: Failure reason for failed tasks
+            allowed_statuses: Only update a task currently in one of these states
+
+        Returns:
+            True if a task was found and updated
+        """
+        with file_lock(str(self.lock_path)):
+            content = self.read_task_list()
+            lines = content.splitlines(keepends=True)
+
+            index = self.find_task_line(
+                lines, worktree_name, task_desc, adw_id, allowed_statuses
+            )
+            if index is None:
+                return False
+
+            token = format_status_token(status, commit_hash, adw_id)
+            lines[index] = rewrite_task_line(lines[index], token, error_message)
+            atomic_write_text(str(self.file_path), "".join(lines))
+            return True
+
+    def update_task_to_in_progress(
+        self, worktree_name: str, task_desc: str, adw_id: str
+    ) -> bool:
+        """Update a task from [] or [⏰] to [🟡, adw_id] status.
+
+        Returns False if the task is no longer pending, e.g. because another
+        trigger already picked it up.
+        """
+        return self.update_task_status(
+            worktree_name,
+            task_desc,
+            "[🟡]",
+            adw_id=adw_id,
+            allowed_statuses=["[]", "[⏰]"],
+        )
+
+    def apply_task_update(self, update: TaskUpdate) -> bool:
+        """Write the final [✅]/[❌] status reported by a workflow."""
+        return self.update_task_status(
+            update.worktree_name,
+            update.task_description,
+            update.status,
+            adw_id=update.adw_id,
+            commit_hash=update.commit_hash,
+            error_message=update.error_message if update.status == "[❌]" else None,
+        )
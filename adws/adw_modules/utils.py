@@ -1,13 +1,16 @@
 """Utility functions for ADW system."""
 
+import fcntl
 import json
 import logging
 import os
 import re
 import sys
+import tempfile
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, TypeVar, Type, Union, Dict, Optional
+from typing import Any, TypeVar, Type, Union, Dict, Iterator, Optional
 
 T = TypeVar("T")
 
@@ -283,3 +286,51 @@ def get_safe_subprocess_env() -> Dict[str, str]:
 
     # Filter out None values
     return {k: v for k, v in safe_env_vars.items() if v is not None}
+
+
+@contextmanager
+def file_lock(lock_path: str) -> Iterator[None]:
+    """Hold an exclusive advisory lock on lock_path for the duration of the block.
+
+    The lock is shared between processes on the same host, so it can guard
+    files that several workflows write at the same time.
+
+    Args:
+        lock_path: Path of the lock file (created if missing)
+    """
+    lock_dir = os.path.dirname(os.path.abspath(lock_path))
+    os.makedirs(lock_dir, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write_text(file_path: str, content: str) -> None:
+    """Write content to file_path by writing a temp file and renaming it over.
+
+    Readers see either the old or the new file, never a partial write.
+
+    Args:
+        file_path: Destination file path
+        content: Text to write
+    """
+    target_dir = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(target_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=target_dir, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            os.chmod(tmp_path, os.stat(file_path).st_mode & 0o777)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,111 @@
+"""Pre-started workflow workers for the cron trigger.
+
+Each worker is a Python process that has already imported the workflow
+scripts (pydantic, rich, click, dotenv and the adw_modules) and blocks
+reading a single task spec from its stdin pipe. The trigger hands a task
+to an idle worker instead of starting a fresh interpreter, and starts a
+replacement in the background. A worker runs exactly one task and then
+exits, so a crashing task cannot affect other tasks and the trigger
+supervises it like any other workflow process.
+
+Run directly, this module is the worker entry point.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import List, Optional
+
+# adws/ directory holding the workflow scripts
+WORKFLOWS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Workflow scripts a worker can run, by module name
+WORKFLOW_MODULES = ["adw_build_update_task", "adw_plan_implement_update_task"]
+
+
+class WorkerPool:
+    """Keeps a number of idle workers ready to take a task."""
+
+    def __init__(self, size: int, cwd: Optional[str] = None):
+        self.size = size
+        self.cwd = cwd
+        self.idle: List[subprocess.Popen] = []
+
+    def spawn_worker(self) -> subprocess.Popen:
+        """Start a worker that imports the workflows and waits for a task."""
+        return subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__)],
+            stdin=subprocess.PIPE,
+            cwd=self.cwd,
+            text=True,
+        )
+
+    def fill(self):
+        """Top the pool up to size idle workers, dropping any that died."""
+        self.idle = [w for w in self.idle if w.poll() is None]
+        while len(self.idle) < self.size:
+            self.idle.append(self.spawn_worker())
+
+    def dispatch(self, workflow: str, args: List[str]) -> subprocess.Popen:
+        """Hand a task to an idle worker.
+
+        Args:
+            workflow: Workflow module name from WORKFLOW_MODULES
+            args: Command line arguments for the workflow's click command
+
+        Returns:
+            The worker process, which exits with the workflow's exit code
+        """
+        self.fill()
+        worker = self.idle.pop(0)
+        try:
+            worker.stdin.write(json.dumps({"workflow": workflow, "args": args}) + "\n")
+            worker.stdin.close()
+        except (BrokenPipeError, OSError):
+            # Worker died between fill() and now; fall back to a fresh one
+            worker = self.spawn_worker()
+            worker.stdin.write(json.dumps({"workflow": workflow, "args": args}) + "\n")
+            worker.stdin.close()
+
+        # Replace the worker while this task runs
+        self.fill()
+        return worker
+
+    def close(self):
+        """Stop idle workers; closing stdin makes them exit without running a task."""
+        for worker in self.idle:
+            try:
+                worker.stdin.close()
+            except OSError:
+                pass
+        for worker in self.idle:
+            try:
+                worker.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+        self.idle = []
+
+
+def worker_main():
+    """Import the workflows, then run the one task received on stdin."""
+    sys.path.insert(0, WORKFLOWS_DIR)
+    import importlib
+
+    modules = {name: importlib.import_module(name) for name in WORKFLOW_MODULES}
+
+    line = sys.stdin.readline()
+    if not line:
+        # Pool closed before this worker got a task
+        sys.exit(0)
+    sys.stdin.close()
+
+    spec = json.loads(line)
+    module = modules[spec["workflow"]]
+    module.main.main(
+        args=spec["args"], prog_name=f"{spec['workflow']}.py", standalone_mode=True
+    )
+
+
+if __name__ == "__main__":
+    worker_main()
@@ -0,0 +1,830 @@
+"""Importable ADW workflows built on the phase engine.
+
+The build-update, plan-implement-update and chore-implement workflows as
+plain functions that return a WorkflowResult instead of exiting the process,
+so orchestrators can run many of them concurrently in one process. Each
+workflow only declares its agent phases (see phase_engine.py); the task
+workflows then share the worktree check, the task status update and the
+workflow summary. The adw_*.py scripts are thin click wrappers around these
+functions.
+
+Example:
+    result = run_build_update_task("abc12345", "feature-auth", "Fix typo in README")
+
+    async def main():
+        return await asyncio.gather(
+            run_build_update_task_async("abc12345", "wt-a", "Task A"),
+            run_plan_implement_update_task_async("def67890", "wt-b", "Task B"),
+        )
+
+    results = asyncio.run(main())
+"""
+
+import asyncio
+import os
+import re
+import subprocess
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+from rich.console import Console
+from rich.panel import Panel
+from rich.rule import Rule
+from rich.table import Table
+
+from agent import (
+    AgentPromptResponse,
+    SUMMARY_JSON,
+    generate_short_id,
+)
+from data_models import TaskUpdate, CompletionEvent, WorktreeConfig
+from task_list import TaskListManager
+from completion_channel import publish_completion, get_completion_socket_path
+from heartbeat import HeartbeatWriter
+from worktree import provision_worktree
+from phase_engine import (
+    AgentPhase,
+    PhaseContext,
+    PhaseEngine,
+    PhaseResult,
+    print_status_panel,
+    write_summary,
+)
+
+# With sparse checkout, worktrees are trees/{worktree_name}/{TARGET_DIRECTORY}/
+TARGET_DIRECTORY = "tac8_app2__multi_agent_todone"
+
+
+class WorkflowResult(BaseModel):
+    """Outcome of a full workflow run."""
+
+    workflow: str = Field(..., description="Workflow name")
+    adw_id: str = Field(..., description="ADW ID of the task")
+    worktree_name: Optional[str] = Field(None, description="Worktree the task ran in")
+    task: str = Field(..., description="Task description or prompt")
+    model: str = Field(..., description="Claude model used")
+    working_dir: str = Field(..., description="Directory the agents worked in")
+    success: bool = Field(False, description="Whether every phase succeeded")
+    commit_hash: Optional[str] = Field(None, description="Commit produced by the task")
+    plan_path: Optional[str] = Field(None, description="Plan file, for planned workflows")
+    error_message: Optional[str] = Field(None, description="Why the workflow failed")
+    task_status: Optional[Literal["[✅]", "[❌]"]] = Field(
+        None, description="Status written to the task file, None if it was not updated"
+    )
+    phases: List[PhaseResult] = Field(
+        default_factory=list, description="Phases in the order they were declared"
+    )
+    duration_seconds: float = Field(0, description="Wall-clock run time in seconds")
+    exit_code: int = Field(
+        1, description="CLI exit code: 0 success, 1 completed with errors, 2 unexpected error"
+    )
+
+    def get_phase(self, name: str) -> Optional[PhaseResult]:
+        """Look up a phase result by name."""
+        return next((p for p in self.phases if p.name == name), None)
+
+
+def extract_plan_path(output: str, prefix: str = "plan") -> str:
+    """Extract the plan file path from the /plan or /chore command output.
+
+    Looks for patterns like:
+    - specs/plan-12345678-add-auth.md
+    - Created plan at: specs/chore-...
+    - Plan file: specs/plan-...
+    """
+    file_pattern = rf"specs/{prefix}-[a-zA-Z0-9\-]+\.md"
+    patterns = [
+        file_pattern,
+        rf"Created plan at:\s*({file_pattern})",
+        rf"Plan file:\s*({file_pattern})",
+        rf"path.*?:\s*({file_pattern})",
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, output, re.IGNORECASE | re.MULTILINE)
+        if match:
+            return match.group(1) if match.groups() else match.group(0)
+
+    # Provide more helpful error message showing what we were looking for
+    raise ValueError(
+        "Could not find plan file path in plan output. "
+        f"Expected pattern like 'specs/{prefix}-*.md' but none found."
+    )
+
+
+def get_current_commit_hash(working_dir: str) -> Optional[str]:
+    """Get the current git commit hash in the working directory."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=working_dir,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip()[:9]  # Return first 9 characters of hash
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def get_worktree_paths(worktree_name: str) -> Tuple[str, str]:
+    """Return (worktree_base_path, working_dir) for a worktree."""
+    worktree_base_path = os.path.abspath(f"trees/{worktree_name}")
+    return worktree_base_path, os.path.join(worktree_base_path, TARGET_DIRECTORY)
+
+
+def plan_path_collector(prefix: str):
+    """Build a collect hook that passes the plan path on to later phases."""
+
+    def collect(context: PhaseContext, response: AgentPromptResponse) -> Dict[str, Any]:
+        try:
+            plan_path = extract_plan_path(response.output, prefix)
+        except ValueError as e:
+            raise ValueError(f"Plan path extraction failed: {str(e)}")
+        return {"plan_path": plan_path}
+
+    return collect
+
+
+def plan_file_exists(context: PhaseContext, outputs: Dict[str, Any]) -> bool:
+    """Checkpoint check: a restored plan path must still point at a file."""
+    plan_path = outputs.get("plan_path")
+    return bool(plan_path) and os.path.exists(os.path.join(context.working_dir, plan_path))
+
+
+def collect_commit_hash(context: PhaseContext, response: AgentPromptResponse) -> Dict[str, Any]:
+    """Collect hook recording the commit the phase left in the working directory."""
+    return {"commit_hash": get_current_commit_hash(context.working_dir)}
+
+
+def ensure_worktree(
+    console: Console,
+    adw_id: str,
+    worktree_name: str,
+) -> Optional[PhaseResult]:
+    """Create the worktree with git if it does not exist.
+
+    Returns:
+        The init phase result, or None if the worktree already existed
+    """
+    worktree_base_path, _ = get_worktree_paths(worktree_name)
+    if os.path.exists(worktree_base_path):
+        return None
+
+    console.print(Panel(
+        f"[bold yellow]Worktree not found at: {worktree_base_path}[/bold yellow]\n\n"
+        "Creating worktree now...",
+        title="[bold yellow]⚠️  Worktree Missing[/bold yellow]",
+        border_style="yellow",
+    ))
+
+    # Print start message for worktree creation
+    print_status_panel(console, "Starting worktree creation", adw_id, worktree_name, "init")
+
+    started_at = datetime.now()
+    provisioned = provision_worktree(
+        WorktreeConfig(worktree_name=worktree_name, target_directory=TARGET_DIRECTORY)
+    )
+    init_phase = PhaseResult(
+        name="init_worktree",
+        agent_name="worktree-initializer",
+        success=provisioned.success,
+        output=provisioned.error_message or provisioned.path,
+        error_message=provisioned.error_message,
+        started_at=started_at,
+        duration_seconds=provisioned.duration_seconds,
+    )
+
+    if init_phase.success:
+        print_status_panel(console, "Completed worktree creation", adw_id, worktree_name, "init", "success")
+        console.print(Panel(
+            f"[bold green]✅ Worktree created successfully at: {worktree_base_path}[/bold green]",
+            title="[bold green]Worktree Created[/bold green]",
+            border_style="green",
+        ))
+    else:
+        print_status_panel(console, "Failed worktree creation", adw_id, worktree_name, "init", "error")
+        console.print(Panel(
+            f"[bold red]Failed to create worktree:\n{init_phase.output}[/bold red]",
+            title="[bold red]❌ Worktree Creation Failed[/bold red]",
+            border_style="red",
+        ))
+    return init_phase
+
+
+def run_update_task_phase(
+    console: Console,
+    result: WorkflowResult,
+    task_file: str,
+    updater_name: str,
+    phase_number: int,
+) -> PhaseResult:
+    """Write the workflow's final status for its task into the task file."""
+    adw_id = result.adw_id
+    worktree_name = result.worktree_name
+
+    console.print()
+    console.print(Rule(f"[bold yellow]Phase {phase_number}: Update Task (tasks.md)[/bold yellow]"))
+    console.print()
+
+    # Determine the status to update
+    update_status = "success" if result.success and result.commit_hash else "failed"
+
+    # Display update execution info
+    update_info_table = Table(show_header=False, box=None, padding=(0, 1))
+    update_info_table.add_column(style="bold cyan")
+    update_info_table.add_column()
+
+    update_info_table.add_row("ADW ID", adw_id)
+    update_info_table.add_row("Phase", "Update Task")
+    update_info_table.add_row("Task File", task_file)
+    update_info_table.add_row("Status", update_status)
+    update_info_table.add_row("Agent", updater_name)
+
+    console.print(
+        Panel(
+            update_info_table,
+            title=f"[bold blue]🚀 Update Inputs | {adw_id} | {worktree_name}[/bold blue]",
+            border_style="blue",
+        )
+    )
+    console.print()
+
+    # Print start message for update phase
+    print_status_panel(console, "Starting task status update", adw_id, worktree_name, "update")
+
+    # Rewrite the task's status token directly in tasks.md
+    started = time.monotonic()
+    update_success = False
+    update_output = ""
+    try:
+        task_update = TaskUpdate(
+            adw_id=adw_id,
+            status="[✅]" if update_status == "success" else "[❌]",
+            commit_hash=result.commit_hash,
+            error_message=result.error_message or (
+                "No commit produced" if update_status == "failed" else None
+            ),
+            worktree_name=worktree_name,
+            task_description=result.task,
+        )
+        update_success = TaskListManager(task_file).apply_task_update(task_update)
+        if update_success:
+            result.task_status = task_update.status
+            update_output = f"Task marked as {task_update.status} in {task_file}"
+            # Let a running cron trigger start the next blocked task right away
+            publish_completion(
+                CompletionEvent(
+                    adw_id=adw_id,
+                    worktree_name=worktree_name,
+                    status=task_update.status,
+                    commit_hash=result.commit_hash,
+                ),
+                get_completion_socket_path(task_file),
+            )
+        else:
+            update_output = f"Task not found in {task_file}: {result.task}"
+    except Exception as e:
+        update_output = f"Error updating {task_file}: {str(e)}"
+
+    # Print completion message
+    print_status_panel(
+        console,
+        "Completed task status update" if update_success else "Task status update failed",
+        adw_id,
+        worktree_name,
+        "update",
+        "success" if update_success else "error",
+    )
+
+    if update_success:
+        console.print(
+            Panel(
+                update_output,
+                title=f"[bold green]✅ Update Success | {adw_id} | {worktree_name}[/bold green]",
+                border_style="green",
+                padding=(1, 2),
+            )
+        )
+    else:
+        console.print(
+            Panel(
+                update_output,
+                title=f"[bold red]❌ Update Failed | {adw_id} | {worktree_name}[/bold red]",
+                border_style="red",
+                padding=(1, 2),
+            )
+        )
+
+    # Save update phase summary
+    write_summary(
+        f"./agents/{adw_id}/{updater_name}",
+        SUMMARY_JSON,
+        {
+            "phase": "update_task",
+            "adw_id": adw_id,
+            "worktree_name": worktree_name,
+            "task": result.task,
+            "task_file": task_file,
+            "model": result.model,
+            "working_dir": os.getcwd(),  # update_task runs from project root
+            "success": update_success,
+            "session_id": None,
+            "final_status": update_status,
+        },
+    )
+
+    return PhaseResult(
+        name="update_task",
+        agent_name=updater_name,
+        success=update_success,
+        output=update_output,
+        error_message=None if update_success else update_output,
+        duration_seconds=round(time.monotonic() - started, 3),
+    )
+
+
+def apply_phase_results(result: WorkflowResult, context: PhaseContext, phase_results: List[PhaseResult]):
+    """Fold the engine's phase results into the workflow result."""
+    result.phases.extend(phase_results)
+    result.success = all(p.success for p in phase_results)
+    result.plan_path = context.outputs.get("plan_path")
+    result.commit_hash = context.outputs.get("commit_hash") if result.success else None
+    failed = next((p for p in phase_results if not p.success and not p.skipped), None)
+    if failed:
+        result.error_message = failed.error_message
+
+
+def print_phase_summary(
+    console: Console,
+    result: WorkflowResult,
+    phases: List[AgentPhase],
+    extra_rows: List[Tuple[str, PhaseResult]] = (),
+):
+    """Print the workflow summary table, one row per phase."""
+    console.print()
+    console.print(Rule("[bold blue]Workflow Summary[/bold blue]"))
+    console.print()
+
+    summary_table = Table(show_header=True, box=None)
+    summary_table.add_column("Phase", style="bold cyan")
+    summary_table.add_column("Status", style="bold")
+    summary_table.add_column("Output Directory", style="dim")
+
+    rows = [(f"{p.title} ({p.slash_command})", result.get_phase(p.name)) for p in phases]
+    for label, phase_result in rows + list(extra_rows):
+        if phase_result.skipped:
+            summary_table.add_row(label, f"⏭️ {phase_result.output}", "-")
+        elif phase_result.restored:
+            summary_table.add_row(
+                label, "⏩ Restored", f"./agents/{result.adw_id}/{phase_result.agent_name}/"
+            )
+        else:
+            summary_table.add_row(
+                label,
+                "✅ Success" if phase_result.success else "❌ Failed",
+                f"./agents/{result.adw_id}/{phase_result.agent_name}/",
+            )
+
+    console.print(summary_table)
+
+
+def summarize_phase(phase_result: PhaseResult) -> Optional[Dict[str, Any]]:
+    """Workflow summary entry for a phase, None if it did not run."""
+    if phase_result.skipped:
+        return None
+    return {
+        "success": phase_result.success,
+        "session_id": phase_result.response.session_id if phase_result.response else None,
+        "agent": phase_result.agent_name,
+        "duration_seconds": phase_result.duration_seconds,
+        "restored": phase_result.restored,
+    }
+
+
+def print_workflow_outcome(console: Console, result: WorkflowResult, workflow_summary_path: str):
+    """Print where the summary was written and the overall outcome."""
+    console.print(
+        f"\n[bold cyan]Workflow summary:[/bold cyan] {workflow_summary_path}"
+    )
+    console.print()
+
+    if result.success:
+        console.print(
+            "[bold green]✅ Workflow completed successfully![/bold green]"
+        )
+    else:
+        console.print(
+            "[bold yellow]⚠️  Workflow completed with errors[/bold yellow]"
+        )
+
+
+def fail_unexpectedly(console: Console, result: WorkflowResult, error: Exception) -> WorkflowResult:
+    """Record an unexpected exception on the result."""
+    console.print(
+        Panel(
+            f"[bold red]{str(error)}[/bold red]",
+            title="[bold red]❌ Unexpected Error[/bold red]",
+            border_style="red",
+        )
+    )
+    result.success = False
+    result.error_message = result.error_message or str(error)
+    result.exit_code = 2
+    return result
+
+
+def run_task_workflow(
+    workflow: str,
+    title: str,
+    phases: List[AgentPhase],
+    adw_id: str,
+    worktree_name: str,
+    task: str,
+    model: str,
+    task_file: str,
+    workflow_timeout: Optional[int],
+    resume_session: bool,
+    resume: bool,
+    verbose: bool,
+    console: Optional[Console],
+) -> WorkflowResult:
+    """Run a task workflow's phases in its worktree, then write the task status.
+
+    Args:
+        workflow: Workflow name recorded in the summaries
+        title: Title shown in the configuration panel
+        phases: Agent phases to run in the worktree
+        adw_id: ADW ID for this task execution
+        worktree_name: Name of the git worktree to work in
+        task: Task description
+        model: Claude model to use
+        task_file: Path to the task list file to update
+        workflow_timeout: Overall time budget in seconds shared by all agent phases
+        resume_session: Let phases with resume_from continue the earlier session
+        resume: Skip phases that completed in an earlier run of this ADW ID
+        verbose: Show full agent output in the panels
+        console: Rich console for progress output
+
+    Returns:
+        WorkflowResult with per-phase results, commit hash and timings
+    """
+    # Lets a restarted trigger tell this run from an orphaned [🟡] task
+    with HeartbeatWriter(adw_id):
+        console = console or Console()
+        started = time.monotonic()
+
+        # Every agent phase is cut short once the workflow deadline passes
+        deadline = time.time() + workflow_timeout if workflow_timeout else None
+
+        _, worktree_path = get_worktree_paths(worktree_name)
+        result = WorkflowResult(
+            workflow=workflow,
+            adw_id=adw_id,
+            worktree_name=worktree_name,
+            task=task,
+            model=model,
+            working_dir=worktree_path,
+        )
+
+        # Check if worktree exists, create if needed
+        init_phase = ensure_worktree(console, adw_id, worktree_name)
+        if init_phase:
+            result.phases.append(init_phase)
+            if not init_phase.success:
+                result.error_message = "Worktree creation failed"
+                result.duration_seconds = round(time.monotonic() - started, 3)
+                return result
+
+        updater_name = f"updater-{worktree_name}"
+
+        console.print(
+            Panel(
+                f"[bold blue]{title}[/bold blue]\n\n"
+                f"[cyan]ADW ID:[/cyan] {adw_id}\n"
+                f"[cyan]Worktree:[/cyan] {worktree_name}\n"
+                f"[cyan]Task:[/cyan] {task}\n"
+                f"[cyan]Model:[/cyan] {model}\n"
+                f"[cyan]Working Dir:[/cyan] {worktree_path}"
+                + ("\n[cyan]Resume:[/cyan] skipping completed phases" if resume else ""),
+                title="[bold blue]🚀 Workflow Configuration[/bold blue]",
+                border_style="blue",
+            )
+        )
+
+        context = PhaseContext(
+            adw_id=adw_id,
+            label=worktree_name,
+            model=model,
+            working_dir=worktree_path,
+            deadline=deadline,
+            verbose=verbose,
+            resume_sessions=resume_session,
+            resume=resume,
+            summary_fields={"worktree_name": worktree_name, "task": task},
+        )
+
+        try:
+            apply_phase_results(result, context, PhaseEngine(phases, console).run(context))
+            if result.commit_hash:
+                console.print(f"\n[bold cyan]Commit hash:[/bold cyan] {result.commit_hash}")
+
+            # Final phase: update the task in tasks.md (always run to update status)
+            update_phase = run_update_task_phase(
+                console, result, task_file, updater_name, len(phases) + 1
+            )
+            result.phases.append(update_phase)
+
+            print_phase_summary(console, result, phases, [("Update Task (tasks.md)", update_phase)])
+
+            # Create overall workflow summary
+            workflow_summary_path = write_summary(
+                f"./agents/{adw_id}",
+                "workflow_summary.json",
+                {
+                    "workflow": workflow,
+                    "adw_id": adw_id,
+                    "worktree_name": worktree_name,
+                    "task": task,
+                    "model": model,
+                    "working_dir": worktree_path,
+                    "plan_path": result.plan_path,
+                    "commit_hash": result.commit_hash,
+                    "phases": {
+                        **{p.name: summarize_phase(result.get_phase(p.name)) for p in phases},
+                        "update_task": {
+                            "success": update_phase.success,
+                            "session_id": None,
+                            "agent": updater_name,
+                            "duration_seconds": update_phase.duration_seconds,
+                        },
+                    },
+                    "overall_success": result.success,
+                    "final_task_status": "success" if result.success and result.commit_hash else "failed",
+                },
+            )
+
+            print_workflow_outcome(console, result, workflow_summary_path)
+            result.exit_code = 0 if result.success else 1
+
+        except Exception as e:
+            fail_unexpectedly(console, result, e)
+
+        result.duration_seconds = round(time.monotonic() - started, 3)
+        return result
+
+
+def run_build_update_task(
+    adw_id: str,
+    worktree_name: str,
+    task: str,
+    model: str = "sonnet",
+    task_file: str = "tasks.md",
+    workflow_timeout: Optional[int] = None,
+    resume: bool = False,
+    verbose: bool = False,
+    console: Optional[Console] = None,
+) -> WorkflowResult:
+    """Run the build-update workflow: /build, then write the task status.
+
+    Args:
+        adw_id: ADW ID for this task execution
+        worktree_name: Name of the git worktree to work in
+        task: Task description to implement
+        model: Claude model to use ("sonnet" or "opus")
+        task_file: Path to the task list file to update
+        workflow_timeout: Overall time budget in seconds shared by all agent phases
+        resume: Skip phases that completed in an earlier run of this ADW ID
+        verbose: Show full agent output in the panels
+        console: Rich console for progress output (e.g. Console(quiet=True))
+
+    Returns:
+        WorkflowResult with per-phase responses, commit hash and timings
+    """
+    phases = [
+        AgentPhase(
+            name="build",
+            title="Build",
+            slash_command="/build",
+            agent_name=f"builder-{worktree_name}",
+            args=lambda ctx: [adw_id, task],
+            collect=collect_commit_hash,
+            success_message="Build completed successfully",
+        ),
+    ]
+    return run_task_workflow(
+        "build_update_task",
+        "ADW Build-Update Workflow (Lightweight)",
+        phases,
+        adw_id,
+        worktree_name,
+        task,
+        model,
+        task_file,
+        workflow_timeout,
+        resume_session=False,
+        resume=resume,
+        verbose=verbose,
+        console=console,
+    )
+
+
+def run_plan_implement_update_task(
+    adw_id: str,
+    worktree_name: str,
+    task: str,
+    model: str = "sonnet",
+    task_file: str = "tasks.md",
+    workflow_timeout: Optional[int] = None,
+    resume_session: bool = True,
+    resume: bool = False,
+    verbose: bool = False,
+    console: Optional[Console] = None,
+) -> WorkflowResult:
+    """Run the plan-implement-update workflow: /plan, /implement, then write the task status.
+
+    Args:
+        adw_id: ADW ID for this task execution
+        worktree_name: Name of the git worktree to work in
+        task: Task description to implement
+        model: Claude model to use ("sonnet" or "opus")
+        task_file: Path to the task list file to update
+        workflow_timeout: Overall time budget in seconds shared by all agent phases
+        resume_session: Continue the planning session in the implement phase
+        resume: Skip phases that completed in an earlier run of this ADW ID
+        verbose: Show full agent output in the panels
+        console: Rich console for progress output (e.g. Console(quiet=True))
+
+    Returns:
+        WorkflowResult with per-phase responses, plan path, commit hash and timings
+    """
+    phases = [
+        AgentPhase(
+            name="planning",
+            title="Planning",
+            slash_command="/plan",
+            agent_name=f"planner-{worktree_name}",
+            args=lambda ctx: [adw_id, task],
+            collect=plan_path_collector("plan"),
+            verify_checkpoint=plan_file_exists,
+            success_message="Plan created successfully",
+        ),
+        AgentPhase(
+            name="implementation",
+            title="Implementation",
+            slash_command="/implement",
+            agent_name=f"builder-{worktree_name}",
+            args=lambda ctx: [ctx.outputs["plan_path"]],
+            depends_on=["planning"],
+            resume_from="planning",
+            collect=collect_commit_hash,
+            success_message="Implementation completed successfully",
+        ),
+    ]
+    return run_task_workflow(
+        "plan_implement_update_task",
+        "ADW Plan-Implement-Update Workflow",
+        phases,
+        adw_id,
+        worktree_name,
+        task,
+        model,
+        task_file,
+        workflow_timeout,
+        resume_session=resume_session,
+        resume=resume,
+        verbose=verbose,
+        console=console,
+    )
+
+
+def run_chore_implement(
+    prompt: str,
+    model: str = "sonnet",
+    working_dir: Optional[str] = None,
+    resume_session: bool = True,
+    adw_id: Optional[str] = None,
+    console: Optional[Console] = None,
+) -> WorkflowResult:
+    """Run the chore workflow: /chore plans the change, /implement carries it out.
+
+    Args:
+        prompt: Chore description
+        model: Claude model to use ("sonnet" or "opus")
+        working_dir: Directory to run in (default: current directory)
+        resume_session: Continue the /chore session in the implement phase
+        adw_id: ADW ID to use (default: a new one)
+        console: Rich console for progress output
+
+    Returns:
+        WorkflowResult; exit_code is 3 when the plan path could not be parsed
+    """
+    console = console or Console()
+    started = time.monotonic()
+    adw_id = adw_id or generate_short_id()
+    working_dir = working_dir or os.getcwd()
+
+    result = WorkflowResult(
+        workflow="chore_implement",
+        adw_id=adw_id,
+        task=prompt,
+        model=model,
+        working_dir=working_dir,
+    )
+
+    phases = [
+        AgentPhase(
+            name="planning",
+            title="Planning",
+            slash_command="/chore",
+            agent_name="planner",
+            args=lambda ctx: [adw_id, prompt],
+            collect=plan_path_collector("chore"),
+        ),
+        AgentPhase(
+            name="implementation",
+            title="Implementation",
+            slash_command="/implement",
+            agent_name="builder",
+            args=lambda ctx: [ctx.outputs["plan_path"]],
+            depends_on=["planning"],
+            resume_from="planning",
+        ),
+    ]
+
+    console.print(
+        Panel(
+            f"[bold blue]ADW Chore & Implement Workflow[/bold blue]\n\n"
+            f"[cyan]ADW ID:[/cyan] {adw_id}\n"
+            f"[cyan]Model:[/cyan] {model}\n"
+            f"[cyan]Working Dir:[/cyan] {working_dir}",
+            title="[bold blue]🚀 Workflow Configuration[/bold blue]",
+            border_style="blue",
+        )
+    )
+
+    context = PhaseContext(
+        adw_id=adw_id,
+        label=os.path.basename(working_dir) or working_dir,
+        model=model,
+        working_dir=working_dir,
+        verbose=True,
+        resume_sessions=resume_session,
+        show_output_files=True,
+        summary_fields={"prompt": prompt},
+    )
+
+    try:
+        apply_phase_results(result, context, PhaseEngine(phases, console).run(context))
+        print_phase_summary(console, result, phases)
+
+        # Create overall workflow summary
+        workflow_summary_path = write_summary(
+            f"./agents/{adw_id}",
+            "workflow_summary.json",
+            {
+                "workflow": "chore_implement",
+                "adw_id": adw_id,
+                "prompt": prompt,
+                "model": model,
+                "working_dir": working_dir,
+                "plan_path": result.plan_path,
+                "phases": {p.name: summarize_phase(result.get_phase(p.name)) for p in phases},
+                "overall_success": result.success,
+            },
+        )
+
+        print_workflow_outcome(console, result, workflow_summary_path)
+        planning = result.get_phase("planning")
+        if planning.response.success and not planning.success:
+            # /chore ran but its plan file could not be found
+            result.exit_code = 3
+        else:
+            result.exit_code = 0 if result.success else 1
+
+    except Exception as e:
+        fail_unexpectedly(console, result, e)
+
+    result.duration_seconds = round(time.monotonic() - started, 3)
+    return result
+
+
+async def run_build_update_task_async(*args, **kwargs) -> WorkflowResult:
+    """Async variant of run_build_update_task.
+
+    Runs the workflow in a worker thread; its agent phases are subprocesses,
+    so many workflows can run concurrently in one event loop.
+    """
+    return await asyncio.to_thread(run_build_update_task, *args, **kwargs)
+
+
+async def run_plan_implement_update_task_async(*args, **kwargs) -> WorkflowResult:
+    """Async variant of run_plan_implement_update_task."""
+    return await asyncio.to_thread(run_plan_implement_update_task, *args, **kwargs)
+
+
+async def run_chore_implement_async(*args, **kwargs) -> WorkflowResult:
+    """Async variant of run_chore_implement."""
+    return await asyncio.to_thread(run_chore_implement, *args, **kwargs)
@@ -0,0 +1,271 @@
+"""Native git worktree provisioning.
+
+Creates trees/<worktree_name> as a git worktree on a branch of the same
+name, sparse-checked out to the target directory, with the .env files
+copied over: what the /init_worktree agent command did, in a few git
+calls. Provisioning is idempotent and serialized per worktree name, so the
+cron trigger and workflows can all ask for the same worktree at once.
+
+Example:
+    result = provision_worktree(
+        WorktreeConfig(worktree_name="feature-auth", target_directory=TARGET_DIRECTORY)
+    )
+    if result.success:
+        print(result.path)
+"""
+
+import os
+import shutil
+import subprocess
+import time
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from data_models import WorktreeConfig
+from dependency_store import DependencyStore
+from build_cache import BuildCache
+from utils import file_lock
+
+ENV_FILE = ".env"
+
+# Per-worktree locks serializing concurrent provisioning
+WORKTREE_LOCK_DIR = os.path.join("agents", "worktree_locks")
+
+# Lock file, under the repository's WORKTREE_LOCK_DIR, held by every git
+# command that changes state shared by all worktrees
+REPO_LOCK_NAME = "repo.lock"
+
+
+class WorktreeResult(BaseModel):
+    """Outcome of provisioning a worktree."""
+
+    worktree_name: str = Field(..., description="Name of the worktree")
+    path: str = Field(..., description="Absolute path of the worktree")
+    branch: str = Field(..., description="Branch checked out in the worktree")
+    success: bool = Field(..., description="Whether the worktree is ready to use")
+    created: bool = Field(False, description="False if the worktree already existed")
+    env_files: List[str] = Field(
+        default_factory=list, description=".env files copied into the worktree"
+    )
+    dependencies: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Dependency install outcome by lockfile, 'linked' or 'installed'",
+    )
+    build_cache_seed: Optional[str] = Field(
+        None, description="Commit of the build cache snapshot the worktree was seeded from"
+    )
+    warnings: List[str] = Field(
+        default_factory=list, description="Problems that left the worktree usable"
+    )
+    error_message: Optional[str] = Field(None, description="Why provisioning failed")
+    duration_seconds: float = Field(0, description="Wall-clock run time in seconds")
+
+
+def run_git(args: List[str], cwd: str) -> str:
+    """Run a git command and return its stdout.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits non-zero
+    """
+    result = subprocess.run(
+        ["git"] + args, cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def git_succeeds(args: List[str], cwd: str) -> bool:
+    """Check if a git command exits zero."""
+    return (
+        subprocess.run(["git"] + args, cwd=cwd, capture_output=True).returncode == 0
+    )
+
+
+def repo_lock(repo_root: str):
+    """Lock serializing git commands that modify the shared repository.
+
+    `git worktree add/move/remove`, branch creation, renames and deletion,
+    and `sparse-checkout set` all write under the common .git directory
+    (.git/config included) and fail or lose updates when they race. The
+    worktree pool's background thread, provisioning and the garbage
+    collector all run them, so each takes this lock around its calls. Not
+    reentrant: never nest it.
+    """
+    return file_lock(os.path.join(repo_root, WORKTREE_LOCK_DIR, REPO_LOCK_NAME))
+
+
+def get_repo_root(cwd: Optional[str] = None) -> str:
+    """Top-level directory of the main working tree containing cwd."""
+    return run_git(["rev-parse", "--show-toplevel"], cwd or os.getcwd())
+
+
+def list_worktrees(repo_root: str) -> List[str]:
+    """Absolute paths of the worktrees registered with the repository."""
+    output = run_git(["worktree", "list", "--porcelain"], repo_root)
+    return [
+        os.path.realpath(line[len("worktree "):])
+        for line in output.splitlines()
+        if line.startswith("worktree ")
+    ]
+
+
+def is_registered_worktree(repo_root: str, path: str) -> bool:
+    """Check if path is a worktree of the repository that still exists on disk."""
+    return os.path.isdir(path) and os.path.realpath(path) in list_worktrees(repo_root)
+
+
+def resolve_base_ref(repo_root: str, base_branch: str) -> str:
+    """The ref to branch from: base_branch if it exists, otherwise HEAD."""
+    if git_succeeds(["rev-parse", "--verify", "--quiet", f"{base_branch}^{{commit}}"], repo_root):
+        return base_branch
+    return "HEAD"
+
+
+def configure_sparse_checkout(path: str, target_directory: Optional[str]):
+    """Limit the worktree's checkout to target_directory (cone mode).
+
+    git stores the pattern in the worktree's own config, so the main
+    checkout is not affected.
+    """
+    if target_directory:
+        run_git(["sparse-checkout", "set", "--cone", target_directory], path)
+
+
+def copy_env_files(
+    repo_root: str, path: str, target_directory: Optional[str]
+) -> List[str]:
+    """Copy .env files from the main checkout, keeping any already in the worktree.
+
+    Returns:
+        Paths of the files copied, relative to the worktree
+    """
+    copied = []
+    candidates = [ENV_FILE]
+    if target_directory:
+        candidates.append(os.path.join(target_directory, ENV_FILE))
+
+    for relative_path in candidates:
+        source = os.path.join(repo_root, relative_path)
+        destination = os.path.join(path, relative_path)
+        if not os.path.isfile(source) or os.path.exists(destination):
+            continue
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        shutil.copy2(source, destination)
+        copied.append(relative_path)
+    return copied
+
+
+def provision_worktree(
+    config: WorktreeConfig,
+    trees_dir: str = "trees",
+    repo_root: Optional[str] = None,
+    dependency_store: Optional[DependencyStore] = None,
+    build_cache: Optional[BuildCache] = None,
+) -> WorktreeResult:
+    """Create a worktree, or finish setting up an existing one.
+
+    Runs `git worktree add` on a branch named after the worktree (reusing
+    the branch if it is left over from an earlier worktree), applies the
+    sparse checkout, copies the .env files, installs the dependencies of a
+    new worktree through the shared dependency store and seeds its build
+    caches from the nearest snapshot of the base branch. An existing worktree
+    is kept as is apart from missing .env files. A directory at the worktree
+    path that is not a registered worktree is never overwritten. A failed
+    dependency install or cache seed is reported in warnings; the agent can
+    still install and build from scratch.
+
+    Args:
+        config: Worktree name, base branch, target directory and .env handling
+        trees_dir: Directory holding the worktrees, relative to the cwd
+        repo_root: Main checkout of the repository, found from the cwd if None
+        dependency_store: Store to install from, trees/.deps if None
+        build_cache: Build cache snapshots to seed from, trees/.build-cache if None
+
+    Returns:
+        WorktreeResult, with error_message set if provisioning failed
+    """
+    started = time.monotonic()
+    name = config.worktree_name
+    path = os.path.abspath(os.path.join(trees_dir, name))
+    result = WorktreeResult(worktree_name=name, path=path, branch=name, success=False)
+
+    try:
+        repo_root = repo_root or get_repo_root()
+        with file_lock(os.path.join(WORKTREE_LOCK_DIR, f"{name}.lock")):
+            if is_registered_worktree(repo_root, path):
+                result.branch = run_git(["rev-parse", "--abbrev-ref", "HEAD"], path)
+            elif os.path.exists(path) and os.listdir(path):
+                result.error_message = (
+                    f"{path} exists but is not a git worktree of {repo_root}"
+                )
+                return result
+            else:
+                # Drop registrations of worktree directories deleted by hand
+                with repo_lock(repo_root):
+                    run_git(["worktree", "prune"], repo_root)
+                create_worktree(repo_root, path, config)
+                result.created = True
+
+            if config.copy_env:
+                result.env_files = copy_env_files(
+                    repo_root, path, config.target_directory
+                )
+            result.success = True
+
+            if result.created and config.install_dependencies:
+                store = dependency_store or DependencyStore()
+                try:
+                    result.dependencies = store.install_worktree(path)
+                except subprocess.CalledProcessError as e:
+                    result.warnings.append(
+                        f"Dependency install failed: {(e.stderr or str(e)).strip()}"
+                    )
+                except OSError as e:
+                    result.warnings.append(f"Dependency install failed: {e}")
+
+            if result.created and config.seed_build_cache:
+                try:
+                    result.build_cache_seed = (
+                        build_cache or BuildCache()
+                    ).seed_worktree(path)
+                except (subprocess.CalledProcessError, OSError) as e:
+                    result.warnings.append(f"Build cache seed failed: {e}")
+    except subprocess.CalledProcessError as e:
+        result.error_message = (e.stderr or str(e)).strip()
+    except OSError as e:
+        result.error_message = str(e)
+    finally:
+        result.duration_seconds = round(time.monotonic() - started, 3)
+
+    return result
+
+
+def create_worktree(repo_root: str, path: str, config: WorktreeConfig):
+    """Add the worktree and check out its sparse target, undoing it on failure."""
+    branch = config.worktree_name
+    branch_exists = git_succeeds(
+        ["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"], repo_root
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Check out only after the sparse patterns are in place
+    with repo_lock(repo_root):
+        if branch_exists:
+            run_git(["worktree", "add", "--no-checkout", path, branch], repo_root)
+        else:
+            base_ref = resolve_base_ref(repo_root, config.base_branch)
+            run_git(
+                ["worktree", "add", "--no-checkout", "-b", branch, path, base_ref],
+                repo_root,
+            )
+
+    try:
+        with repo_lock(repo_root):
+            configure_sparse_checkout(path, config.target_directory)
+        run_git(["checkout", branch], path)
+    except subprocess.CalledProcessError:
+        with repo_lock(repo_root):
+            run_git(["worktree", "remove", "--force", path], repo_root)
+            if not branch_exists:
+                run_git(["branch", "-D", branch], repo_root)
+        raise
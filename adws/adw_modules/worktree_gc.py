@@ -0,0 +1,254 @@
+"""Garbage collection of finished worktrees.
+
+A worktree under trees/ is collected once its `## Git Worktree` section
+in tasks.md has tasks and every one is [✅] or [❌], no workflow is
+running in it, it has no uncommitted changes (the dependencies, .env
+files and build caches provisioning put there aside), its branch is merged
+into the base branch or pushed, and it has been idle for the retention
+period.
+Collected worktrees go back to the worktree pool while it has room and are
+removed otherwise; `git worktree prune` then drops stale bookkeeping, and
+dependency store entries no remaining worktree uses are deleted.
+
+Used by the cron trigger on a timer and by adw_worktree_gc.py.
+"""
+
+import os
+import subprocess
+import time
+from typing import List, Literal, Optional, Set
+
+from pydantic import BaseModel, Field
+
+from data_models import Worktree, WorktreeGCPolicy
+from dependency_store import DEPENDENCY_DIRS, DependencyStore
+from worktree import (
+    ENV_FILE,
+    get_repo_root,
+    git_succeeds,
+    list_worktrees,
+    repo_lock,
+    resolve_base_ref,
+    run_git,
+)
+from worktree_pool import WorktreePool
+
+# Untracked paths that provisioning itself puts into a worktree: installed
+# dependencies, copied .env files and seeded build caches
+PROVISIONED_DIRS = set(DEPENDENCY_DIRS.values()) | {".next"}
+PROVISIONED_FILES = {ENV_FILE}
+PROVISIONED_SUFFIXES = (".tsbuildinfo",)
+
+
+class WorktreeGCDecision(BaseModel):
+    """What a garbage collection pass did, or would do, with one worktree."""
+
+    worktree_name: str = Field(..., description="Name of the worktree")
+    path: str = Field(..., description="Absolute path of the worktree")
+    action: Literal["keep", "remove", "recycle"] = Field(
+        ..., description="Outcome for the worktree"
+    )
+    reason: str = Field(..., description="Why the worktree was kept or collected")
+    error_message: Optional[str] = Field(None, description="Why collecting it failed")
+
+
+def get_last_activity(path: str) -> float:
+    """Time of the worktree's last commit or git operation."""
+    commit_time = float(run_git(["log", "-1", "--format=%ct"], path) or 0)
+    index_path = run_git(["rev-parse", "--git-path", "index"], path)
+    if not os.path.isabs(index_path):
+        index_path = os.path.join(path, index_path)
+    try:
+        return max(commit_time, os.path.getmtime(index_path))
+    except OSError:
+        return commit_time
+
+
+def is_provisioned_path(relative_path: str) -> bool:
+    """Check if an untracked path is one provisioning creates."""
+    parts = relative_path.rstrip("/").split("/")
+    return (
+        any(part in PROVISIONED_DIRS for part in parts)
+        or parts[-1] in PROVISIONED_FILES
+        or parts[-1].endswith(PROVISIONED_SUFFIXES)
+    )
+
+
+def get_uncommitted_changes(path: str) -> List[str]:
+    """Paths with uncommitted work in a worktree.
+
+    Tracked changes always count. Untracked files count unless provisioning
+    created them, since this repo's .gitignore does not ignore
+    node_modules or .env and every provisioned worktree would look dirty.
+    """
+    output = subprocess.run(
+        ["git", "status", "--porcelain", "-z"],
+        cwd=path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    entries = output.split("\0")
+    changes = []
+    index = 0
+    while index < len(entries):
+        entry = entries[index]
+        index += 1
+        if not entry:
+            continue
+        status, relative_path = entry[:2], entry[3:]
+        if status[0] in "RC":
+            # Renames and copies are followed by their source path
+            index += 1
+        if status == "??" and is_provisioned_path(relative_path):
+            continue
+        changes.append(relative_path)
+    return changes
+
+
+def is_merged_or_pushed(path: str, repo_root: str, base_ref: str) -> Optional[str]:
+    """Describe where the worktree's commits are safe, None if only here."""
+    if git_succeeds(["merge-base", "--is-ancestor", "HEAD", base_ref], path):
+        return f"merged into {base_ref}"
+    head = run_git(["rev-parse", "HEAD"], path)
+    remote_branches = run_git(["branch", "-r", "--contains", head], repo_root)
+    if remote_branches:
+        return f"pushed to {remote_branches.splitlines()[0].strip()}"
+    return None
+
+
+def evaluate_worktree(
+    worktree: Worktree,
+    path: str,
+    repo_root: str,
+    policy: WorktreeGCPolicy,
+    active_worktrees: Set[str],
+) -> WorktreeGCDecision:
+    """Decide whether one worktree can be collected under the policy."""
+    decision = WorktreeGCDecision(
+        worktree_name=worktree.name, path=path, action="keep", reason=""
+    )
+    if not worktree.tasks:
+        # Just created, or its tasks are about to be added
+        decision.reason = "no tasks yet"
+        return decision
+    pending = [task for task in worktree.tasks if not task.is_completed()]
+    if pending:
+        decision.reason = f"{len(pending)} task(s) not finished"
+        return decision
+    if worktree.name in active_worktrees:
+        decision.reason = "workflow still running"
+        return decision
+    changes = get_uncommitted_changes(path)
+    if changes:
+        decision.reason = f"uncommitted changes ({changes[0]}"
+        decision.reason += f" and {len(changes) - 1} more)" if len(changes) > 1 else ")"
+        return decision
+
+    safe_because = "retention only"
+    if policy.require_merged_or_pushed:
+        base_ref = resolve_base_ref(repo_root, policy.base_branch)
+        safe_because = is_merged_or_pushed(path, repo_root, base_ref)
+        if safe_because is None:
+            decision.reason = "branch neither merged nor pushed"
+            return decision
+
+    idle_hours = (time.time() - get_last_activity(path)) / 3600
+    if idle_hours < policy.retention_hours:
+        decision.reason = (
+            f"idle {idle_hours:.1f}h of {policy.retention_hours:g}h retention"
+        )
+        return decision
+
+    decision.action = "remove"
+    decision.reason = f"all tasks finished, {safe_because}, idle {idle_hours:.1f}h"
+    return decision
+
+
+def collect_worktree(
+    decision: WorktreeGCDecision,
+    repo_root: str,
+    worktree_pool: Optional[WorktreePool] = None,
+):
+    """Recycle a collectable worktree into the pool, or remove it and its merged branch."""
+    if worktree_pool and worktree_pool.size:
+        try:
+            if worktree_pool.recycle(decision.path):
+                decision.action = "recycle"
+                return
+        except (subprocess.CalledProcessError, OSError) as e:
+            stderr = getattr(e, "stderr", None)
+            decision.error_message = f"Recycling failed: {(stderr or str(e)).strip()}"
+            if not os.path.isdir(decision.path):
+                return
+
+    branch = run_git(["rev-parse", "--abbrev-ref", "HEAD"], decision.path)
+    with repo_lock(repo_root):
+        run_git(["worktree", "remove", "--force", decision.path], repo_root)
+        # Safe delete: kept if the branch is only pushed, not merged
+        git_succeeds(["branch", "-d", branch], repo_root)
+    decision.action = "remove"
+
+
+def collect_garbage(
+    worktrees: List[Worktree],
+    policy: WorktreeGCPolicy,
+    trees_dir: str = "trees",
+    repo_root: Optional[str] = None,
+    active_worktrees: Optional[Set[str]] = None,
+    worktree_pool: Optional[WorktreePool] = None,
+    dependency_store: Optional[DependencyStore] = None,
+    dry_run: bool = False,
+) -> List[WorktreeGCDecision]:
+    """Run one garbage collection pass over the worktrees in tasks.md.
+
+    Args:
+        worktrees: Worktree sections parsed from tasks.md
+        policy: Retention policy
+        trees_dir: Directory holding the worktrees
+        repo_root: Main checkout of the repository, found from the cwd if None
+        active_worktrees: Worktrees with a running workflow, never collected
+        worktree_pool: Pool to return collected worktrees to while it has room
+        dependency_store: Store to prune of entries no worktree uses any more
+        dry_run: Only decide, change nothing
+
+    Returns:
+        One decision per worktree section that has a worktree on disk
+    """
+    repo_root = repo_root or get_repo_root()
+    registered = set(list_worktrees(repo_root))
+    active_worktrees = active_worktrees or set()
+
+    decisions = []
+    for worktree in worktrees:
+        path = os.path.abspath(os.path.join(trees_dir, worktree.name))
+        if os.path.realpath(path) not in registered or not os.path.isdir(path):
+            continue
+        try:
+            decision = evaluate_worktree(
+                worktree, path, repo_root, policy, active_worktrees
+            )
+            if decision.action != "keep" and not dry_run:
+                collect_worktree(decision, repo_root, worktree_pool)
+        except subprocess.CalledProcessError as e:
+            decision = WorktreeGCDecision(
+                worktree_name=worktree.name,
+                path=path,
+                action="keep",
+                reason="git failed",
+                error_message=(e.stderr or str(e)).strip(),
+            )
+        decisions.append(decision)
+
+    if dry_run:
+        return decisions
+
+    with repo_lock(repo_root):
+        run_git(["worktree", "prune"], repo_root)
+    if dependency_store and any(d.action == "remove" for d in decisions):
+        keep_keys = []
+        for path in list_worktrees(repo_root):
+            if os.path.isdir(path):
+                keep_keys.extend(dependency_store.get_worktree_keys(path))
+        dependency_store.prune(keep_keys)
+    return decisions
@@ -0,0 +1,294 @@
+"""Pre-warmed git worktrees for the cron trigger.
+
+Keeps a number of spare worktrees under trees/.pool/, each provisioned
+with the sparse checkout and .env files and with its dependencies
+installed. When a task list names a worktree that does not exist yet, the
+trigger claims a spare one instead of creating it on the critical path:
+the spare is reset to the current base branch tip, moved to
+trees/<worktree_name> and its branch renamed, which takes well under a
+second. A background thread then warms a replacement.
+
+A spare is ready once its marker file trees/.pool/<entry>.ready exists.
+Spares persist across trigger restarts; half-warmed ones are discarded.
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+from typing import List, Optional
+
+from data_models import WorktreeConfig
+from dependency_store import DependencyStore, dependencies_changed
+from build_cache import BuildCache
+from utils import file_lock, make_adw_id
+from worktree import (
+    WORKTREE_LOCK_DIR,
+    WorktreeResult,
+    copy_env_files,
+    get_repo_root,
+    git_succeeds,
+    is_registered_worktree,
+    provision_worktree,
+    repo_lock,
+    resolve_base_ref,
+    run_git,
+)
+
+POOL_DIR_NAME = ".pool"
+READY_SUFFIX = ".ready"
+
+# Serializes picking a spare between processes sharing the pool
+POOL_LOCK = os.path.join(WORKTREE_LOCK_DIR, "pool.lock")
+
+
+class WorktreePool:
+    """Keeps a number of ready-to-use worktrees at the base branch tip."""
+
+    def __init__(
+        self,
+        size: int,
+        target_directory: Optional[str] = None,
+        trees_dir: str = "trees",
+        base_branch: str = "main",
+        repo_root: Optional[str] = None,
+        dependency_store: Optional[DependencyStore] = None,
+        build_cache: Optional[BuildCache] = None,
+    ):
+        self.size = size
+        self.target_directory = target_directory
+        self.trees_dir = trees_dir
+        self.pool_dir = os.path.join(trees_dir, POOL_DIR_NAME)
+        self.base_branch = base_branch
+        self.repo_root = repo_root
+        self.dependency_store = dependency_store or DependencyStore()
+        self.build_cache = build_cache or BuildCache()
+        self.errors: List[str] = []
+        self.stop_event = threading.Event()
+        self.refill_requested = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def get_repo_root(self) -> str:
+        if self.repo_root is None:
+            self.repo_root = get_repo_root()
+        return self.repo_root
+
+    def ready_entries(self) -> List[str]:
+        """Absolute paths of the spares that are ready to be claimed."""
+        if not os.path.isdir(self.pool_dir):
+            return []
+        return sorted(
+            os.path.abspath(os.path.join(self.pool_dir, name[: -len(READY_SUFFIX)]))
+            for name in os.listdir(self.pool_dir)
+            if name.endswith(READY_SUFFIX)
+        )
+
+    def discard(self, path: str):
+        """Remove a spare worktree and its branch."""
+        repo_root = self.get_repo_root()
+        branch = os.path.basename(path)
+        try:
+            os.unlink(path + READY_SUFFIX)
+        except FileNotFoundError:
+            pass
+        with repo_lock(repo_root):
+            if is_registered_worktree(repo_root, path):
+                run_git(["worktree", "remove", "--force", path], repo_root)
+            elif os.path.isdir(path):
+                shutil.rmtree(path)
+            if git_succeeds(
+                ["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"], repo_root
+            ):
+                run_git(["branch", "-D", branch], repo_root)
+
+    def discard_unready(self):
+        """Remove spares left half-warmed by an earlier trigger."""
+        if not os.path.isdir(self.pool_dir):
+            return
+        for name in os.listdir(self.pool_dir):
+            path = os.path.abspath(os.path.join(self.pool_dir, name))
+            if name.endswith(READY_SUFFIX) or os.path.exists(path + READY_SUFFIX):
+                continue
+            try:
+                self.discard(path)
+            except (subprocess.CalledProcessError, OSError) as e:
+                self.errors.append(f"Could not discard {path}: {e}")
+
+    def warm(self) -> Optional[str]:
+        """Provision one spare and install its dependencies.
+
+        Returns:
+            Path of the new spare, or None if warming failed
+        """
+        name = f"pool-{make_adw_id()}"
+        result = provision_worktree(
+            WorktreeConfig(
+                worktree_name=name,
+                base_branch=self.base_branch,
+                target_directory=self.target_directory,
+                install_dependencies=False,
+            ),
+            trees_dir=self.pool_dir,
+            repo_root=self.get_repo_root(),
+            build_cache=self.build_cache,
+        )
+        if not result.success:
+            self.errors.append(result.error_message or f"Could not create {name}")
+            return None
+
+        try:
+            self.dependency_store.install_worktree(result.path)
+        except subprocess.CalledProcessError as e:
+            self.errors.append(f"Dependency install failed in {name}: {e.stderr or e}")
+            self.discard(result.path)
+            return None
+        except OSError as e:
+            self.errors.append(f"Dependency install failed in {name}: {e}")
+            self.discard(result.path)
+            return None
+
+        with open(result.path + READY_SUFFIX, "w") as f:
+            f.write(run_git(["rev-parse", "HEAD"], result.path))
+        return result.path
+
+    def fill(self):
+        """Warm spares until the pool holds size of them, or warming fails."""
+        while len(self.ready_entries()) < self.size and not self.stop_event.is_set():
+            if self.warm() is None:
+                break
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.fill()
+            except (subprocess.CalledProcessError, OSError) as e:
+                self.errors.append(f"Worktree pool refill failed: {e}")
+            self.refill_requested.wait()
+            self.refill_requested.clear()
+
+    def start(self):
+        """Warm spares in a background thread, refilling after every claim."""
+        if self.thread is None:
+            # Before any claim can take a spare out of the pool
+            self.discard_unready()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Stop warming; a spare being warmed is discarded on the next start."""
+        self.stop_event.set()
+        self.refill_requested.set()
+
+    def take_entry(self) -> Optional[str]:
+        """Remove a ready spare from the pool, None if there is none."""
+        with file_lock(POOL_LOCK):
+            for path in self.ready_entries():
+                os.unlink(path + READY_SUFFIX)
+                if is_registered_worktree(self.get_repo_root(), path):
+                    return path
+        return None
+
+    def refresh(self, path: str):
+        """Move a spare to the current base tip, reinstalling changed dependencies."""
+        repo_root = self.get_repo_root()
+        tip = run_git(
+            ["rev-parse", resolve_base_ref(repo_root, self.base_branch)], repo_root
+        )
+        head = run_git(["rev-parse", "HEAD"], path)
+        if head == tip:
+            return
+
+        run_git(["reset", "--hard", tip], path)
+        if dependencies_changed(path, head, tip):
+            self.dependency_store.install_worktree(path)
+
+    def claim(self, worktree_name: str) -> Optional[WorktreeResult]:
+        """Turn a spare into the worktree worktree_name.
+
+        Returns:
+            The worktree, or None if the pool is empty or the name already
+            has a worktree or branch; the caller then provisions it as usual
+        """
+        path = os.path.abspath(os.path.join(self.trees_dir, worktree_name))
+        if os.path.exists(path):
+            return None
+        repo_root = self.get_repo_root()
+        if git_succeeds(
+            ["rev-parse", "--verify", "--quiet", f"refs/heads/{worktree_name}"], repo_root
+        ):
+            return None
+
+        started = time.monotonic()
+        entry = self.take_entry()
+        if entry is None:
+            return None
+        self.refill_requested.set()
+
+        moved = False
+        try:
+            self.refresh(entry)
+            with repo_lock(repo_root):
+                run_git(["worktree", "move", entry, path], repo_root)
+                moved = True
+                run_git(["branch", "-m", worktree_name], path)
+            env_files = copy_env_files(repo_root, path, self.target_directory)
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.errors.append(f"Could not claim {entry}: {getattr(e, 'stderr', None) or e}")
+            try:
+                self.discard(path if moved else entry)
+            except (subprocess.CalledProcessError, OSError):
+                pass
+            return None
+
+        return WorktreeResult(
+            worktree_name=worktree_name,
+            path=path,
+            branch=worktree_name,
+            success=True,
+            created=True,
+            env_files=env_files,
+            duration_seconds=round(time.monotonic() - started, 3),
+        )
+
+    def recycle(self, path: str) -> bool:
+        """Return a finished, clean worktree to the pool if it has room.
+
+        The worktree moves to a fresh pool branch at the base tip, keeping
+        its installed dependencies (reinstalled only if a lockfile differs)
+        and build caches. Its old branch is deleted if it is merged.
+
+        Returns:
+            True if the worktree became a spare, False if the pool is full
+
+        Raises:
+            subprocess.CalledProcessError: If a git step fails
+        """
+        if len(self.ready_entries()) >= self.size:
+            return False
+
+        repo_root = self.get_repo_root()
+        tip = run_git(
+            ["rev-parse", resolve_base_ref(repo_root, self.base_branch)], repo_root
+        )
+        head = run_git(["rev-parse", "HEAD"], path)
+        old_branch = run_git(["rev-parse", "--abbrev-ref", "HEAD"], path)
+        name = f"pool-{make_adw_id()}"
+        entry = os.path.abspath(os.path.join(self.pool_dir, name))
+
+        os.makedirs(self.pool_dir, exist_ok=True)
+        with repo_lock(repo_root):
+            run_git(["checkout", "-b", name, tip], path)
+            run_git(["worktree", "move", path, entry], repo_root)
+            git_succeeds(["branch", "-d", old_branch], repo_root)
+        if dependencies_changed(entry, head, tip):
+            self.dependency_store.install_worktree(entry)
+
+        with open(entry + READY_SUFFIX, "w") as f:
+            f.write(tip)
+        return True
+
+    def drain_errors(self) -> List[str]:
+        """Return and forget the errors recorded since the last call."""
+        errors, self.errors = self.errors, []
+        return errors
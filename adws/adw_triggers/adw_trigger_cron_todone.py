@@ -37,6 +37,12 @@ Examples:
 
     # Run once and exit
     ./adws/adw_triggers/adw_trigger_cron_todone.py --once
+
+    # React to tasks.md changes instead of polling
+    ./adws/adw_triggers/adw_trigger_cron_todone.py --watch
+
+    # Pick tasks with the /process_tasks agent instead of the native parser
+    ./adws/adw_triggers/adw_trigger_cron_todone.py --agent-parser
 """
 
 import os
@@ -46,7 +52,7 @@ import time
 import subprocess
 import re
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
 import click
 import schedule
@@ -66,6 +72,7 @@ from agent import (
     AgentTemplateRequest,
     execute_template,
     generate_short_id,
+    get_command_timeout,
 )
 
 # Import our data models
@@ -76,70 +83,52 @@ from data_models import (
     ProcessTasksResponse,
     CronTriggerConfig,
     SystemTag,
+    WorkflowRun,
+    CompletionEvent,
+    WorktreeConfig,
+    WorktreeGCPolicy,
+    get_workflow_timeout,
 )
 
 # Import utility functions
 from utils import parse_json
 
-# Configuration constants
-TARGET_DIRECTORY = "tac8_app2__multi_agent_todone"
+# Native tasks.md parsing and status updates
+from task_list import TaskListManager, get_eligible_task_groups
 
+# Child process tracking for delegated workflows
+from supervisor import WorkflowSupervisor
 
-class TaskListManager:
-    """Manages reading and updating the task list file."""
+# Task file change notification for watch mode
+from file_watcher import TaskFileWatcher
 
-    def __init__(self, file_path: str):
-        self.file_path = Path(file_path)
-        self.console = Console()
+# Completion events pushed by finishing workflows
+from completion_channel import CompletionListener, get_completion_socket_path
 
-    def read_task_list(self) -> str:
-        """Read the current task list file."""
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"Task file not found: {self.file_path}")
-        return self.file_path.read_text()
+# Shared rate-limit circuit breaker for Claude Code launches
+from circuit_breaker import CircuitBreaker
 
-    def update_task_to_in_progress(
-        self, worktree_name: str, task_desc: str, adw_id: str
-    ) -> bool:
-        """Update a task from [] or [⏰] to [🟡, adw_id] status using the /mark_in_progress command."""
-        try:
-            request = AgentTemplateRequest(
-                agent_name="task-marker",
-                slash_command="/mark_in_progress",
-                args=[
-                    str(self.file_path),  # task_file_path
-                    worktree_name,
-                    task_desc,
-                    adw_id,
-                ],
-                adw_id=generate_short_id(),
-                model="sonnet",
-                working_dir=os.getcwd(),  # Run from project root
-            )
+# Host load and memory checks before each dispatch
+from host_load import AdmissionController
 
-            response = execute_template(request)
-            if response.success:
-                return True
-            else:
-                error_panel = Panel(
-                    f"Failed to mark task as in-progress: {task_desc}",
-                    title="[bold red]❌ Update Failed[/bold red]",
-                    border_style="red",
-                )
-                self.console.print(error_panel)
-                return False
-        except Exception as e:
-            error_panel = Panel(
-                f"Error marking task as in-progress: {str(e)}",
-                title="[bold red]❌ Update Error[/bold red]",
-                border_style="red",
-            )
-            self.console.print(error_panel)
-            return False
+# Pre-started workflow workers
+from worker_pool import WorkerPool
+
+# Native git worktree creation, pre-warmed spares and shared dependencies
+from worktree import provision_worktree
+from worktree_gc import collect_garbage
+from dependency_store import DependencyStore, STORE_DIR_NAME
+from build_cache import BuildCache, STORE_DIR_NAME as BUILD_CACHE_DIR_NAME
+from worktree_pool import WorktreePool
+from heartbeat import (
+    read_heartbeat,
+    heartbeat_is_stale,
+    load_resume_attempts,
+    record_resume_attempt,
+)
 
-    def write_task_list(self, content: str):
-        """Write updated content back to the task list file."""
-        self.file_path.write_text(content)
+# Configuration constants
+TARGET_DIRECTORY = "tac8_app2__multi_agent_todone"
 
 
 class CronTrigger:
@@ -149,10 +138,47 @@ class CronTrigger:
         self.config = config
         self.console = Console()
         self.task_manager = TaskListManager(config.task_file_path)
+        self.supervisor = WorkflowSupervisor()
+        self.completion_listener = CompletionListener(
+            get_completion_socket_path(config.task_file_path)
+        )
+        self.circuit_breaker = CircuitBreaker()
+        self.admission = AdmissionController(config)
+        self.worker_pool = (
+            WorkerPool(config.worker_pool_size, cwd=os.getcwd())
+            if config.worker_pool_size and not config.dry_run
+            else None
+        )
+        self.dependency_store = DependencyStore(
+            os.path.join(config.worktree_base_path, STORE_DIR_NAME)
+        )
+        self.build_cache = BuildCache(
+            os.path.join(config.worktree_base_path, BUILD_CACHE_DIR_NAME)
+        )
+        self.worktree_pool = (
+            WorktreePool(
+                config.worktree_pool_size,
+                target_directory=TARGET_DIRECTORY,
+                trees_dir=config.worktree_base_path,
+                dependency_store=self.dependency_store,
+                build_cache=self.build_cache,
+            )
+            if config.worktree_pool_size and not config.dry_run
+            else None
+        )
+        self.launches_paused = False
+        self.orphan_candidates: Dict[str, float] = {}
+        self.last_gc = 0.0
         self.running = True
         self.stats = {
             "checks": 0,
             "tasks_started": 0,
+            "tasks_succeeded": 0,
+            "tasks_failed": 0,
+            "tasks_deferred": 0,
+            "tasks_resumed": 0,
+            "tasks_timed_out": 0,
+            "worktrees_collected": 0,
             "worktrees_created": 0,
             "errors": 0,
             "last_check": None,
@@ -164,7 +190,7 @@ class CronTrigger:
         return worktree_path.exists()
 
     def create_worktree(self, worktree_name: str) -> bool:
-        """Create a new worktree using the init_worktree command."""
+        """Create a new worktree with git, sparse-checked out to the target directory."""
         if self.config.dry_run:
             self.console.print(
                 f"[yellow]DRY RUN: Would create worktree '{worktree_name}'[/yellow]"
@@ -172,20 +198,35 @@ class CronTrigger:
             return True
 
         try:
-            request = AgentTemplateRequest(
-                agent_name="worktree-creator",
-                slash_command="/init_worktree",
-                args=[worktree_name, TARGET_DIRECTORY],
-                adw_id=generate_short_id(),
-                model="sonnet",
-                working_dir=os.getcwd(),
-            )
-
-            response = execute_template(request)
-            if response.success:
-                self.stats["worktrees_created"] += 1
+            # A pre-warmed spare skips the checkout and dependency install
+            result = self.worktree_pool.claim(worktree_name) if self.worktree_pool else None
+            if self.worktree_pool:
+                for error in self.worktree_pool.drain_errors():
+                    self.console.print(f"[yellow]Worktree pool: {error}[/yellow]")
+            source = "from pool" if result else "with git"
+            if result is None:
+                result = provision_worktree(
+                    WorktreeConfig(
+                        worktree_name=worktree_name, target_directory=TARGET_DIRECTORY
+                    ),
+                    trees_dir=self.config.worktree_base_path,
+                    dependency_store=self.dependency_store,
+                    build_cache=self.build_cache,
+                )
+            if result.success:
+                if result.created:
+                    self.stats["worktrees_created"] += 1
+                details = "".join(
+                    f"\n  • {lockfile}: {outcome}"
+                    for lockfile, outcome in result.dependencies.items()
+                )
+                if result.build_cache_seed:
+                    details += f"\n  • Build cache: seeded from {result.build_cache_seed[:9]}"
+                details += "".join(f"\n⚠️ {warning}" for warning in result.warnings)
                 success_panel = Panel(
-                    f"✓ Created worktree: {worktree_name}",
+                    f"✓ Created worktree {source}: {worktree_name} "
+                    f"(branch {result.branch}, {result.duration_seconds:.1f}s)"
+                    + details,
                     title="[bold green]Worktree Created[/bold green]",
                     border_style="green",
                 )
@@ -193,7 +234,7 @@ class CronTrigger:
                 return True
             else:
                 error_panel = Panel(
-                    f"Failed to create worktree: {worktree_name}",
+                    f"Failed to create worktree: {worktree_name}\n{result.error_message}",
                     title="[bold red]❌ Worktree Creation Failed[/bold red]",
                     border_style="red",
                 )
@@ -211,6 +252,30 @@ class CronTrigger:
             return False
 
     def get_eligible_tasks(self) -> List[WorktreeTaskGroup]:
+        """Get eligible tasks from the task list.
+
+        Parses tasks.md in-process by default. The /process_tasks agent is only
+        used when the trigger is configured with use_agent_parser.
+        """
+        if self.config.use_agent_parser:
+            return self.get_eligible_tasks_from_agent()
+
+        try:
+            return get_eligible_task_groups(self.task_manager.get_worktrees())
+        except FileNotFoundError:
+            # Task file doesn't exist, return empty list
+            return []
+        except Exception as e:
+            error_panel = Panel(
+                f"Error parsing task file: {str(e)}",
+                title="[bold red]❌ Parse Error[/bold red]",
+                border_style="red",
+            )
+            self.console.print(error_panel)
+            self.stats["errors"] += 1
+            return []
+
+    def get_eligible_tasks_from_agent(self) -> List[WorktreeTaskGroup]:
         """Get eligible tasks by running the process_tasks command."""
         # First, check if there are any pending tasks in the file
         # to avoid unnecessary agent calls
@@ -284,18 +349,35 @@ class CronTrigger:
             return []
 
     def delegate_task(
-        self, worktree_name: str, task_desc: str, adw_id: str, tags: List[str] = None
-    ):
+        self,
+        worktree_name: str,
+        task_desc: str,
+        adw_id: str,
+        tags: List[str] = None,
+        resume: bool = False,
+        resume_attempts: int = 0,
+    ) -> bool:
         """Delegate a task to the appropriate workflow based on tags.
 
         By default, uses the lightweight build-update workflow.
         If 'adw_plan_implement_update_task' tag is present, uses the full plan-implement-update workflow.
         Model selection: 'opus' tag uses opus model, 'sonnet' tag uses sonnet model, default is sonnet.
+        With resume, the workflow reruns under the same ADW ID with --resume and
+        skips the phases its previous run completed.
+
+        Returns:
+            True if the workflow process was started (or would be, in dry-run mode)
         """
         # Extract workflow and model from tags
         tags = tags or []
         use_full_workflow = SystemTag.extract_workflow_from_tags(tags)
         model = SystemTag.extract_model_from_tags(tags) or "sonnet"  # Default to sonnet
+        budget_seconds = (
+            SystemTag.get_workflow_budget(tags, get_command_timeout)
+            * self.config.workflow_budget_scale
+            if self.config.watchdog
+            else None
+        )
 
         if self.config.dry_run:
             workflow_type = (
@@ -304,7 +386,7 @@ class CronTrigger:
             self.console.print(
                 f"[yellow]DRY RUN: Would delegate task '{task_desc}' with ADW ID {adw_id} using {workflow_type} workflow with {model} model[/yellow]"
             )
-            return
+            return True
 
         try:
             # Determine which workflow script to use
@@ -312,17 +394,15 @@ class CronTrigger:
                 # Use the full plan-implement-update workflow
                 workflow_script = "adw_plan_implement_update_task.py"
                 workflow_type = "plan-implement-update"
-                slash_command = "/plan + /implement + /update_task"
+                slash_command = "/plan + /implement"
             else:
                 # Use the lightweight build-update workflow (default)
                 workflow_script = "adw_build_update_task.py"
                 workflow_type = "build-update"
-                slash_command = "/build + /update_task"
+                slash_command = "/build"
 
             # Build the command to run the workflow
-            cmd = [
-                sys.executable,
-                os.path.join(parent_dir, workflow_script),
+            workflow_args = [
                 "--adw-id",
                 adw_id,
                 "--worktree-name",
@@ -331,7 +411,17 @@ class CronTrigger:
                 task_desc,
                 "--model",
                 model,
+                "--task-file",
+                os.path.abspath(self.config.task_file_path),
             ]
+            if budget_seconds:
+                # The workflow's own deadline expires first, so its agents are
+                # stopped and the task failed cleanly before the watchdog kill
+                workflow_args.extend(
+                    ["--workflow-timeout", str(get_workflow_timeout(budget_seconds))]
+                )
+            if resume:
+                workflow_args.append("--resume")
 
             # Create a panel showing the agent execution details
             exec_details = f"[bold]Slash Command:[/bold] {slash_command}\n"
@@ -341,6 +431,13 @@ class CronTrigger:
             exec_details += f"  • Task: {task_desc}\n"
             exec_details += f"  • Model: {model}\n"
             exec_details += f"  • Workflow: {workflow_type}"
+            if budget_seconds:
+                exec_details += (
+                    f"\n  • Budget: {budget_seconds:.0f}s "
+                    f"(workflow timeout {get_workflow_timeout(budget_seconds)}s)"
+                )
+            if resume:
+                exec_details += f"\n  • Resume: attempt {resume_attempts}"
 
             exec_panel = Panel(
                 exec_details,
@@ -350,18 +447,32 @@ class CronTrigger:
             )
             self.console.print(exec_panel)
 
-            # Run the workflow in a subprocess
-            result = subprocess.Popen(cmd)
+            # Run the workflow in a supervised subprocess, on a warm worker if pooled
+            if self.worker_pool:
+                process = self.worker_pool.dispatch(
+                    os.path.splitext(workflow_script)[0], workflow_args
+                )
+                run = self.supervisor.adopt(
+                    adw_id, process, worktree_name, task_desc, budget_seconds
+                )
+            else:
+                cmd = [sys.executable, os.path.join(parent_dir, workflow_script)]
+                run = self.supervisor.launch(
+                    adw_id, cmd + workflow_args, worktree_name, task_desc, budget_seconds
+                )
+            run.tags = list(tags)
+            run.resume_attempts = resume_attempts
 
             self.stats["tasks_started"] += 1
 
             # Create success panel for task delegation
             delegation_panel = Panel(
-                f"✓ Task delegated with ADW ID: {adw_id}",
+                f"✓ Task delegated with ADW ID: {adw_id} (pid {run.pid})",
                 title="[bold green]✅ Task Delegated[/bold green]",
                 border_style="green",
             )
             self.console.print(delegation_panel)
+            return True
 
         except Exception as e:
             error_panel = Panel(
@@ -371,14 +482,360 @@ class CronTrigger:
             )
             self.console.print(error_panel)
             self.stats["errors"] += 1
+            return False
+
+    def enforce_workflow_budgets(self) -> List[WorkflowRun]:
+        """Kill workflows that overran their wall-clock budget and fail their tasks.
+
+        A stuck agent would otherwise hold its concurrency slot forever. The
+        task is marked [❌] before the process is reaped, so crash recovery
+        leaves it alone.
+        """
+        if not self.config.watchdog:
+            return []
+
+        killed = self.supervisor.kill_expired()
+        for run in killed:
+            self.stats["tasks_timed_out"] += 1
+            try:
+                self.task_manager.update_task_status(
+                    run.worktree_name,
+                    run.task_description,
+                    "[❌]",
+                    adw_id=run.adw_id,
+                    error_message=f"Workflow timed out after {run.budget_seconds:.0f}s",
+                    allowed_statuses=["[🟡]"],
+                )
+            except FileNotFoundError:
+                pass
+            self.console.print(
+                Panel(
+                    f"ADW ID: {run.adw_id}\n"
+                    f"Worktree: {run.worktree_name}\n"
+                    f"Task: {run.task_description}\n"
+                    f"Budget: {run.budget_seconds:.0f}s, process tree terminated",
+                    title="[bold red]⏱️ Workflow Timed Out[/bold red]",
+                    border_style="red",
+                )
+            )
+        return killed
+
+    def reap_workflows(self) -> List[WorkflowRun]:
+        """Record workflows that exited since the last check."""
+        self.enforce_workflow_budgets()
+        finished = self.supervisor.reap()
+        for run in finished:
+            if run.succeeded():
+                self.stats["tasks_succeeded"] += 1
+                border_style = "green"
+                title = "[bold green]✅ Workflow Finished[/bold green]"
+            else:
+                self.stats["tasks_failed"] += 1
+                border_style = "red"
+                title = "[bold red]❌ Workflow Failed[/bold red]"
+
+            self.console.print(
+                Panel(
+                    f"ADW ID: {run.adw_id}\n"
+                    f"Worktree: {run.worktree_name}\n"
+                    f"Task: {run.task_description}\n"
+                    f"Exit code: {run.exit_code}\n"
+                    f"Wall time: {run.duration_seconds:.1f}s",
+                    title=title,
+                    border_style=border_style,
+                )
+            )
+
+            if not run.succeeded():
+                self.recover_crashed_workflow(run)
+        return finished
+
+    def recover_crashed_workflow(self, run: WorkflowRun) -> bool:
+        """Resume a workflow that exited without writing its task's final status.
+
+        A task still marked [🟡, adw_id] after its process exited means the
+        workflow crashed or was killed mid-phase.
+
+        Returns:
+            True if the workflow was restarted
+        """
+        if self.config.dry_run:
+            return False
+        try:
+            task = self.task_manager.find_task(run.adw_id)
+        except FileNotFoundError:
+            return False
+        if task is None or task.status != "[🟡]":
+            # The workflow recorded its outcome before exiting
+            return False
+
+        return self.resume_task(
+            run.worktree_name,
+            run.task_description,
+            run.adw_id,
+            run.tags,
+            f"workflow exited with code {run.exit_code}",
+        )
+
+    def recover_orphaned_tasks(self) -> int:
+        """Resume [🟡] tasks whose workflow died with a previous trigger or boot.
+
+        Tasks this trigger supervises are skipped. For the others the
+        workflow's heartbeat decides: a dead pid, a different boot ID or a
+        heartbeat older than heartbeat_timeout_seconds means the workflow is
+        gone. A task without any heartbeat counts as orphaned once it has
+        looked that way for heartbeat_timeout_seconds.
+
+        Returns:
+            Number of tasks resumed
+        """
+        try:
+            worktrees = self.task_manager.get_worktrees()
+        except FileNotFoundError:
+            return 0
+
+        in_progress = {
+            task.adw_id: (worktree.name, task)
+            for worktree in worktrees
+            for task in worktree.tasks
+            if task.status == "[🟡]" and task.adw_id
+        }
+        # Forget candidates that finished or were edited by hand
+        self.orphan_candidates = {
+            adw_id: seen
+            for adw_id, seen in self.orphan_candidates.items()
+            if adw_id in in_progress
+        }
+
+        resumed = 0
+        for adw_id, (worktree_name, task) in in_progress.items():
+            if adw_id in self.supervisor.processes:
+                continue
+
+            heartbeat = read_heartbeat(adw_id)
+            if heartbeat is not None:
+                if not heartbeat_is_stale(heartbeat, self.config.heartbeat_timeout_seconds):
+                    continue
+                reason = (
+                    f"heartbeat from pid {heartbeat.pid} on {heartbeat.hostname} is stale"
+                )
+            else:
+                first_seen = self.orphan_candidates.setdefault(adw_id, time.time())
+                if time.time() - first_seen < self.config.heartbeat_timeout_seconds:
+                    continue
+                reason = "no workflow heartbeat"
+
+            if self.config.dry_run:
+                self.console.print(
+                    f"[yellow]DRY RUN: Would resume orphaned task '{task.description}' "
+                    f"({adw_id}): {reason}[/yellow]"
+                )
+                continue
+
+            if not self.supervisor.has_capacity(self.config.max_concurrent_tasks):
+                break
+
+            self.orphan_candidates.pop(adw_id, None)
+            if self.resume_task(worktree_name, task.description, adw_id, task.tags, reason):
+                resumed += 1
+
+        return resumed
+
+    def resume_task(
+        self,
+        worktree_name: str,
+        task_desc: str,
+        adw_id: str,
+        tags: List[str],
+        reason: str,
+    ) -> bool:
+        """Rerun an in-progress task with --resume, within its retry budget.
+
+        The workflow continues under the same ADW ID from its first incomplete
+        phase. Once max_resume_attempts is used up the task is marked [❌] so it
+        does not stay in progress forever. The attempt count is kept under
+        agents/<adw_id>/, so the budget survives trigger restarts.
+
+        Returns:
+            True if the workflow was restarted
+        """
+        attempts = load_resume_attempts(adw_id)
+        if attempts >= self.config.max_resume_attempts:
+            self.task_manager.update_task_status(
+                worktree_name,
+                task_desc,
+                "[❌]",
+                adw_id=adw_id,
+                error_message=f"Workflow lost ({reason}) after {attempts} resume attempt(s)",
+                allowed_statuses=["[🟡]"],
+            )
+            self.console.print(
+                Panel(
+                    f"Task {adw_id}: {reason}\n"
+                    f"Resume budget of {self.config.max_resume_attempts} used up, marked as failed",
+                    title="[bold red]❌ Workflow Lost[/bold red]",
+                    border_style="red",
+                )
+            )
+            return False
+
+        attempts = record_resume_attempt(adw_id, reason)
+        self.console.print(
+            Panel(
+                f"Task {adw_id} is still in progress but {reason}.\n"
+                f"Resuming from the first incomplete phase "
+                f"(attempt {attempts} of {self.config.max_resume_attempts})",
+                title="[bold yellow]🔁 Resuming Workflow[/bold yellow]",
+                border_style="yellow",
+            )
+        )
+        resumed = self.delegate_task(
+            worktree_name,
+            task_desc,
+            adw_id,
+            tags,
+            resume=True,
+            resume_attempts=attempts,
+        )
+        if resumed:
+            self.stats["tasks_resumed"] += 1
+        return resumed
+
+    def refresh_build_cache(self):
+        """Snapshot the main checkout's build caches after a completed build.
+
+        New worktrees are seeded from these snapshots, so their first type
+        check and `next build` are incremental. The copy runs in a
+        background thread; this only checks build times and reports
+        snapshots finished since the last cycle.
+        """
+        if self.config.dry_run:
+            return
+        for commit in self.build_cache.drain_published():
+            self.console.print(
+                f"[dim]Build cache snapshot updated for {commit[:9]}[/dim]"
+            )
+        try:
+            self.build_cache.start_refresh(os.getcwd())
+        except (subprocess.CalledProcessError, OSError):
+            # Not a git checkout
+            pass
+
+    def collect_worktree_garbage(self):
+        """Run a worktree garbage collection pass if gc_interval_seconds has passed.
+
+        Worktrees whose tasks are all finished, that are clean, merged or
+        pushed and idle for gc_retention_hours go back to the worktree pool
+        or are removed. In dry-run mode the pass only reports.
+        """
+        interval = self.config.gc_interval_seconds
+        if not interval or time.time() - self.last_gc < interval:
+            return
+        self.last_gc = time.time()
+
+        try:
+            worktrees = self.task_manager.get_worktrees()
+        except FileNotFoundError:
+            return
+
+        try:
+            decisions = collect_garbage(
+                worktrees,
+                WorktreeGCPolicy(retention_hours=self.config.gc_retention_hours),
+                trees_dir=self.config.worktree_base_path,
+                active_worktrees={run.worktree_name for run in self.supervisor.get_running()},
+                worktree_pool=self.worktree_pool,
+                dependency_store=self.dependency_store,
+                dry_run=self.config.dry_run,
+            )
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.console.print(f"[dim]Worktree GC skipped: {e}[/dim]")
+            return
 
-    def process_tasks(self):
-        """Main task processing logic."""
+        collected = [d for d in decisions if d.action != "keep"]
+        failed = [d for d in decisions if d.error_message]
+        if not collected and not failed:
+            return
+        if not self.config.dry_run:
+            self.stats["worktrees_collected"] += len(collected)
+
+        lines = [
+            f"{'Would collect' if self.config.dry_run else d.action.capitalize()}: "
+            f"{d.worktree_name} ({d.reason})"
+            for d in collected
+        ]
+        lines += [f"⚠️ {d.worktree_name}: {d.error_message}" for d in failed]
+        self.console.print(
+            Panel(
+                "\n".join(lines),
+                title="[bold blue]🧹 Worktree GC[/bold blue]",
+                border_style="blue",
+            )
+        )
+
+    def handle_completions(self, events: List[CompletionEvent]):
+        """Re-evaluate the worktrees of workflows that just finished.
+
+        A finished task can unblock the next [⏰] task in its worktree, so
+        those worktrees are processed right away instead of on the next poll.
+        """
+        if not events:
+            return
+
+        for event in events:
+            self.console.print(
+                f"[dim]Completion: {event.adw_id} {event.status} in {event.worktree_name}[/dim]"
+            )
+        self.process_tasks(worktree_names={event.worktree_name for event in events})
+
+    def wait_for_completions(self, timeout: Optional[float]):
+        """Sleep up to timeout seconds, handling completion events as they arrive."""
+        self.handle_completions(self.completion_listener.wait(timeout))
+
+    def process_tasks(self, worktree_names: Optional[Set[str]] = None):
+        """Main task processing logic.
+
+        Args:
+            worktree_names: Only start tasks in these worktrees (all if None)
+        """
         self.stats["checks"] += 1
         self.stats["last_check"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+        # Free slots held by workflows that have exited
+        self.reap_workflows()
+
+        # Snapshot the build caches of a build that finished on the base branch
+        self.refresh_build_cache()
+
+        # Recycle or remove worktrees whose tasks have all finished
+        self.collect_worktree_garbage()
+
+        if not self.supervisor.has_capacity(self.config.max_concurrent_tasks):
+            self.console.print(
+                f"[dim]{self.supervisor.running_count()} workflows running "
+                f"(max {self.config.max_concurrent_tasks}), waiting for a free slot[/dim]"
+            )
+            return
+
+        # Hold off new launches while the Claude API is rate limiting
+        circuit_wait = self.circuit_breaker.remaining_seconds()
+        self.launches_paused = circuit_wait > 0
+        if self.launches_paused:
+            self.console.print(
+                f"[yellow]Claude API rate limited, pausing new launches for "
+                f"{circuit_wait:.0f}s[/yellow]"
+            )
+            return
+
+        # Pick up tasks orphaned by a trigger or host restart
+        self.recover_orphaned_tasks()
+        if not self.supervisor.has_capacity(self.config.max_concurrent_tasks):
+            return
+
         # Get eligible tasks
         task_groups = self.get_eligible_tasks()
+        if worktree_names is not None:
+            task_groups = [g for g in task_groups if g.worktree_name in worktree_names]
 
         if not task_groups:
             # Print newline to ensure we're on a fresh line (clears any status spinners)
@@ -433,6 +890,9 @@ class CronTrigger:
             )
             self.console.print(tasks_panel)
 
+        # Sample host load once; each admitted task is charged against the headroom
+        self.admission.begin_cycle()
+
         # Process each worktree group
         for group in task_groups:
             # Check if worktree exists, create if needed
@@ -448,6 +908,31 @@ class CronTrigger:
 
             # Process tasks in this worktree
             for task in group.tasks_to_start:
+                # Respect max concurrent tasks based on live running workflows
+                if not self.supervisor.has_capacity(self.config.max_concurrent_tasks):
+                    warning_panel = Panel(
+                        f"Reached max concurrent tasks ({self.config.max_concurrent_tasks}), "
+                        "remaining tasks will start when a workflow finishes",
+                        title="[bold yellow]⚠️ Task Limit[/bold yellow]",
+                        border_style="yellow",
+                    )
+                    self.console.print(warning_panel)
+                    return
+
+                # Defer the remaining tasks while the host is saturated
+                admitted, reason = self.admission.admit()
+                if not admitted:
+                    self.stats["tasks_deferred"] += 1
+                    self.launches_paused = True
+                    warning_panel = Panel(
+                        f"Host is busy: {reason}\n"
+                        "Remaining tasks will start when there is headroom",
+                        title="[bold yellow]⚠️ Host Saturated[/bold yellow]",
+                        border_style="yellow",
+                    )
+                    self.console.print(warning_panel)
+                    return
+
                 # Generate ADW ID for this task
                 adw_id = generate_short_id()
 
@@ -480,9 +965,18 @@ class CronTrigger:
                         )
 
                     # Delegate task to workflow
-                    self.delegate_task(
+                    delegated = self.delegate_task(
                         group.worktree_name, task.description, adw_id, task.tags
                     )
+                    if not delegated and not self.config.dry_run:
+                        # Don't leave the task stuck in [🟡] with no process behind it
+                        self.task_manager.update_task_status(
+                            group.worktree_name,
+                            task.description,
+                            "[❌]",
+                            adw_id=adw_id,
+                            error_message="Failed to start workflow process",
+                        )
 
                 except Exception as e:
                     error_panel = Panel(
@@ -494,16 +988,6 @@ class CronTrigger:
                     self.stats["errors"] += 1
                     continue
 
-                # Respect max concurrent tasks
-                if self.stats["tasks_started"] >= self.config.max_concurrent_tasks:
-                    warning_panel = Panel(
-                        f"Reached max concurrent tasks ({self.config.max_concurrent_tasks})",
-                        title="[bold yellow]⚠️ Task Limit[/bold yellow]",
-                        border_style="yellow",
-                    )
-                    self.console.print(warning_panel)
-                    return
-
     def create_status_display(self) -> Panel:
         """Create a status display panel."""
         table = Table(show_header=False, box=None)
@@ -513,13 +997,58 @@ class CronTrigger:
         table.add_row(
             "Status", "[green]Running[/green]" if self.running else "[red]Stopped[/red]"
         )
-        table.add_row("Polling Interval", f"{self.config.polling_interval} seconds")
+        if self.config.watch:
+            table.add_row("Mode", f"Watch (debounce {self.config.debounce_seconds}s)")
+        else:
+            table.add_row("Polling Interval", f"{self.config.polling_interval} seconds")
         table.add_row("Task File", str(self.config.task_file_path))
+        table.add_row(
+            "Task Parser", "/process_tasks agent" if self.config.use_agent_parser else "Native"
+        )
         table.add_row("Dry Run", "Yes" if self.config.dry_run else "No")
+        table.add_row(
+            "Workers",
+            f"{self.config.worker_pool_size} pre-started"
+            if self.worker_pool
+            else "Fresh process per task",
+        )
+        table.add_row(
+            "Worktree Pool",
+            f"{len(self.worktree_pool.ready_entries())} / {self.worktree_pool.size} ready"
+            if self.worktree_pool
+            else "Disabled",
+        )
+        table.add_row(
+            "Dependency Store",
+            f"{self.dependency_store.get_entry_count()} dependency sets",
+        )
         table.add_row("", "")
         table.add_row("Checks", str(self.stats["checks"]))
         table.add_row("Tasks Started", str(self.stats["tasks_started"]))
+        table.add_row(
+            "Running",
+            f"{self.supervisor.running_count()} / {self.config.max_concurrent_tasks}",
+        )
+        table.add_row("Succeeded", str(self.stats["tasks_succeeded"]))
+        table.add_row("Failed", str(self.stats["tasks_failed"]))
+        table.add_row("Resumed", str(self.stats["tasks_resumed"]))
+        table.add_row("Timed Out", str(self.stats["tasks_timed_out"]))
+        table.add_row("Deferred (Host Load)", str(self.stats["tasks_deferred"]))
+        snapshot = self.admission.snapshot
+        if snapshot is not None:
+            load = f"{snapshot.load_average:.2f}" if snapshot.load_average is not None else "n/a"
+            memory = (
+                f"{snapshot.available_memory_mb:.0f} MiB"
+                if snapshot.available_memory_mb is not None
+                else "n/a"
+            )
+            table.add_row(
+                "Host",
+                f"load {load} / {snapshot.cpu_count} CPUs, {memory} free, "
+                f"{snapshot.agent_processes} agents",
+            )
         table.add_row("Worktrees Created", str(self.stats["worktrees_created"]))
+        table.add_row("Worktrees Collected", str(self.stats["worktrees_collected"]))
         table.add_row("Errors", str(self.stats["errors"]))
         table.add_row("Last Check", self.stats["last_check"] or "Never")
 
@@ -529,17 +1058,113 @@ class CronTrigger:
             border_style="blue",
         )
 
+    def start_completion_listener(self):
+        """Listen for completion events from workflows, if possible."""
+        if self.completion_listener.start():
+            self.console.print(
+                f"[dim]Listening for workflow completions on {self.completion_listener.socket_path}[/dim]"
+            )
+        else:
+            self.console.print(
+                "[yellow]Completion socket unavailable; blocked tasks will start on the next check[/yellow]"
+            )
+
+    def start_worker_pool(self):
+        """Start the pre-started workflow workers, if enabled."""
+        if self.worker_pool:
+            self.worker_pool.fill()
+            self.console.print(
+                f"[green]Started {self.worker_pool.size} workflow workers[/green]"
+            )
+
+    def stop_worker_pool(self):
+        """Stop idle workers; workers running a task are left to finish it."""
+        if self.worker_pool:
+            self.worker_pool.close()
+
+    def start_worktree_pool(self):
+        """Start warming spare worktrees in the background, if enabled."""
+        if self.worktree_pool:
+            self.worktree_pool.start()
+            self.console.print(
+                f"[green]Keeping {self.worktree_pool.size} spare worktrees ready "
+                f"({len(self.worktree_pool.ready_entries())} ready now)[/green]"
+            )
+
+    def stop_worktree_pool(self):
+        """Stop warming; ready spares stay on disk for the next run."""
+        if self.worktree_pool:
+            self.worktree_pool.stop()
+
     def run_once(self):
         """Run the task check once and exit."""
         self.console.print(self.create_status_display())
         self.console.print("\n[yellow]Running single check...[/yellow]\n")
-        self.process_tasks()
+        try:
+            self.process_tasks()
+        finally:
+            self.stop_worker_pool()
         self.console.print("\n[green]✅ Single check completed[/green]")
 
+    def run_watch(self):
+        """Run continuously, processing tasks whenever the task file changes.
+
+        While workflows are running, or launches are paused by the rate-limit
+        circuit breaker or host load, the trigger also wakes every polling
+        interval, so freed slots are refilled without waiting for the next edit.
+        When idle it still wakes for the worktree garbage collection timer.
+        """
+        watcher = TaskFileWatcher(
+            self.config.task_file_path, debounce_seconds=self.config.debounce_seconds
+        )
+        self.start_completion_listener()
+        self.start_worker_pool()
+        self.start_worktree_pool()
+
+        self.console.print(self.create_status_display())
+        self.console.print(
+            f"\n[green]Watching {self.config.task_file_path} for changes ({watcher.backend})[/green]"
+        )
+        self.console.print("[dim]Press Ctrl+C to stop[/dim]\n")
+
+        try:
+            self.process_tasks()
+            while self.running:
+                timeout = (
+                    self.config.polling_interval
+                    if self.supervisor.running_count() or self.launches_paused
+                    else self.config.gc_interval_seconds or None
+                )
+                changed = watcher.wait_for_change(
+                    timeout, wake_fd=self.completion_listener.fileno()
+                )
+                events = self.completion_listener.receive()
+                if changed:
+                    self.process_tasks()
+                elif events:
+                    self.handle_completions(events)
+                elif self.reap_workflows() or self.launches_paused:
+                    self.process_tasks()
+                else:
+                    self.collect_worktree_garbage()
+        except KeyboardInterrupt:
+            self.running = False
+            self.console.print("\n[yellow]Stopping cron trigger...[/yellow]")
+            self.console.print(self.create_status_display())
+            self.console.print("[green]✅ Cron trigger stopped[/green]")
+        finally:
+            watcher.close()
+            self.completion_listener.close()
+            self.stop_worker_pool()
+            self.stop_worktree_pool()
+
     def run_continuous(self):
         """Run continuously with scheduled checks."""
         # Schedule the task processing
         schedule.every(self.config.polling_interval).seconds.do(self.process_tasks)
+        self.start_completion_listener()
+        self.start_worker_pool()
+        self.start_worktree_pool()
 
         self.console.print(self.create_status_display())
         self.console.print(
@@ -550,12 +1175,16 @@ class CronTrigger:
         try:
             while self.running:
                 schedule.run_pending()
-                time.sleep(1)
+                self.wait_for_completions(1)
         except KeyboardInterrupt:
             self.running = False
             self.console.print("\n[yellow]Stopping cron trigger...[/yellow]")
             self.console.print(self.create_status_display())
             self.console.print("[green]✅ Cron trigger stopped[/green]")
+        finally:
+            self.completion_listener.close()
+            self.stop_worker_pool()
+            self.stop_worktree_pool()
 
 
 @click.command()
@@ -572,11 +1201,100 @@ class CronTrigger:
     "--dry-run", is_flag=True, help="Run in dry-run mode without making changes"
 )
 @click.option(
-    "--max-tasks", type=int, default=5, help="Maximum concurrent tasks (default: 5)"
+    "--max-tasks",
+    type=int,
+    default=5,
+    help="Maximum concurrently running workflows (default: 5)",
 )
 @click.option(
     "--once", is_flag=True, help="Run once and exit instead of continuous monitoring"
 )
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Process tasks when the task file changes instead of polling",
+)
+@click.option(
+    "--debounce",
+    type=float,
+    default=0.25,
+    help="Seconds the task file must be quiet before processing in watch mode (default: 0.25)",
+)
+@click.option(
+    "--agent-parser",
+    is_flag=True,
+    help="Use the /process_tasks agent instead of the native tasks.md parser",
+)
+@click.option(
+    "--max-load",
+    type=float,
+    default=1.0,
+    help="Defer tasks while the load average per CPU is above this (default: 1.0)",
+)
+@click.option(
+    "--min-memory",
+    type=int,
+    default=1024,
+    help="Defer tasks that would leave less than this much memory in MiB (default: 1024)",
+)
+@click.option(
+    "--max-agents",
+    type=int,
+    default=None,
+    help="Defer tasks while this many Claude Code processes run on the host",
+)
+@click.option(
+    "--no-admission-control",
+    is_flag=True,
+    help="Start tasks regardless of host load and memory",
+)
+@click.option(
+    "--worker-pool",
+    type=int,
+    default=0,
+    help="Keep this many pre-started workflow workers ready (default: 0, fresh process per task)",
+)
+@click.option(
+    "--worktree-pool",
+    type=int,
+    default=0,
+    help="Keep this many pre-warmed worktrees ready for new worktree sections (default: 0)",
+)
+@click.option(
+    "--max-resume-attempts",
+    type=int,
+    default=1,
+    help="Rerun a crashed or orphaned workflow with --resume this many times before failing its task (default: 1)",
+)
+@click.option(
+    "--heartbeat-timeout",
+    type=int,
+    default=90,
+    help="Seconds without a workflow heartbeat before an in-progress task is resumed (default: 90)",
+)
+@click.option(
+    "--budget-scale",
+    type=float,
+    default=1.0,
+    help="Multiply the per-tag workflow wall-clock budgets by this (default: 1.0)",
+)
+@click.option(
+    "--no-watchdog",
+    is_flag=True,
+    help="Let workflows run past their wall-clock budget",
+)
+@click.option(
+    "--gc-interval",
+    type=int,
+    default=600,
+    help="Seconds between worktree garbage collection passes, 0 to disable (default: 600)",
+)
+@click.option(
+    "--gc-retention-hours",
+    type=float,
+    default=24,
+    help="Keep finished worktrees this many hours after their last activity (default: 24)",
+)
 @click.option("--verbose", is_flag=True, help="Enable verbose output")
 def main(
     interval: int,
@@ -584,6 +1302,21 @@ def main(
     dry_run: bool,
     max_tasks: int,
     once: bool,
+    watch: bool,
+    debounce: float,
+    agent_parser: bool,
+    max_load: float,
+    min_memory: int,
+    max_agents: Optional[int],
+    no_admission_control: bool,
+    worker_pool: int,
+    worktree_pool: int,
+    max_resume_attempts: int,
+    heartbeat_timeout: int,
+    budget_scale: float,
+    no_watchdog: bool,
+    gc_interval: int,
+    gc_retention_hours: float,
     verbose: bool,
 ):
     """Monitor and distribute tasks from the multi-agent task list."""
@@ -595,6 +1328,21 @@ def main(
         task_file_path=task_file,
         dry_run=dry_run,
         max_concurrent_tasks=max_tasks,
+        use_agent_parser=agent_parser,
+        watch=watch,
+        debounce_seconds=debounce,
+        admission_control=not no_admission_control,
+        max_load_per_cpu=max_load,
+        min_available_memory_mb=min_memory,
+        max_agent_processes=max_agents,
+        worker_pool_size=worker_pool,
+        worktree_pool_size=worktree_pool,
+        max_resume_attempts=max_resume_attempts,
+        heartbeat_timeout_seconds=heartbeat_timeout,
+        watchdog=not no_watchdog,
+        workflow_budget_scale=budget_scale,
+        gc_interval_seconds=gc_interval,
+        gc_retention_hours=gc_retention_hours,
     )
 
     # Create and run the trigger
@@ -602,6 +1350,8 @@ def main(
 
     if once:
         trigger.run_once()
+    elif watch:
+        trigger.run_watch()
     else:
         trigger.run_continuous()
 
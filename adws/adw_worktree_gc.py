@@ -0,0 +1,175 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.10"
+# dependencies = [
+#   "pydantic",
+#   "python-dotenv",
+#   "click",
+#   "rich",
+# ]
+# ///
+"""
+Remove or recycle worktrees whose tasks have all finished.
+
+A worktree under trees/ is collected when its section in tasks.md has
+tasks and every one is [✅] or [❌], it has no uncommitted changes, its
+branch is merged into the base branch or pushed, and it has been idle for
+the retention period. The cron trigger runs the same pass every --gc-interval
+seconds; this script runs it once.
+
+Usage:
+    # Method 1: Direct execution (requires uv)
+    ./adws/adw_worktree_gc.py
+
+    # Method 2: Using uv run
+    uv run adws/adw_worktree_gc.py --dry-run
+
+Examples:
+    # Show what would be collected
+    ./adws/adw_worktree_gc.py --dry-run
+
+    # Collect worktrees idle for more than 2 hours
+    ./adws/adw_worktree_gc.py --retention-hours 2
+
+    # Return up to 3 collected worktrees to the pre-warmed worktree pool
+    ./adws/adw_worktree_gc.py --pool-size 3
+"""
+
+import os
+import sys
+import click
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Add the adw_modules directory to the path so we can import the GC pass
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "adw_modules"))
+
+from data_models import WorktreeGCPolicy
+from dependency_store import DependencyStore, STORE_DIR_NAME
+from task_list import TaskListManager
+from worktree_gc import collect_garbage
+from worktree_pool import WorktreePool
+
+# With sparse checkout, worktrees are trees/{worktree_name}/{TARGET_DIRECTORY}/
+TARGET_DIRECTORY = "tac8_app2__multi_agent_todone"
+
+
+@click.command()
+@click.option(
+    "--task-file",
+    type=click.Path(exists=True),
+    default="tasks.md",
+    help="Path to the task list file (default: tasks.md)",
+)
+@click.option(
+    "--trees-dir",
+    default="trees",
+    help="Directory holding the worktrees (default: trees)",
+)
+@click.option(
+    "--retention-hours",
+    type=float,
+    default=24,
+    help="Keep finished worktrees this many hours after their last activity (default: 24)",
+)
+@click.option(
+    "--base-branch",
+    default="main",
+    help="Branch a worktree branch must be merged into (default: main)",
+)
+@click.option(
+    "--allow-unpushed",
+    is_flag=True,
+    help="Also collect worktrees whose branch is neither merged nor pushed",
+)
+@click.option(
+    "--pool-size",
+    type=int,
+    default=0,
+    help="Recycle collected worktrees into the worktree pool up to this many spares (default: 0, remove)",
+)
+@click.option("--dry-run", is_flag=True, help="Show what would be collected without changing anything")
+def main(
+    task_file: str,
+    trees_dir: str,
+    retention_hours: float,
+    base_branch: str,
+    allow_unpushed: bool,
+    pool_size: int,
+    dry_run: bool,
+):
+    """Collect worktrees whose task groups in tasks.md have all finished."""
+    console = Console()
+
+    policy = WorktreeGCPolicy(
+        retention_hours=retention_hours,
+        require_merged_or_pushed=not allow_unpushed,
+        base_branch=base_branch,
+    )
+    dependency_store = DependencyStore(os.path.join(trees_dir, STORE_DIR_NAME))
+    worktree_pool = (
+        WorktreePool(
+            pool_size,
+            target_directory=TARGET_DIRECTORY,
+            trees_dir=trees_dir,
+            base_branch=base_branch,
+            dependency_store=dependency_store,
+        )
+        if pool_size
+        else None
+    )
+
+    try:
+        decisions = collect_garbage(
+            TaskListManager(task_file).get_worktrees(),
+            policy,
+            trees_dir=trees_dir,
+            worktree_pool=worktree_pool,
+            dependency_store=dependency_store,
+            dry_run=dry_run,
+        )
+    except Exception as e:
+        console.print(
+            Panel(
+                f"[bold red]{e}[/bold red]",
+                title="[bold red]❌ Worktree GC Failed[/bold red]",
+                border_style="red",
+            )
+        )
+        sys.exit(1)
+
+    table = Table(show_header=True, box=None)
+    table.add_column("Worktree", style="bold cyan")
+    table.add_column("Action")
+    table.add_column("Reason", style="dim")
+    styles = {"keep": "white", "remove": "red", "recycle": "green"}
+    for decision in decisions:
+        action = decision.action
+        if dry_run and action != "keep":
+            action = f"would {action}"
+        reason = decision.reason
+        if decision.error_message:
+            reason += f" ⚠️ {decision.error_message}"
+        table.add_row(
+            decision.worktree_name,
+            f"[{styles[decision.action]}]{action}[/{styles[decision.action]}]",
+            reason,
+        )
+
+    collected = len([d for d in decisions if d.action != "keep"])
+    console.print(
+        Panel(
+            table if decisions else "No worktrees from the task list on disk",
+            title=(
+                f"[bold blue]🧹 Worktree GC{' (dry run)' if dry_run else ''}: "
+                f"{collected} of {len(decisions)} collected[/bold blue]"
+            ),
+            border_style="blue",
+        )
+    )
+    sys.exit(1 if any(d.error_message for d in decisions) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""Shared pytest setup for the ADW modules.
+
+The modules in adws/adw_modules import each other by flat module name, the
+way the workflow scripts load them, so the directory is put on sys.path.
+"""
+
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "adw_modules")
+)
@@ -0,0 +1,70 @@
+"""Tests for the asyncio variant of the Claude Code runner."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+import agent
+from agent import AgentPromptRequest, RetryCode
+
+
+def wait_for_exit(pid, timeout=5):
+    """Whether pid is gone; orphans are reaped by init shortly after the kill."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    """A CLI that starts a long-running tool subprocess and waits on it."""
+    pid_file = tmp_path / "tool.pid"
+    script = tmp_path / "claude"
+    script.write_text(f'#!/bin/sh\nsleep 60 &\necho $! > {pid_file}\necho "{{}}"\nwait\n')
+    script.chmod(0o755)
+    monkeypatch.setattr(agent, "CLAUDE_PATH", str(script))
+    return pid_file
+
+
+def make_request(tmp_path, timeout_seconds=None):
+    return AgentPromptRequest(
+        prompt="/build task",
+        adw_id="a1b2c3d4",
+        output_file=str(tmp_path / "cc_raw_output.jsonl"),
+        timeout_seconds=timeout_seconds,
+    )
+
+
+def test_cancellation_kills_the_process_group(tmp_path, fake_cli, monkeypatch):
+    async def cancel_run():
+        # Cancel once the CLI is streaming output, i.e. while the run is underway
+        streaming = asyncio.Event()
+        feed = agent.JsonlStreamParser.feed
+        monkeypatch.setattr(
+            agent.JsonlStreamParser,
+            "feed",
+            lambda stream, line: (feed(stream, line), streaming.set()),
+        )
+        task = asyncio.create_task(agent.run_claude_code_async(make_request(tmp_path)))
+        await asyncio.wait_for(streaming.wait(), 10)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_run())
+
+    assert wait_for_exit(int(fake_cli.read_text()))
+
+
+def test_timeout_kills_the_process_group(tmp_path, fake_cli):
+    response = asyncio.run(agent.run_claude_code_async(make_request(tmp_path, 1)))
+
+    assert response.retry_code == RetryCode.TIMEOUT_ERROR
+    assert wait_for_exit(int(fake_cli.read_text()))
@@ -0,0 +1,108 @@
+"""Tests for the Claude Code retry loop's resume handling."""
+
+import pytest
+
+import agent
+from agent import AgentPromptRequest, AgentPromptResponse, RetryCode
+
+
+@pytest.fixture
+def request_(tmp_path):
+    return AgentPromptRequest(
+        prompt="/build task",
+        adw_id="a1b2c3d4",
+        output_file=str(tmp_path / "cc_raw_output.jsonl"),
+        resume_session_id="old-session",
+    )
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(agent.time, "sleep", delays.append)
+    return delays
+
+
+def failure(output, retry_code=RetryCode.CLAUDE_CODE_ERROR, session_id=None):
+    return AgentPromptResponse(
+        output=output, success=False, session_id=session_id, retry_code=retry_code
+    )
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        "Claude Code error: No conversation found with session ID: old-session",
+        "Claude Code error: Invalid session ID. Must be a valid UUID.",
+    ],
+)
+def test_unknown_session_is_a_rejected_resume(request_, output):
+    assert agent.resume_was_rejected(request_, failure(output))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        failure("Error executing Claude Code: [Errno 2] No such file", RetryCode.EXECUTION_ERROR),
+        failure("Claude Code error: Command failed with exit code 1"),
+        failure("Error: Claude Code command timed out after 10 seconds", RetryCode.TIMEOUT_ERROR),
+        # The session was resumed, so the failure happened inside it
+        failure("No conversation found", session_id="old-session"),
+    ],
+)
+def test_other_failures_are_not_rejected_resumes(request_, response):
+    assert not agent.resume_was_rejected(request_, response)
+
+
+def test_rejected_resume_reruns_at_once_in_a_new_session(request_, monkeypatch, no_sleep):
+    calls = []
+
+    def fake_prompt(request):
+        calls.append(request.resume_session_id)
+        if request.resume_session_id:
+            return failure("Claude Code error: No conversation found with session ID: old-session")
+        return AgentPromptResponse(output="done", success=True, session_id="new-session")
+
+    monkeypatch.setattr(agent, "prompt_claude_code", fake_prompt)
+    response = agent.prompt_claude_code_with_retry(request_)
+
+    assert response.success
+    assert calls == ["old-session", None]
+    assert no_sleep == []
+
+
+def test_execution_error_goes_through_backoff(request_, monkeypatch, no_sleep):
+    calls = []
+
+    def fake_prompt(request):
+        calls.append(request.resume_session_id)
+        if len(calls) == 1:
+            return failure("Error executing Claude Code: boom", RetryCode.EXECUTION_ERROR)
+        return AgentPromptResponse(output="done", success=True, session_id="old-session")
+
+    monkeypatch.setattr(agent, "prompt_claude_code", fake_prompt)
+    response = agent.prompt_claude_code_with_retry(request_)
+
+    assert response.success
+    # Retried after a delay, still resuming the same session
+    assert calls == ["old-session", "old-session"]
+    assert len(no_sleep) == 1
+
+
+def test_rejected_retry_resume_keeps_the_callers_session(request_, monkeypatch, no_sleep):
+    calls = []
+
+    def fake_prompt(request):
+        calls.append(request.resume_session_id)
+        if len(calls) == 1:
+            # Failed mid-run in a session that is gone by the time of the retry
+            return failure("Error executing Claude Code: boom", RetryCode.EXECUTION_ERROR, "lost")
+        if request.resume_session_id == "lost":
+            return failure("Claude Code error: No conversation found with session ID: lost")
+        return AgentPromptResponse(output="done", success=True, session_id="old-session")
+
+    monkeypatch.setattr(agent, "prompt_claude_code", fake_prompt)
+    response = agent.prompt_claude_code_with_retry(request_)
+
+    assert response.success
+    assert calls == ["old-session", "lost", "old-session"]
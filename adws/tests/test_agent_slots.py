@@ -0,0 +1,41 @@
+"""Tests for the host-wide Claude Code slot limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+import agent
+from agent import AgentSlotLimiter
+
+
+@pytest.fixture
+def slots(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADW_MAX_AGENTS", "3")
+    monkeypatch.setenv("ADW_MAX_SONNET_AGENTS", "2")
+    monkeypatch.setenv("ADW_MAX_OPUS_AGENTS", "3")
+    monkeypatch.setattr(agent, "SLOT_POLL_INTERVAL", 0.05)
+    return AgentSlotLimiter(str(tmp_path / "slots"))
+
+
+def test_model_pool_is_full_after_its_limit(slots):
+    held = [slots.try_acquire("sonnet") for _ in range(2)]
+
+    assert all(held)
+    assert slots.try_acquire("sonnet") is None
+    assert slots.acquire("sonnet", deadline=time.time() + 0.2) is None
+    assert asyncio.run(slots.acquire_async("sonnet", deadline=time.time() + 0.2)) is None
+    assert slots.count_held("sonnet") == 2
+
+    held[0].release()
+    assert slots.try_acquire("sonnet") is not None
+
+
+def test_global_pool_limits_all_models(slots):
+    held = [slots.try_acquire(model) for model in ("sonnet", "sonnet", "opus")]
+
+    assert all(held)
+    assert slots.try_acquire("opus") is None
+    # A failed launch gives its model slot back instead of holding it
+    assert slots.count_held("opus") == 1
+    assert slots.count_held("global") == 3
@@ -0,0 +1,111 @@
+"""Tests for build cache snapshots and seeding worktrees from them."""
+
+import os
+import subprocess
+
+import pytest
+
+from build_cache import BuildCache
+
+
+def git(cwd, *args):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def write(path, content="x", mtime=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def commit(repo, name):
+    write(os.path.join(repo, "app", f"{name}.ts"))
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", name)
+    return git(repo, "rev-parse", "HEAD")
+
+
+def build(repo, mtime):
+    """What a completed `tsc` / `next build` leaves behind."""
+    write(os.path.join(repo, "app", ".next", "cache", "webpack", "0.pack"), f"built {mtime}")
+    write(os.path.join(repo, "app", ".next", "BUILD_ID"), mtime=mtime)
+    write(os.path.join(repo, "app", "tsconfig.tsbuildinfo"), f"built {mtime}", mtime=mtime)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for name in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{name}_NAME", "test")
+        monkeypatch.setenv(f"GIT_{name}_EMAIL", "test@example.com")
+    root = str(tmp_path / "repo")
+    os.makedirs(root)
+    git(root, "init", "-q", "-b", "main")
+    write(os.path.join(root, ".gitignore"), ".next/\n*.tsbuildinfo\n")
+    write(os.path.join(root, "app", "tsconfig.json"), "{}")
+    commit(root, "init")
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BuildCache(str(tmp_path / ".build-cache"))
+
+
+def test_refresh_snapshots_only_new_builds(repo, cache):
+    assert cache.refresh(repo) is None
+
+    build(repo, 1_000)
+    head = cache.refresh(repo)
+    assert head == git(repo, "rev-parse", "HEAD")
+    assert cache.read_manifest(head)["projects"] == {
+        "app": [os.path.join(".next", "cache"), "tsconfig.tsbuildinfo"]
+    }
+
+    # Nothing was built since the snapshot
+    assert cache.get_stale_commit(repo) is None
+    assert cache.refresh(repo) is None
+
+    build(repo, 2_000)
+    assert cache.get_stale_commit(repo) == head
+    assert cache.refresh(repo) == head
+    assert cache.read_manifest(head)["build_stamp"] == 2_000
+
+
+def test_start_refresh_publishes_in_the_background(repo, cache):
+    build(repo, 1_000)
+
+    assert cache.start_refresh(repo)
+    cache.publisher.join(timeout=10)
+
+    assert cache.drain_published() == [git(repo, "rev-parse", "HEAD")]
+    assert cache.drain_published() == []
+    assert not cache.start_refresh(repo)
+
+
+def test_worktree_is_seeded_from_the_nearest_ancestor(repo, cache):
+    build(repo, 1_000)
+    snapshotted = cache.refresh(repo)
+    commit(repo, "second")
+    path = os.path.join(repo, "trees", "wt")
+    git(repo, "worktree", "add", "-q", "-b", "wt", path)
+    commit(path, "third")
+
+    assert cache.find_seed(path) == snapshotted
+    assert cache.seed_worktree(path) == snapshotted
+    with open(os.path.join(path, "app", "tsconfig.tsbuildinfo")) as f:
+        assert f.read() == "built 1000"
+    assert os.path.isfile(os.path.join(path, "app", ".next", "cache", "webpack", "0.pack"))
+
+
+def test_no_seed_without_an_ancestor_snapshot(repo, cache):
+    git(repo, "checkout", "-q", "--orphan", "unrelated")
+    commit(repo, "unrelated")
+    build(repo, 1_000)
+    cache.refresh(repo)
+    git(repo, "checkout", "-q", "main")
+
+    assert cache.find_seed(repo) is None
@@ -0,0 +1,58 @@
+"""Tests for probing and caching the Claude Code CLI's capabilities."""
+
+import os
+
+import pytest
+
+import agent
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    """Install a fake CLI; returns a function that (re)writes it and counts probes."""
+    script = tmp_path / "claude"
+    probes = tmp_path / "probes"
+    monkeypatch.setattr(agent, "CLAUDE_PATH", str(script))
+    monkeypatch.setattr(agent, "CAPABILITIES_FILE", str(tmp_path / "agents" / "capabilities.json"))
+    monkeypatch.setattr(agent, "CAPABILITY_CACHE", {})
+
+    def install(version, flags, mtime_ns):
+        script.write_text(
+            "#!/bin/sh\n"
+            f"echo \"$1\" >> {probes}\n"
+            f'if [ "$1" = --version ]; then echo "{version} (Claude Code)"; '
+            f'else echo "Options: {flags}"; fi\n'
+        )
+        script.chmod(0o755)
+        os.utime(script, ns=(mtime_ns, mtime_ns))
+
+    install.probes = lambda: probes.read_text().split() if probes.exists() else []
+    return install
+
+
+def test_probe_is_cached_until_the_binary_changes(cli):
+    cli("1.0.0", "--model", 1_000_000_000)
+    first = agent.get_claude_capabilities()
+
+    assert (first.version, first.flags) == ("1.0.0", ["--model"])
+    assert agent.get_claude_capabilities() is first
+    # A sibling process reuses the persisted result without probing
+    agent.CAPABILITY_CACHE.clear()
+    assert agent.get_claude_capabilities() == first
+    assert cli.probes() == ["--version", "--help"]
+
+    cli("1.1.0", "--model --resume", 2_000_000_000)
+    upgraded = agent.get_claude_capabilities()
+
+    assert upgraded.version == "1.1.0"
+    assert upgraded.supports_flag("--resume")
+    assert cli.probes() == ["--version", "--help"] * 2
+
+
+def test_hanging_probe_times_out(tmp_path, monkeypatch):
+    script = tmp_path / "claude"
+    script.write_text("#!/bin/sh\nexec sleep 60\n")
+    script.chmod(0o755)
+    monkeypatch.setattr(agent, "PROBE_TIMEOUT_SECONDS", 0.2)
+
+    assert agent.probe_claude_capabilities(str(script), 0) is None
@@ -0,0 +1,90 @@
+"""Tests for sharing node_modules between worktrees through the dependency store."""
+
+import os
+import stat
+import subprocess
+
+import pytest
+
+from dependency_store import DependencyStore
+
+
+def make_worktree(path):
+    os.makedirs(path)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    with open(os.path.join(path, "package.json"), "w") as f:
+        f.write('{"name": "app"}')
+    with open(os.path.join(path, "package-lock.json"), "w") as f:
+        f.write('{"lockfileVersion": 3}')
+    subprocess.run(["git", "add", "."], cwd=path, check=True)
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = DependencyStore(str(tmp_path / ".deps"))
+    installs = []
+
+    def fake_install(project_dir, lockfile):
+        installs.append(project_dir)
+        package_dir = os.path.join(project_dir, "node_modules", "pkg")
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, "index.js"), "w") as f:
+            f.write("module.exports = 1")
+        os.symlink("../pkg/index.js", os.path.join(project_dir, "node_modules", "pkg-bin"))
+
+    monkeypatch.setattr(store, "run_install", fake_install)
+    store.installs = installs
+    return store
+
+
+def test_hardlinked_entries_are_read_only(tmp_path, store):
+    store.reflink = False
+    first = make_worktree(tmp_path / "a")
+    second = make_worktree(tmp_path / "b")
+
+    assert store.install_worktree(first) == {"package-lock.json": "installed"}
+    assert store.install_worktree(second) == {"package-lock.json": "linked"}
+    assert store.installs == [first]
+
+    shared = os.path.join(second, "node_modules", "pkg", "index.js")
+    mode = os.stat(shared).st_mode
+    assert os.stat(shared).st_nlink == 3
+    assert not mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    assert os.readlink(os.path.join(second, "node_modules", "pkg-bin")) == "../pkg/index.js"
+    # Directories stay writable, so tools can add files and reinstalls can replace them
+    assert os.access(os.path.join(second, "node_modules", "pkg"), os.W_OK)
+
+    assert store.install_worktree(second) == {"package-lock.json": "linked"}
+
+
+def test_cloned_entries_are_private_copies(tmp_path, store, monkeypatch):
+    clones = []
+    run = subprocess.run
+
+    def run_without_reflink(cmd, **kwargs):
+        # The test filesystem may not clone, so check the command and copy for real
+        if cmd[0] == "cp":
+            clones.append(cmd)
+            cmd = [c for c in cmd if c != "--reflink=always"]
+        return run(cmd, **kwargs)
+
+    monkeypatch.setattr(store, "supports_reflink", lambda: True)
+    monkeypatch.setattr(subprocess, "run", run_without_reflink)
+    first = make_worktree(tmp_path / "a")
+    second = make_worktree(tmp_path / "b")
+
+    store.install_worktree(first)
+    store.install_worktree(second)
+
+    shared = os.path.join(second, "node_modules", "pkg", "index.js")
+    assert [cmd[:3] for cmd in clones] == [["cp", "-a", "--reflink=always"]] * 2
+    assert os.stat(shared).st_nlink == 1
+    assert os.access(shared, os.W_OK)
+
+
+def test_reflink_probe_cleans_up(tmp_path):
+    store = DependencyStore(str(tmp_path / ".deps"))
+
+    assert store.supports_reflink() in (True, False)
+    assert os.listdir(store.root) == []
@@ -0,0 +1,92 @@
+"""Tests for the cron trigger's load-aware admission control."""
+
+import pytest
+
+import host_load
+from data_models import CronTriggerConfig
+from host_load import AdmissionController, HostSnapshot
+
+
+@pytest.fixture
+def host(monkeypatch):
+    """Stub the host sample; tests set its fields before begin_cycle."""
+    snapshot = HostSnapshot(cpu_count=4, load_average=0.0, available_memory_mb=16384)
+    monkeypatch.setattr(host_load, "sample_host", lambda: snapshot.model_copy())
+    return snapshot
+
+
+def admit_all(controller, limit=20):
+    """Admit tasks until one is deferred; return (admitted count, reason)."""
+    controller.begin_cycle()
+    for admitted in range(limit):
+        ok, reason = controller.admit()
+        if not ok:
+            return admitted, reason
+    return limit, None
+
+
+def test_projected_load_limits_tasks_per_cycle(host):
+    host.load_average = 1.0
+    config = CronTriggerConfig(max_load_per_cpu=1.0, task_load=1.0, min_available_memory_mb=0)
+
+    admitted, reason = admit_all(AdmissionController(config))
+
+    # (1.0 + 3 * 1.0) / 4 CPUs fits; a fourth task would project 1.25 per CPU
+    assert admitted == 3
+    assert reason == (
+        "projected load 1.25 per CPU with 4 task(s) this cycle "
+        "(load 1.0 on 4 CPUs, max 1.0 per CPU)"
+    )
+
+
+def test_idle_host_always_admits_one_task(host):
+    host.load_average = 0.0
+    config = CronTriggerConfig(max_load_per_cpu=1.0, task_load=8.0, min_available_memory_mb=0)
+
+    assert admit_all(AdmissionController(config))[0] == 1
+
+
+def test_overloaded_host_admits_nothing(host):
+    host.load_average = 8.0
+
+    admitted, reason = admit_all(AdmissionController(CronTriggerConfig()))
+
+    assert admitted == 0
+    assert reason.startswith("projected load 2.25 per CPU with 1 task(s) this cycle")
+
+
+def test_projected_memory_limits_tasks_per_cycle(host):
+    host.available_memory_mb = 4096
+    config = CronTriggerConfig(task_load=0, task_memory_mb=1024, min_available_memory_mb=1024)
+
+    admitted, reason = admit_all(AdmissionController(config))
+
+    assert admitted == 3
+    assert reason == (
+        "projected 0 MiB free with 4 task(s) this cycle "
+        "(4096 MiB available, keeping 1024 MiB free)"
+    )
+
+
+def test_agent_process_limit_counts_pending_tasks(host):
+    host.agent_processes = 2
+    config = CronTriggerConfig(task_load=0, task_memory_mb=0, max_agent_processes=3)
+
+    admitted, reason = admit_all(AdmissionController(config))
+
+    assert admitted == 1
+    assert reason == "2 Claude Code processes running with 2 task(s) this cycle (max 3)"
+
+
+def test_unknown_load_and_memory_are_not_limits(host):
+    host.load_average = None
+    host.available_memory_mb = None
+
+    assert admit_all(AdmissionController(CronTriggerConfig()), limit=5) == (5, None)
+
+
+def test_disabled_admission_control_admits_everything(host):
+    host.load_average = 100.0
+    config = CronTriggerConfig(admission_control=False)
+
+    assert admit_all(AdmissionController(config), limit=5) == (5, None)
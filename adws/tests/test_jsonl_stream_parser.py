@@ -0,0 +1,96 @@
+"""Tests for the single-pass Claude Code stream-json parser."""
+
+import json
+
+from agent import FINAL_OBJECT_JSON, OUTPUT_JSON, JsonlStreamParser
+
+INIT = {"type": "system", "subtype": "init", "session_id": "sess-1"}
+ASSISTANT = {
+    "type": "assistant",
+    "message": {"content": [{"type": "text", "text": "Editing the file"}]},
+    "session_id": "sess-1",
+}
+FAILED_ASSISTANT = {
+    "type": "assistant",
+    "message": {"content": [{"type": "text", "text": "The build failed with 3 errors"}]},
+    "session_id": "sess-1",
+}
+TOOL_USE = {
+    "type": "assistant",
+    "message": {"content": [{"type": "tool_use", "name": "Bash"}]},
+    "session_id": "sess-1",
+}
+RESULT = {
+    "type": "result",
+    "subtype": "success",
+    "is_error": False,
+    "result": "Done",
+    "session_id": "sess-1",
+}
+
+
+def run_parser(tmp_path, lines):
+    output_file = tmp_path / "cc_raw_output.jsonl"
+    with JsonlStreamParser(str(output_file)) as stream:
+        for line in lines:
+            stream.feed(line)
+    return stream
+
+
+def as_lines(*messages):
+    return [json.dumps(m) + "\n" for m in messages]
+
+
+def test_writes_raw_json_and_final_object(tmp_path):
+    lines = as_lines(INIT, ASSISTANT, RESULT)
+    stream = run_parser(tmp_path, lines)
+
+    assert (tmp_path / "cc_raw_output.jsonl").read_text() == "".join(lines)
+    # The streamed array is byte-for-byte what json.dump(messages, indent=2) writes
+    assert (tmp_path / OUTPUT_JSON).read_text() == json.dumps([INIT, ASSISTANT, RESULT], indent=2)
+    assert json.loads((tmp_path / FINAL_OBJECT_JSON).read_text()) == RESULT
+    assert stream.message_count == 3
+    assert stream.result_message == RESULT
+    assert stream.session_id == "sess-1"
+
+
+def test_session_id_known_before_the_result(tmp_path):
+    stream = run_parser(tmp_path, as_lines(INIT, ASSISTANT))
+
+    assert stream.result_message is None
+    assert stream.session_id == "sess-1"
+    assert stream.last_assistant_text() == "Editing the file"
+
+
+def test_skips_blank_and_invalid_lines(tmp_path):
+    stream = run_parser(tmp_path, ["\n", "not json\n", "[1, 2]\n"] + as_lines(INIT))
+
+    assert stream.message_count == 1
+    assert json.loads((tmp_path / OUTPUT_JSON).read_text()) == [INIT]
+    # The raw transcript keeps everything, and the last line is remembered for errors
+    assert "not json" in (tmp_path / "cc_raw_output.jsonl").read_text()
+    assert stream.last_line == json.dumps(INIT)
+
+
+def test_empty_stream(tmp_path):
+    stream = run_parser(tmp_path, [])
+
+    assert json.loads((tmp_path / OUTPUT_JSON).read_text()) == []
+    assert not (tmp_path / FINAL_OBJECT_JSON).exists()
+    assert stream.last_assistant_text() == ""
+
+
+def test_assistant_text_helpers(tmp_path):
+    stream = run_parser(tmp_path, as_lines(INIT, FAILED_ASSISTANT, ASSISTANT, TOOL_USE))
+
+    assert stream.last_assistant_text() == "Editing the file"
+    assert stream.last_assistant_error_text() == "The build failed with 3 errors"
+
+
+def test_keeps_only_recent_messages(tmp_path):
+    messages = [FAILED_ASSISTANT] + [ASSISTANT] * JsonlStreamParser.RECENT_MESSAGES
+    stream = run_parser(tmp_path, as_lines(*messages))
+
+    assert len(stream.recent_messages) == JsonlStreamParser.RECENT_MESSAGES
+    # The error fell out of the window
+    assert stream.last_assistant_error_text() == ""
@@ -0,0 +1,145 @@
+"""Tests for the declarative phase engine."""
+
+import io
+import os
+
+import pytest
+from rich.console import Console
+
+from agent import SUMMARY_JSON
+from phase_engine import AgentPhase, PhaseContext, PhaseEngine, PhaseResult, write_summary
+
+
+def phase(name, depends_on=(), resume_from=None):
+    return AgentPhase(
+        name=name,
+        title=name.title(),
+        slash_command=f"/{name}",
+        agent_name=f"{name}-agent",
+        args=lambda context: [],
+        depends_on=list(depends_on),
+        resume_from=resume_from,
+    )
+
+
+def quiet_engine(phases):
+    return PhaseEngine(phases, Console(file=io.StringIO()))
+
+
+@pytest.fixture
+def context(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return PhaseContext(adw_id="a1b2c3d4", label="wt", model="sonnet", working_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize(
+    "phases, message",
+    [
+        ([phase("plan"), phase("plan")], "Duplicate phase names"),
+        ([phase("build", ["plan"])], "unknown phase 'plan'"),
+        ([phase("plan"), phase("build", resume_from="plan")], "without depending on it"),
+        ([phase("a", ["c"]), phase("b", ["a"]), phase("c", ["b"])], "Dependency cycle"),
+    ],
+)
+def test_validate_rejects_bad_graphs(phases, message):
+    with pytest.raises(ValueError, match=message):
+        quiet_engine(phases)
+
+
+def test_validate_accepts_a_dag():
+    quiet_engine(
+        [
+            phase("plan"),
+            phase("implement", ["plan"], resume_from="plan"),
+            phase("e2e", ["plan"]),
+            phase("review", ["implement", "e2e"]),
+        ]
+    )
+
+
+def test_run_orders_phases_and_skips_after_failures(context, monkeypatch):
+    phases = [
+        phase("plan"),
+        phase("implement", ["plan"]),
+        phase("docs"),
+        phase("review", ["implement", "docs"]),
+    ]
+    engine = quiet_engine(phases)
+    started = []
+
+    def fake_run_phase(agent_phase, run_context):
+        assert all(dep in run_context.results for dep in agent_phase.depends_on)
+        started.append(agent_phase.name)
+        return PhaseResult(
+            name=agent_phase.name,
+            agent_name=agent_phase.agent_name,
+            success=agent_phase.name != "implement",
+            outputs={f"{agent_phase.name}_done": True},
+        )
+
+    monkeypatch.setattr(engine, "run_phase", fake_run_phase)
+    results = engine.run(context)
+
+    assert [r.name for r in results] == ["plan", "implement", "docs", "review"]
+    assert sorted(started) == ["docs", "implement", "plan"]
+    assert results[3].skipped and "implement" in results[3].error_message
+    assert context.outputs == {"plan_done": True, "implement_done": True, "docs_done": True}
+
+
+def write_checkpoint(context, agent_phase, **summary):
+    write_summary(
+        os.path.join("agents", context.adw_id, agent_phase.agent_name),
+        SUMMARY_JSON,
+        {"phase": agent_phase.name, "success": True, "session_id": "sess-1", **summary},
+    )
+
+
+def test_load_checkpoint_restores_outputs(context):
+    plan = phase("plan")
+    write_checkpoint(context, plan, plan_path="specs/plan.md", output_keys=["plan_path"])
+
+    result = quiet_engine([plan]).load_checkpoint(plan, context)
+
+    assert result.restored and result.success
+    assert result.outputs == {"plan_path": "specs/plan.md"}
+    assert result.response.session_id == "sess-1"
+
+
+@pytest.mark.parametrize(
+    "summary",
+    [None, {"success": False}, {"phase": "other"}],
+)
+def test_load_checkpoint_ignores_unusable_summaries(context, summary):
+    plan = phase("plan")
+    if summary is not None:
+        write_checkpoint(context, plan, **summary)
+
+    assert quiet_engine([plan]).load_checkpoint(plan, context) is None
+
+
+def test_load_checkpoint_verifies_outputs(context):
+    plan = phase("plan")
+    plan.verify_checkpoint = lambda run_context, outputs: os.path.exists(outputs["plan_path"])
+    write_checkpoint(context, plan, plan_path="specs/missing.md", output_keys=["plan_path"])
+
+    assert quiet_engine([plan]).load_checkpoint(plan, context) is None
+
+
+def test_resume_reruns_phases_after_a_rerun_dependency(context, monkeypatch):
+    phases = [phase("plan"), phase("implement", ["plan"]), phase("review", ["implement"])]
+    engine = quiet_engine(phases)
+    write_checkpoint(context, phases[0])
+    write_checkpoint(context, phases[2])
+    context.resume = True
+    started = []
+
+    def fake_run_phase(agent_phase, run_context):
+        started.append(agent_phase.name)
+        return PhaseResult(name=agent_phase.name, agent_name=agent_phase.agent_name, success=True)
+
+    monkeypatch.setattr(engine, "run_phase", fake_run_phase)
+    results = engine.run(context)
+
+    # review has a checkpoint, but implement ran again, so review must too
+    assert [r.restored for r in results] == [True, False, False]
+    assert started == ["implement", "review"]
@@ -0,0 +1,171 @@
+"""Tests for rate-limit classification and the host-wide circuit breaker."""
+
+import json
+import time
+
+import pytest
+
+import agent
+import circuit_breaker
+from agent import JsonlStreamParser, RetryCode, build_prompt_response
+from circuit_breaker import CircuitBreaker
+
+INIT = {"type": "system", "subtype": "init", "session_id": "sess-1"}
+
+
+def assistant(text, **fields):
+    return {
+        "type": "assistant",
+        "message": {"content": [{"type": "text", "text": text}]},
+        "session_id": "sess-1",
+        **fields,
+    }
+
+
+def error_result(text, **fields):
+    return {
+        "type": "result",
+        "subtype": "success",
+        "is_error": True,
+        "result": text,
+        "session_id": "sess-1",
+        **fields,
+    }
+
+
+def classify(tmp_path, messages, returncode=1, stderr=""):
+    with JsonlStreamParser(str(tmp_path / "cc_raw_output.jsonl")) as stream:
+        for message in messages:
+            stream.feed(json.dumps(message) + "\n")
+    return build_prompt_response(returncode, stream, stderr)
+
+
+@pytest.fixture
+def breaker(tmp_path, monkeypatch):
+    monkeypatch.setattr(circuit_breaker.random, "uniform", lambda low, high: 1.0)
+    breaker = CircuitBreaker(str(tmp_path / "claude_circuit.json"))
+    monkeypatch.setattr(agent, "CIRCUIT_BREAKER", breaker)
+    return breaker
+
+
+def test_task_about_rate_limits_is_not_rate_limited(tmp_path):
+    response = classify(
+        tmp_path,
+        [INIT, assistant("The rate limit middleware failed: expected status 429, got 200")],
+    )
+
+    assert response.retry_code == RetryCode.CLAUDE_CODE_ERROR
+
+
+def test_error_result_text_is_not_matched(tmp_path):
+    response = classify(
+        tmp_path,
+        [INIT, error_result("Could not add rate limiting: the API is overloaded with routes")],
+        returncode=0,
+    )
+
+    assert not response.success
+    assert response.retry_code == RetryCode.NONE
+
+
+def test_last_transcript_line_is_not_matched(tmp_path):
+    response = classify(tmp_path, [INIT, {"type": "user", "note": "Too many requests, line 429"}])
+
+    assert response.retry_code == RetryCode.CLAUDE_CODE_ERROR
+
+
+@pytest.mark.parametrize("status", [429, "529"])
+def test_api_error_status_is_rate_limited(tmp_path, status):
+    response = classify(
+        tmp_path,
+        [INIT, error_result("API Error", api_error_status=status)],
+        returncode=0,
+    )
+
+    assert response.retry_code == RetryCode.RATE_LIMIT_ERROR
+
+
+def test_structured_message_error_is_rate_limited(tmp_path):
+    response = classify(tmp_path, [INIT, assistant("API Error", error="rate_limit")])
+
+    assert response.retry_code == RetryCode.RATE_LIMIT_ERROR
+    assert response.session_id == "sess-1"
+
+
+@pytest.mark.parametrize(
+    "stderr, rate_limited",
+    [
+        ('API Error: 429 {"type":"error","error":{"type":"rate_limit_error"}}', True),
+        ("Error: Claude AI usage limit reached", True),
+        ("Request failed with status 529", True),
+        ("    at handler (/usr/lib/node_modules/cli.js:429:17)", False),
+        ("Error: ENOENT: no such file or directory", False),
+    ],
+)
+def test_stderr_classification(tmp_path, stderr, rate_limited):
+    response = classify(tmp_path, [INIT], stderr=stderr)
+
+    expected = RetryCode.RATE_LIMIT_ERROR if rate_limited else RetryCode.CLAUDE_CODE_ERROR
+    assert response.retry_code == expected
+
+
+def test_breaker_opens_with_growing_cooldown(breaker):
+    assert not breaker.is_open()
+
+    first = breaker.record_rate_limit("429")
+    assert breaker.is_open()
+    assert first == pytest.approx(circuit_breaker.BASE_COOLDOWN_SECONDS, abs=1)
+
+    second = breaker.record_rate_limit("429")
+    assert second == pytest.approx(2 * circuit_breaker.BASE_COOLDOWN_SECONDS, abs=1)
+    assert breaker.read_state().consecutive_rate_limits == 2
+
+
+def test_breaker_cooldown_is_capped(breaker):
+    for _ in range(20):
+        remaining = breaker.record_rate_limit()
+
+    assert remaining <= circuit_breaker.MAX_COOLDOWN_SECONDS
+
+
+def test_breaker_resets_after_success_once_the_cooldown_passed(breaker):
+    breaker.record_rate_limit()
+    state = breaker.read_state()
+    state.open_until = time.time() - 1
+    breaker.write_state(state)
+
+    breaker.record_success()
+
+    assert not breaker.is_open()
+    assert breaker.read_state() == circuit_breaker.CircuitState()
+
+
+def test_success_while_open_does_not_close_the_circuit(breaker):
+    breaker.record_rate_limit()
+    open_until = breaker.read_state().open_until
+
+    breaker.record_success()
+
+    assert breaker.is_open()
+    assert breaker.read_state().open_until == open_until
+    # The backoff starts over for the next rate limit
+    assert breaker.read_state().consecutive_rate_limits == 0
+
+
+def test_corrupt_state_file_means_closed(breaker):
+    with open(breaker.file_path, "w") as f:
+        f.write("{not json")
+
+    assert not breaker.is_open()
+
+
+def test_only_rate_limited_responses_open_the_circuit(tmp_path, breaker):
+    agent.update_circuit_breaker(
+        classify(tmp_path, [INIT, assistant("Rate limit tests failed with 429")])
+    )
+    assert not breaker.is_open()
+
+    agent.update_circuit_breaker(
+        classify(tmp_path, [INIT], stderr="API Error: 429 rate_limit_error")
+    )
+    assert breaker.is_open()
@@ -0,0 +1,29 @@
+"""Tests for the trigger's workflow watchdog."""
+
+import time
+
+import supervisor
+from supervisor import WorkflowSupervisor
+
+
+def test_kill_expired_terminates_without_waiting(monkeypatch):
+    monkeypatch.setattr(supervisor, "KILL_GRACE_SECONDS", 0.2)
+    workflows = WorkflowSupervisor()
+    # Ignores SIGTERM, so only the later SIGKILL stops it
+    cmd = ["sh", "-c", "trap '' TERM; while :; do sleep 0.1; done"]
+    run = workflows.launch("a1b2c3d4", cmd, "wt", "Task", budget_seconds=0)
+
+    started = time.monotonic()
+    assert workflows.kill_expired() == [run]
+    assert time.monotonic() - started < 1
+    assert run.timed_out
+    assert workflows.reap() == []
+    assert workflows.kill_expired() == []
+
+    time.sleep(0.3)
+    workflows.kill_expired()
+    workflows.processes["a1b2c3d4"].wait(timeout=5)
+
+    assert workflows.reap() == [run]
+    assert run.exit_code == -9
+    assert workflows.terminating == {}
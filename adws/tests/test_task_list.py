@@ -0,0 +1,151 @@
+"""Tests for the native tasks.md parser and writer."""
+
+import pytest
+
+from data_models import TaskUpdate
+from task_list import (
+    TaskListManager,
+    format_status_token,
+    get_eligible_task_groups,
+    parse_status_token,
+    parse_task_line,
+    parse_task_list,
+    rewrite_task_line,
+)
+
+TASKS_MD = """# Tasks
+
+## Git Worktree feature-auth
+[✅ abc1234, 17b93f48] Add login form {opus}
+[🟡, 267fa7a9] Add logout button
+[❌, 333fe96b] Add password reset // Failed: tests did not pass
+[] Add session timeout {sonnet, adw_plan_implement_update_task}
+[⏰] Document the auth flow
+
+## Git Worktree feature-search
+[✅ def5678, 4f87690d] Add search index
+[⏰] Add search page
+
+## Notes
+[] Not a task of any worktree
+"""
+
+
+@pytest.fixture
+def task_file(tmp_path):
+    path = tmp_path / "tasks.md"
+    path.write_text(TASKS_MD)
+    return path
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("", ("[]", None, None)),
+        ("⏰", ("[⏰]", None, None)),
+        ("🟡, 267fa7a9", ("[🟡]", None, "267fa7a9")),
+        ("✅ abc1234, 17b93f48", ("[✅]", "abc1234", "17b93f48")),
+        ("✅️ abc1234, 17b93f48", ("[✅]", "abc1234", "17b93f48")),
+        ("❌, 333fe96b", ("[❌]", None, "333fe96b")),
+        ("x", None),
+    ],
+)
+def test_parse_status_token(token, expected):
+    assert parse_status_token(token) == expected
+
+
+def test_parse_task_line_splits_tags_and_failure_reason():
+    task = parse_task_line("[❌, 333fe96b] Fix build {opus, sonnet} // Failed: boom", "wt")
+
+    assert task.status == "[❌]"
+    assert task.adw_id == "333fe96b"
+    assert task.description == "Fix build"
+    assert task.tags == ["opus", "sonnet"]
+    assert task.worktree_name == "wt"
+
+
+@pytest.mark.parametrize("line", ["Just some prose", "[?] Unknown status", "[]   "])
+def test_parse_task_line_ignores_non_tasks(line):
+    assert parse_task_line(line) is None
+
+
+def test_parse_task_list_sections():
+    worktrees = parse_task_list(TASKS_MD)
+
+    assert [w.name for w in worktrees] == ["feature-auth", "feature-search"]
+    assert [t.status for t in worktrees[0].tasks] == ["[✅]", "[🟡]", "[❌]", "[]", "[⏰]"]
+    assert worktrees[0].tasks[0].commit_hash == "abc1234"
+    assert worktrees[0].tasks[3].tags == ["sonnet", "adw_plan_implement_update_task"]
+    # Tasks under a non-worktree heading are not picked up
+    assert all(t.description != "Not a task of any worktree" for w in worktrees for t in w.tasks)
+
+
+def test_eligible_task_groups_apply_blocking_rules():
+    groups = get_eligible_task_groups(parse_task_list(TASKS_MD))
+
+    # The blocked task in feature-auth waits for the tasks above it; the one
+    # in feature-search only has successful tasks above it
+    assert [(g.worktree_name, [t.description for t in g.tasks_to_start]) for g in groups] == [
+        ("feature-auth", ["Add session timeout"]),
+        ("feature-search", ["Add search page"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "status, commit_hash, adw_id, expected",
+    [
+        ("[]", None, None, "[]"),
+        ("[⏰]", None, "ignored", "[⏰]"),
+        ("[🟡]", None, "267fa7a9", "[🟡, 267fa7a9]"),
+        ("[✅]", "abc1234", "17b93f48", "[✅ abc1234, 17b93f48]"),
+        ("[❌]", None, "333fe96b", "[❌, 333fe96b]"),
+    ],
+)
+def test_format_status_token(status, commit_hash, adw_id, expected):
+    assert format_status_token(status, commit_hash, adw_id) == expected
+
+
+def test_rewrite_task_line_keeps_indent_tags_and_line_ending():
+    line = "  [❌, 1] Fix build {opus} // Failed: old reason\r\n"
+
+    rewritten = rewrite_task_line(line, "[🟡, 2]")
+    assert rewritten == "  [🟡, 2] Fix build {opus}\r\n"
+
+    failed = rewrite_task_line(line, "[❌, 2]", "new\nreason")
+    assert failed == "  [❌, 2] Fix build {opus} // Failed: new reason\r\n"
+
+
+def test_status_round_trip(task_file):
+    manager = TaskListManager(str(task_file))
+
+    assert manager.update_task_to_in_progress("feature-auth", "Add session timeout", "aaaa1111")
+    # Already picked up, so a second trigger cannot claim it again
+    assert not manager.update_task_to_in_progress("feature-auth", "Add session timeout", "bbbb2222")
+
+    assert manager.apply_task_update(
+        TaskUpdate(
+            worktree_name="feature-auth",
+            task_description="Add session timeout",
+            status="[✅]",
+            adw_id="aaaa1111",
+            commit_hash="cafe123",
+        )
+    )
+
+    task = manager.find_task("aaaa1111")
+    assert task.status == "[✅]"
+    assert task.commit_hash == "cafe123"
+    assert task.tags == ["sonnet", "adw_plan_implement_update_task"]
+    # Every other line is left untouched
+    lines = task_file.read_text().splitlines()
+    assert lines[6] == "[✅ cafe123, aaaa1111] Add session timeout {sonnet, adw_plan_implement_update_task}"
+    assert [l for i, l in enumerate(lines) if i != 6] == [
+        l for i, l in enumerate(TASKS_MD.splitlines()) if i != 6
+    ]
+
+
+def test_update_only_matches_the_named_worktree(task_file):
+    manager = TaskListManager(str(task_file))
+
+    assert not manager.update_task_status("feature-search", "Add session timeout", "[🟡]", adw_id="x")
+    assert task_file.read_text() == TASKS_MD
@@ -0,0 +1,45 @@
+"""Tests for the watchdog budgets of delegated workflows."""
+
+import pytest
+
+from agent import get_command_timeout
+from data_models import SystemTag, get_workflow_timeout
+
+TIMEOUTS = {"/build": 100, "/plan": 50, "/implement": 200}
+
+
+@pytest.mark.parametrize(
+    "tags, expected",
+    [
+        ([], 100 + 100 + 600),
+        (["sonnet"], 100 + 100 + 600),
+        (["opus"], (100 + 100 + 600) * 1.5),
+        (["adw_plan_implement_update_task"], 50 + 200 + 200 + 600),
+    ],
+)
+def test_budget_derives_from_command_timeouts(tags, expected):
+    assert SystemTag.get_workflow_budget(tags, TIMEOUTS.get) == int(expected)
+
+
+@pytest.mark.parametrize("tags", [[], ["adw_plan_implement_update_task"], ["opus"]])
+def test_agents_time_out_before_the_workflow_and_the_watchdog(tags):
+    commands = SystemTag.get_workflow_commands(tags)
+    timeouts = [get_command_timeout(c) for c in commands]
+    budget = SystemTag.get_workflow_budget(tags, get_command_timeout)
+    workflow_timeout = get_workflow_timeout(budget)
+
+    # A full pass plus one timed-out retry of the longest command fits the
+    # workflow's own deadline, which expires before the watchdog kill
+    assert sum(timeouts) + max(timeouts) <= workflow_timeout < budget
+
+
+def test_env_override_raises_the_budget(monkeypatch):
+    default = SystemTag.get_workflow_budget([], get_command_timeout)
+    monkeypatch.setenv("ADW_TIMEOUT_BUILD", "5400")
+
+    assert SystemTag.get_workflow_budget([], get_command_timeout) > default
+
+
+def test_small_budgets_keep_a_margin():
+    assert get_workflow_timeout(60) == 54
+    assert get_workflow_timeout(10_000) == 10_000 - 300
@@ -0,0 +1,171 @@
+"""Tests for the decisions of the worktree garbage collector."""
+
+import os
+import subprocess
+import threading
+
+import pytest
+
+from data_models import Task, Worktree, WorktreeGCPolicy
+from worktree import repo_lock
+from worktree_gc import collect_garbage, evaluate_worktree, get_uncommitted_changes
+
+
+def git(cwd, *args):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def write(path, content="x"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for name in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{name}_NAME", "test")
+        monkeypatch.setenv(f"GIT_{name}_EMAIL", "test@example.com")
+    root = tmp_path / "repo"
+    root.mkdir()
+    git(root, "init", "-q", "-b", "main")
+    write(str(root / "app" / "package.json"), "{}")
+    git(root, "add", ".")
+    git(root, "commit", "-q", "-m", "init")
+    monkeypatch.chdir(root)
+    return str(root)
+
+
+def add_worktree(repo, name, merged=True):
+    """A provisioned worktree whose branch has one commit."""
+    path = os.path.join(repo, "trees", name)
+    git(repo, "worktree", "add", "-q", "-b", name, path)
+    write(os.path.join(path, "app", f"{name}.txt"))
+    git(path, "add", ".")
+    git(path, "commit", "-q", "-m", name)
+    if merged:
+        git(repo, "merge", "-q", "--ff-only", name)
+
+    # What provisioning adds next to the checkout
+    write(os.path.join(path, ".env"), "KEY=1")
+    write(os.path.join(path, "app", ".env"), "KEY=1")
+    write(os.path.join(path, "app", "node_modules", "pkg", "index.js"))
+    write(os.path.join(path, "app", ".next", "cache", "webpack", "0.pack"))
+    write(os.path.join(path, "app", "tsconfig.tsbuildinfo"))
+    return path
+
+
+def finished(name, statuses=("[✅]", "[❌]")):
+    return Worktree(
+        name=name,
+        tasks=[Task(description=f"Task {i}", status=s) for i, s in enumerate(statuses)],
+    )
+
+
+POLICY = WorktreeGCPolicy(retention_hours=0)
+
+
+def test_provisioned_files_are_not_uncommitted_changes(repo):
+    path = add_worktree(repo, "wt")
+
+    assert get_uncommitted_changes(path) == []
+    assert evaluate_worktree(finished("wt"), path, repo, POLICY, set()).action == "remove"
+
+
+@pytest.mark.parametrize(
+    "change, expected",
+    [
+        (lambda path: write(os.path.join(path, "app", "wt.txt"), "edited"), "app/wt.txt"),
+        (lambda path: write(os.path.join(path, "app", "new.ts")), "app/new.ts"),
+    ],
+)
+def test_real_work_is_uncommitted_changes(repo, change, expected):
+    path = add_worktree(repo, "wt")
+    change(path)
+
+    decision = evaluate_worktree(finished("wt"), path, repo, POLICY, set())
+
+    assert get_uncommitted_changes(path) == [expected]
+    assert decision.action == "keep"
+    assert decision.reason == f"uncommitted changes ({expected})"
+
+
+def test_pending_tasks_are_kept(repo):
+    path = add_worktree(repo, "wt")
+
+    decision = evaluate_worktree(finished("wt", ("[✅]", "[⏰]")), path, repo, POLICY, set())
+
+    assert (decision.action, decision.reason) == ("keep", "1 task(s) not finished")
+
+
+def test_sections_without_tasks_are_kept(repo):
+    path = add_worktree(repo, "wt")
+
+    decision = evaluate_worktree(finished("wt", ()), path, repo, POLICY, set())
+
+    assert (decision.action, decision.reason) == ("keep", "no tasks yet")
+
+
+def test_running_workflows_are_kept(repo):
+    path = add_worktree(repo, "wt")
+
+    decision = evaluate_worktree(finished("wt"), path, repo, POLICY, {"wt"})
+
+    assert (decision.action, decision.reason) == ("keep", "workflow still running")
+
+
+def test_unmerged_unpushed_branches_are_kept(repo):
+    path = add_worktree(repo, "wt", merged=False)
+
+    decision = evaluate_worktree(finished("wt"), path, repo, POLICY, set())
+    assert (decision.action, decision.reason) == ("keep", "branch neither merged nor pushed")
+
+    lenient = WorktreeGCPolicy(retention_hours=0, require_merged_or_pushed=False)
+    assert evaluate_worktree(finished("wt"), path, repo, lenient, set()).action == "remove"
+
+
+def test_retention_period(repo):
+    path = add_worktree(repo, "wt")
+
+    decision = evaluate_worktree(
+        finished("wt"), path, repo, WorktreeGCPolicy(retention_hours=24), set()
+    )
+
+    assert decision.action == "keep"
+    assert decision.reason.startswith("idle 0.0h of 24h")
+
+
+def test_collect_garbage_removes_only_collectable_worktrees(repo):
+    done = add_worktree(repo, "done")
+    busy = add_worktree(repo, "busy")
+    worktrees = [finished("done"), finished("busy", ("[🟡]",)), finished("missing")]
+
+    preview = collect_garbage(worktrees, POLICY, repo_root=repo, dry_run=True)
+    assert [(d.worktree_name, d.action) for d in preview] == [("done", "remove"), ("busy", "keep")]
+    assert os.path.isdir(done)
+
+    decisions = collect_garbage(worktrees, POLICY, repo_root=repo)
+
+    assert [(d.worktree_name, d.action) for d in decisions] == [("done", "remove"), ("busy", "keep")]
+    assert not os.path.exists(done)
+    assert os.path.isdir(busy)
+    # The merged branch goes with its worktree
+    assert git(repo, "branch", "--list", "done") == ""
+
+
+def test_removal_waits_for_the_repo_lock(repo):
+    done = add_worktree(repo, "done")
+    collector = threading.Thread(
+        target=collect_garbage, args=([finished("done")], POLICY), kwargs={"repo_root": repo}
+    )
+
+    with repo_lock(repo):
+        collector.start()
+        collector.join(timeout=0.5)
+        assert collector.is_alive()
+        assert os.path.isdir(done)
+
+    collector.join(timeout=10)
+    assert not os.path.exists(done)